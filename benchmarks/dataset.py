@@ -0,0 +1,52 @@
+import os
+from datetime import date, datetime, timedelta
+
+import schema
+from log_generator import LogGenerator, default_range, write_db
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+SIZES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+
+# 생성 데이터가 끝나는 고정 기준일 (오늘 기준으로 만들면 캐시 파일이 오래될수록 최근 N일 조회량이 줄어듦)
+END_DAY = date(2025, 12, 31)
+# 최근 N일 조회의 기준 시각 (END_DAY가 끝나는 자정, "현재" 대신 사용)
+REFERENCE_NOW = datetime.combine(END_DAY + timedelta(days=1), datetime.min.time())
+
+def parse_sizes(text):
+    """'1k,100k' 형식의 크기 목록을 [(라벨, 행 수)]로 변환합니다."""
+    sizes = []
+    for label in text.split(","):
+        label = label.strip().lower()
+        if label:
+            if label not in SIZES:
+                raise ValueError(f"Unknown dataset size: {label} (choose from {', '.join(SIZES)})")
+            sizes.append((label, SIZES[label]))
+    return sizes
+
+def dataset_path(rows, seed=0):
+    """행 수/시드/기준일/스키마 버전별 캐시 DB 경로 (같은 조건이면 재사용)"""
+    return os.path.join(CACHE_DIR, f"synth_{rows}_s{seed}_{END_DAY:%Y%m%d}_v{schema.SCHEMA_VERSION}.db")
+
+def build_dataset(path, rows, seed=0):
+    """END_DAY로 끝나는 범위(하루 평균 약 6개, 최대 10년)에 rows개의 로그를 생성합니다."""
+    days = min(3650, max(30, rows // 6))
+    generator = LogGenerator(seed=seed)
+    start_day, end_day = default_range(days / 365, END_DAY)
+    generator.fit_rows(rows, (end_day - start_day).days + 1)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".part"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    write_db(tmp_path, generator.generate(start_day, end_day, limit=rows))
+    os.replace(tmp_path, path)
+    return path
+
+def get_dataset(rows, seed=0, log=print):
+    """캐시된 벤치마크 DB 경로를 반환합니다 (없으면 생성)."""
+    path = dataset_path(rows, seed)
+    if not os.path.exists(path):
+        log(f"  ... generating {rows:,} rows -> {path}")
+        build_dataset(path, rows, seed)
+    return path
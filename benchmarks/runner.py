@@ -0,0 +1,119 @@
+import json
+import os
+import platform
+import sys
+import time
+
+# 한 번의 반복(repeat)이 최소 이 시간 이상 걸리도록 호출 횟수(number)를 자동 조정
+MIN_REPEAT_SEC = 0.05
+MAX_NUMBER = 10000
+
+# 기준선 대비 이 비율 이상 느려지면 회귀로 판단 (0.2 = 20%)
+DEFAULT_THRESHOLD = 0.2
+
+_registry = []
+
+def benchmark(name, group, **params):
+    """벤치마크 함수를 등록하는 데코레이터.
+
+    함수는 ctx를 받아 측정할 함수(인자 없음)를 반환하거나, (측정 함수, 항목 수)를 반환합니다.
+    항목 수를 주면 결과에 초당 처리량(items_per_sec)이 함께 기록됩니다.
+    """
+    def decorator(func):
+        _registry.append({"name": name, "group": group, "params": params, "factory": func})
+        return func
+    return decorator
+
+def registered():
+    return list(_registry)
+
+def measure(func, repeat=5, number=None):
+    """func를 repeat회 반복 측정하여 1회 호출당 시간(ms) 통계를 반환합니다."""
+    if number is None:
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        number = max(1, min(MAX_NUMBER, int(MIN_REPEAT_SEC / elapsed) if elapsed > 0 else MAX_NUMBER))
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number * 1000)
+
+    samples.sort()
+    mid = len(samples) // 2
+    median = samples[mid] if len(samples) % 2 else (samples[mid - 1] + samples[mid]) / 2
+    return {
+        "repeat": repeat,
+        "number": number,
+        "min_ms": samples[0],
+        "median_ms": median,
+        "mean_ms": sum(samples) / len(samples),
+        "max_ms": samples[-1],
+    }
+
+def run(ctx, name_filter=None, repeat=5, log=print):
+    """등록된 벤치마크를 실행하고 이름 -> 결과 딕셔너리를 반환합니다."""
+    results = {}
+    for bench in _registry:
+        name = bench["name"].format(**bench["params"])
+        if name_filter and not any(f in name for f in name_filter):
+            continue
+        prepared = bench["factory"](ctx, **bench["params"])
+        if prepared is None: # 현재 설정에서 건너뜀 (예: 선택하지 않은 DB 크기)
+            continue
+        func, items = prepared if isinstance(prepared, tuple) else (prepared, None)
+
+        result = measure(func, repeat=repeat)
+        result["group"] = bench["group"]
+        if items:
+            result["items"] = items
+            result["items_per_sec"] = items / (result["median_ms"] / 1000) if result["median_ms"] > 0 else 0.0
+        results[name] = result
+        log(f"  {name:<40} {result['median_ms']:>10.3f} ms  (min {result['min_ms']:.3f}, x{result['number']})")
+    return results
+
+def make_report(results, options):
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "options": options,
+        },
+        "results": results,
+    }
+
+def save_report(report, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=4, ensure_ascii=False)
+
+def load_report(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def compare(results, baseline_results, threshold=DEFAULT_THRESHOLD):
+    """기준선과 중앙값(median_ms)을 비교하여 항목별 비교 결과 목록을 반환합니다.
+
+    status: "regression"(threshold 이상 느려짐), "improved"(threshold 이상 빨라짐), "ok", "new"(기준선에 없음)
+    """
+    rows = []
+    for name, result in results.items():
+        base = baseline_results.get(name)
+        if base is None or base.get("median_ms", 0) <= 0:
+            rows.append({"name": name, "status": "new", "median_ms": result["median_ms"]})
+            continue
+        ratio = result["median_ms"] / base["median_ms"]
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append({"name": name, "status": status, "median_ms": result["median_ms"],
+                     "baseline_ms": base["median_ms"], "ratio": ratio})
+    return rows
@@ -0,0 +1,146 @@
+import os
+import tempfile
+
+from benchmarks.runner import benchmark
+from benchmarks.dataset import get_dataset, REFERENCE_NOW
+
+import utils
+from exporter import LogExporter
+from font_cache import load_font
+from timer_engine import TimerEngine
+from timer_renderer import TimerRenderer
+from simulation import VirtualClock
+
+COLORS = {
+    "bg": "#FFFFFF",
+    "fg": "#555555",
+    "timer_bg": "#FFFFFF",
+    "timer_center": "#F5F5F5",
+    "timer_outline": "#000000",
+}
+
+RENDER_SIZES = ((300, 400), (600, 800), (1280, 1600))
+RENDER_SCALES = (1.0, 2.0)
+
+# --- 렌더링 (draw_timer가 사용하는 PIL 경로, 디스플레이 불필요) ---
+
+def _render_args(w, h, scale, current_time=1500):
+    return dict(w=w, h=h, colors=COLORS, ui_scale=scale, is_mini_mode=False, current_time=current_time,
+                mode="work", cycle_len=4, today_count=2, level=5, streak=3, level_progress=0.4, longest_streak=7)
+
+def _register_render():
+    for w, h in RENDER_SIZES:
+        for scale in RENDER_SCALES:
+            @benchmark("render.tick.{w}x{h}@{scale}", "render", w=w, h=h, scale=scale)
+            def render_tick(ctx, w, h, scale):
+                # 정적 레이어가 캐시된 상태에서 매 프레임 그리는 비용
+                renderer = TimerRenderer(load_font)
+                renderer.render(**_render_args(w, h, scale))
+                state = {"t": 1500.0}
+                def run():
+                    state["t"] = state["t"] - 0.25 if state["t"] > 1 else 1500.0
+                    renderer.render(**_render_args(w, h, scale, state["t"]))
+                return run
+
+            @benchmark("render.cold.{w}x{h}@{scale}", "render", w=w, h=h, scale=scale)
+            def render_cold(ctx, w, h, scale):
+                # 크기/테마 변경 직후처럼 정적 레이어까지 새로 그리는 비용
+                renderer = TimerRenderer(load_font)
+                def run():
+                    renderer.invalidate()
+                    renderer.render(**_render_args(w, h, scale))
+                return run
+
+_register_render()
+
+# --- 타이머 엔진 ---
+
+@benchmark("engine.tick", "engine")
+def engine_tick(ctx):
+    ticks = 100_000
+    def run():
+        clock = VirtualClock()
+        engine = TimerEngine(clock=clock)
+        engine.start()
+        for _ in range(ticks):
+            clock.advance(0.01)
+            engine.tick()
+    return run, ticks
+
+@benchmark("engine.remaining", "engine")
+def engine_remaining(ctx):
+    calls = 100_000
+    def run():
+        engine = TimerEngine(clock=VirtualClock())
+        engine.start()
+        for _ in range(calls):
+            engine.current_time
+    return run, calls
+
+# --- 로그 저장소 (utils 조회 함수, 생성된 DB 기준) ---
+
+def _log_store_benchmark(name, call):
+    def register(label):
+        @benchmark(name + ".{label}", "logstore", label=label)
+        def bench(ctx, label):
+            rows = ctx["sizes"].get(label)
+            if rows is None:
+                return None
+            utils.use_database(get_dataset(rows, ctx["seed"], ctx["log"]))
+            call() # 연결/마이그레이션 확인 및 캐시 준비
+            return call
+    return register
+
+_LOG_STORE = (
+    # 최근 N일 조회는 데이터셋의 고정 기준 시각으로 실행 (실행 날짜와 무관하게 같은 양을 측정)
+    ("logstore.parse_logs_30d", lambda: utils.parse_logs(30, now=REFERENCE_NOW)),
+    ("logstore.task_stats_30d", lambda: utils.get_task_stats(30, now=REFERENCE_NOW)),
+    ("logstore.task_stats_all", lambda: utils.get_task_stats(None)),
+    ("logstore.recent_logs_30d", lambda: utils.get_recent_logs(30, now=REFERENCE_NOW)),
+    ("logstore.logs_page", lambda: utils.get_logs_page("9999")),
+    ("logstore.gamification", lambda: utils.get_gamification_stats()),
+    ("logstore.hourly_all", lambda: utils.get_hourly_stats()),
+    ("logstore.weekday_hour_all", lambda: utils.get_weekday_hour_stats()),
+    ("logstore.task_hour_all", lambda: utils.get_task_hour_stats()),
+)
+
+def _uncached(call):
+    """조회 결과 캐시를 비운 뒤 호출 (캐시 적중 없이 실제 쿼리 비용 측정)"""
+    def run():
+        utils.clear_query_cache()
+        return call()
+    return run
+
+# 조회 캐시를 쓰는 함수는 캐시 적중(위)과 실제 쿼리(_uncached) 비용을 모두 측정
+_LOG_STORE_UNCACHED = tuple((name + "_uncached", _uncached(call)) for name, call in _LOG_STORE
+                            if name in ("logstore.parse_logs_30d", "logstore.task_stats_30d", "logstore.task_stats_all",
+                                        "logstore.recent_logs_30d", "logstore.gamification"))
+
+for _label in ("1k", "100k", "1m"):
+    for _name, _call in _LOG_STORE + _LOG_STORE_UNCACHED:
+        _log_store_benchmark(_name, _call)(_label)
+
+# --- 내보내기 ---
+
+def _register_export(label):
+    @benchmark("export.csv.{label}", "export", label=label)
+    def export_csv(ctx, label):
+        rows = ctx["sizes"].get(label)
+        if rows is None:
+            return None
+        db_path = get_dataset(rows, ctx["seed"], ctx["log"])
+        out_path = os.path.join(ctx["tmp_dir"], f"export_{label}.csv")
+        def run():
+            LogExporter(db_path, out_path, "csv").run()
+        return run, rows
+
+for _label in ("1k", "100k", "1m"):
+    _register_export(_label)
+
+def make_context(sizes, seed=0, log=print):
+    return {
+        "sizes": dict(sizes),
+        "seed": seed,
+        "log": log,
+        "tmp_dir": tempfile.mkdtemp(prefix="godmode_bench_"),
+    }
@@ -0,0 +1,57 @@
+import argparse
+import os
+import shutil
+import sys
+
+if __name__ == "__main__":
+    # 프로젝트 루트에서 실행 시 src 모듈을 찾을 수 있도록 경로 추가
+    root_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.append(os.path.join(root_dir, 'src'))
+
+    from benchmarks import runner, suites
+    from benchmarks.dataset import parse_sizes
+    import utils
+
+    parser = argparse.ArgumentParser(description="God-Mode Timer 벤치마크 (렌더링, 엔진, 로그 저장소, 내보내기)")
+    parser.add_argument("--sizes", default="1k,100k", help="로그 DB 크기 목록 (1k, 100k, 1m)")
+    parser.add_argument("--filter", action="append", help="이름에 이 문자열이 포함된 항목만 실행 (여러 번 지정 가능)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=os.path.join(root_dir, "benchmarks", "results", "latest.json"))
+    parser.add_argument("--baseline", default=os.path.join(root_dir, "benchmarks", "baseline.json"))
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준선으로 저장")
+    parser.add_argument("--threshold", type=float, default=runner.DEFAULT_THRESHOLD, help="회귀 판단 비율 (기본 0.2 = 20%%)")
+    parser.add_argument("--check", action="store_true", help="회귀가 있으면 실패 코드로 종료")
+    args = parser.parse_args()
+
+    sizes = parse_sizes(args.sizes)
+    ctx = suites.make_context(sizes, seed=args.seed)
+    print(f"🚀 Running benchmarks (sizes: {', '.join(label for label, _ in sizes)})")
+    try:
+        results = runner.run(ctx, name_filter=args.filter, repeat=args.repeat)
+    finally:
+        utils.use_database(None)
+        shutil.rmtree(ctx["tmp_dir"], ignore_errors=True)
+
+    report = runner.make_report(results, {"sizes": args.sizes, "repeat": args.repeat, "seed": args.seed})
+    runner.save_report(report, args.output)
+    print(f"💾 {args.output}")
+
+    if args.save_baseline:
+        runner.save_report(report, args.baseline)
+        print(f"📌 baseline saved: {args.baseline}")
+        sys.exit(0)
+
+    if not os.path.exists(args.baseline):
+        print("ℹ️ No baseline to compare (use --save-baseline)")
+        sys.exit(0)
+
+    rows = runner.compare(results, runner.load_report(args.baseline)["results"], args.threshold)
+    regressions = [row for row in rows if row["status"] == "regression"]
+    for row in rows:
+        if row["status"] == "new":
+            print(f"  {row['name']:<40} {row['median_ms']:>10.3f} ms  (new)")
+        else:
+            print(f"  {row['name']:<40} {row['median_ms']:>10.3f} ms  x{row['ratio']:.2f}  {row['status']}")
+    print(f"{'❌' if regressions else '✅'} {len(regressions)} regression(s) (threshold {args.threshold:.0%})")
+    sys.exit(1 if regressions and args.check else 0)
@@ -0,0 +1,19 @@
+import os
+import sys
+
+# 경로 설정 (scripts 폴더 상위 -> src)
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(script_dir), "src"))
+
+from utils import rebuild_daily_stats, close_db
+
+def main():
+    """로그 DB의 날짜별 집계(daily_stats) 테이블을 전체 로그로부터 다시 만듭니다."""
+    try:
+        days = rebuild_daily_stats()
+        print(f"✅ daily_stats 재생성 완료 ({days}일)")
+    finally:
+        close_db()
+
+if __name__ == "__main__":
+    main()
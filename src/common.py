@@ -1,6 +1,9 @@
 import sys
 import os
 import shutil
+import threading
+
+APP_NAME = "GodModeTimer"
 
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
@@ -12,59 +15,100 @@ def resource_path(relative_path):
 
     return os.path.join(base_path, relative_path)
 
-def get_user_data_path(filename):
-    """사용자 데이터 파일 경로를 반환합니다. (Documents 폴더 우선 사용)"""
-    app_name = "GodModeTimer"
-    
-    # 1. 영구 보존 가능한 경로 설정 (Documents)
-    # MSIX 앱 삭제 시에도 Documents 폴더의 데이터는 유지됩니다.
+def default_data_dir():
+    """사용자 데이터 폴더 (Documents 우선). MSIX 앱 삭제 시에도 Documents 폴더의 데이터는 유지됩니다."""
     if sys.platform == "win32":
         base_path = os.path.join(os.path.expanduser("~"), "Documents")
     else:
         base_path = os.path.expanduser("~/.local/share")
-    
-    data_dir = os.path.join(base_path, app_name)
-    
-    # 폴더가 없으면 생성
-    if not os.path.exists(data_dir):
-        try:
-            os.makedirs(data_dir)
-        except OSError:
-            pass
-    
-    target_path = os.path.join(data_dir, filename)
-    
-    # 2. 이미 새 위치(Documents)에 파일이 있으면 바로 반환
-    if os.path.exists(target_path):
-        return target_path
-        
-    # 3. 마이그레이션: 기존 데이터가 있는지 확인 (Windows MSIX/AppData)
-    if sys.platform == "win32":
-        old_path = None
-        
-        # 3-1. MSIX 컨테이너 스토리지 확인
-        try:
-            from winrt.windows.storage import ApplicationData
-            local_folder = ApplicationData.current.local_folder.path
-            msix_file = os.path.join(local_folder, filename)
-            if os.path.exists(msix_file):
-                old_path = msix_file
-        except Exception:
-            pass
-            
-        # 3-2. 일반 LocalAppData 확인 (fallback)
-        if not old_path:
-            local_app_data = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
-            legacy_file = os.path.join(local_app_data, app_name, filename)
-            if os.path.exists(legacy_file):
-                old_path = legacy_file
-                
-        # 3-3. 데이터 발견 시 새 위치로 복사
-        if old_path and os.path.exists(old_path):
+    return os.path.join(base_path, APP_NAME)
+
+def find_legacy_dirs():
+    """예전 버전이 데이터를 저장하던 폴더 중 존재하는 것을 우선순위 순으로 반환합니다 (Windows MSIX/AppData)."""
+    if sys.platform != "win32":
+        return []
+    dirs = []
+    # 1. MSIX 컨테이너 스토리지
+    try:
+        from winrt.windows.storage import ApplicationData
+        dirs.append(ApplicationData.current.local_folder.path)
+    except Exception:
+        pass
+    # 2. 일반 LocalAppData (fallback)
+    local_app_data = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+    dirs.append(os.path.join(local_app_data, APP_NAME))
+    return [d for d in dirs if os.path.isdir(d)]
+
+class UserDataPaths:
+    """사용자 데이터 파일 경로를 한 번만 확인하고 기억하는 레지스트리
+
+    데이터 폴더 생성과 예전 위치(MSIX/AppData) 탐색은 프로세스당 한 번만 수행하고,
+    파일별 경로(필요 시 예전 위치에서 복사)도 처음 요청할 때 한 번만 확인합니다.
+    로밍 프로필처럼 파일 시스템 확인이 느린 환경에서 반복 호출 비용을 없앱니다.
+    """
+
+    def __init__(self, data_dir=None, legacy_dirs=None):
+        self._data_dir_override = data_dir
+        self._legacy_dirs_override = legacy_dirs
+        self.lock = threading.Lock()
+        self.data_dir = None
+        self.legacy_dirs = None
+        self.paths = {} # 파일명 -> 확인된 전체 경로
+
+    def _scan(self):
+        self.data_dir = self._data_dir_override or default_data_dir()
+        # 폴더가 없으면 생성
+        if not os.path.exists(self.data_dir):
             try:
-                shutil.copy2(old_path, target_path)
-                print(f"📦 데이터 마이그레이션 완료: {old_path} -> {target_path}")
-            except Exception as e:
-                print(f"⚠️ 데이터 마이그레이션 실패: {e}")
+                os.makedirs(self.data_dir)
+            except OSError:
+                pass
+        if self._legacy_dirs_override is not None:
+            self.legacy_dirs = list(self._legacy_dirs_override)
+        else:
+            self.legacy_dirs = find_legacy_dirs()
+
+    def resolve(self, filename):
+        """파일명에 대한 사용자 데이터 경로를 반환합니다 (처음 요청 시에만 파일 시스템 확인)."""
+        path = self.paths.get(filename)
+        if path is not None:
+            return path
+        with self.lock:
+            path = self.paths.get(filename)
+            if path is None:
+                if self.data_dir is None:
+                    self._scan()
+                path = os.path.join(self.data_dir, filename)
+                if self.legacy_dirs and not os.path.exists(path):
+                    self._migrate(filename, path)
+                self.paths[filename] = path
+            return path
+
+    def _migrate(self, filename, target_path):
+        """예전 위치에 같은 파일이 있으면 새 위치로 복사합니다."""
+        for legacy_dir in self.legacy_dirs:
+            old_path = os.path.join(legacy_dir, filename)
+            if os.path.exists(old_path):
+                try:
+                    shutil.copy2(old_path, target_path)
+                    print(f"📦 데이터 마이그레이션 완료: {old_path} -> {target_path}")
+                except Exception as e:
+                    print(f"⚠️ 데이터 마이그레이션 실패: {e}")
+                return
+
+    def rescan(self):
+        """기억한 경로를 모두 버리고, 다음 요청 시 데이터 폴더와 예전 위치를 다시 확인합니다."""
+        with self.lock:
+            self.data_dir = None
+            self.legacy_dirs = None
+            self.paths.clear()
+
+_user_data_paths = UserDataPaths()
+
+def get_user_data_path(filename):
+    """사용자 데이터 파일 경로를 반환합니다. (Documents 폴더 우선 사용, 프로세스당 한 번만 확인)"""
+    return _user_data_paths.resolve(filename)
 
-    return target_path
+def rescan_user_data_paths():
+    """데이터 폴더가 바뀌었거나(동기화 폴더 이동 등) 예전 데이터를 다시 찾아야 할 때 호출합니다."""
+    _user_data_paths.rescan()
@@ -0,0 +1,79 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+class Database:
+    """SQLite 로그 DB에 대한 장기 연결을 관리합니다 (WAL, 튜닝된 PRAGMA, 구문 캐시)."""
+
+    PRAGMAS = (
+        "PRAGMA synchronous=NORMAL",   # WAL 모드에서는 NORMAL로도 충돌 시 DB가 손상되지 않음
+        "PRAGMA cache_size=-8192",     # 페이지 캐시 약 8MB
+        "PRAGMA mmap_size=67108864",   # 64MB 메모리 매핑 읽기
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA busy_timeout=3000",    # 다른 프로세스가 잠근 경우 최대 3초 대기
+    )
+
+    def __init__(self, path, on_first_connect=None):
+        self.path = path
+        self.on_first_connect = on_first_connect # 최초 연결 시 스키마 생성/마이그레이션 콜백
+        self.lock = threading.RLock()
+        self.conn = None
+        self.journal_mode = None
+
+    def get_connection(self):
+        """공유 연결을 반환합니다 (필요 시 생성). 호출자는 연결을 닫지 않아야 합니다."""
+        with self.lock:
+            if self.conn is None:
+                # 같은 SQL 문자열은 컴파일된 구문을 재사용 (cached_statements)
+                conn = sqlite3.connect(self.path, check_same_thread=False, cached_statements=256)
+                conn.row_factory = sqlite3.Row
+                
+                # WAL 저널링 (네트워크 드라이브 등 WAL을 지원하지 않는 환경에서는 기존 모드 유지)
+                try:
+                    self.journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+                except sqlite3.Error:
+                    self.journal_mode = None
+                for pragma in self.PRAGMAS:
+                    try:
+                        conn.execute(pragma)
+                    except sqlite3.Error:
+                        pass
+                
+                # 마이그레이션이 끝까지 성공한 연결만 공유 (실패 시 닫고 다음 호출에서 다시 시도)
+                if self.on_first_connect:
+                    try:
+                        self.on_first_connect(conn)
+                        conn.commit()
+                    except Exception:
+                        try:
+                            conn.rollback()
+                        finally:
+                            conn.close()
+                        raise
+                self.conn = conn
+            return self.conn
+
+    @contextmanager
+    def session(self):
+        """잠금을 잡은 상태로 공유 연결을 제공하고, 블록 종료 시 커밋(예외 시 롤백)합니다."""
+        with self.lock:
+            conn = self.get_connection()
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def close(self):
+        """연결을 정리하고 닫습니다 (앱 종료 시 호출)."""
+        with self.lock:
+            if self.conn is None:
+                return
+            try:
+                self.conn.execute("PRAGMA optimize")
+                self.conn.commit()
+            except sqlite3.Error:
+                pass
+            self.conn.close()
+            self.conn = None
@@ -0,0 +1,102 @@
+import queue
+import threading
+import traceback
+
+class DBWorker:
+    """DB 작업을 전용 백그라운드 스레드 하나에서 순서대로 실행합니다.
+
+    요청은 큐에 쌓여 제출 순서대로 처리되므로 (쓰기 후 읽기 순서 보장),
+    결과 콜백은 root.after 폴링을 통해 Tk 메인 스레드에서 호출됩니다.
+    """
+
+    POLL_MS = 30  # 결과 확인 주기 (처리 대기 중인 요청이 있을 때만 폴링)
+
+    def __init__(self, root):
+        self.root = root
+        self.requests = queue.Queue()
+        self.results = queue.Queue()
+        self.pending = 0     # 콜백까지 완료되지 않은 요청 수 (메인 스레드에서만 변경)
+        self.poll_job = None
+        self.thread = threading.Thread(target=self._run, name="DBWorker", daemon=True)
+        self.thread.start()
+
+    def submit(self, func, *args, callback=None, error_callback=None, **kwargs):
+        """func(*args, **kwargs)를 워커 스레드에서 실행하도록 예약합니다.
+
+        완료 시 callback(result), 예외 발생 시 error_callback(exc)가 메인 스레드에서 호출됩니다.
+        """
+        self.pending += 1
+        self.requests.put((func, args, kwargs, callback, error_callback))
+        self._schedule_poll()
+
+    def _run(self):
+        while True:
+            request = self.requests.get()
+            if request is None:
+                break
+            if callable(request):
+                # 종료 요청: 큐의 모든 작업이 끝난 뒤 워커 스레드에서 마지막으로 실행 (DB 닫기 등)
+                try:
+                    request()
+                except Exception:
+                    traceback.print_exc()
+                break
+            func, args, kwargs, callback, error_callback = request
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                traceback.print_exc()
+                self.results.put((error_callback, e))
+            else:
+                self.results.put((callback, result))
+
+    def _schedule_poll(self):
+        if self.poll_job is None:
+            try:
+                self.poll_job = self.root.after(self.POLL_MS, self._poll)
+            except Exception:
+                self.poll_job = None
+
+    def _poll(self):
+        self.poll_job = None
+        self.process_results()
+        if self.pending > 0:
+            self._schedule_poll()
+
+    def process_results(self):
+        """완료된 요청의 콜백을 실행합니다 (메인 스레드에서 호출)."""
+        while True:
+            try:
+                callback, value = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.pending -= 1
+            if callback:
+                try:
+                    callback(value)
+                except Exception:
+                    traceback.print_exc()
+
+    def stop(self, timeout=3.0, on_exit=None):
+        """남은 요청을 모두 처리한 뒤 워커 스레드를 종료합니다 (앱 종료 시 호출).
+
+        on_exit(예: DB 닫기)는 큐가 모두 처리된 뒤 워커 스레드에서 마지막으로 실행되므로,
+        timeout 안에 끝나지 않아도 진행 중인 쓰기보다 먼저 실행되지 않습니다.
+        워커가 timeout 안에 종료되면 True를 반환합니다.
+        """
+        if self.poll_job is not None:
+            try:
+                self.root.after_cancel(self.poll_job)
+            except Exception:
+                pass
+            self.poll_job = None
+        if not self.thread.is_alive():
+            if on_exit:
+                on_exit()
+            return True
+        self.requests.put(on_exit or None)
+        self.thread.join(timeout)
+        if self.thread.is_alive():
+            print(f"⚠️ DB 작업이 {timeout}초 안에 끝나지 않아 백그라운드에서 마저 처리합니다.")
+            return False
+        return True
@@ -0,0 +1,154 @@
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+import threading
+from datetime import datetime
+from utils import get_db
+from exporter import LogExporter, ExportCancelled, EXPORT_FORMATS
+
+def open_export_window(app, parent):
+    """로그 내보내기 창을 엽니다 (형식/기간/작업 필터 선택, 백그라운드 스트리밍 내보내기)."""
+    sf = app.scale_factor
+    bg_color = app.colors["bg"]
+    fg_color = app.colors["fg"]
+    lbl_font = ("Helvetica", int(9 * sf))
+
+    ew = tk.Toplevel(parent)
+    ew.title(app.loc.get("export_window_title", default="Export Logs"))
+    ew.resizable(False, False)
+    ew.configure(bg=bg_color)
+    ew.transient(parent)
+    ew.grab_set()
+
+    main_frame = tk.Frame(ew, bg=bg_color)
+    main_frame.pack(fill=tk.BOTH, expand=True, padx=int(20 * sf), pady=int(15 * sf))
+
+    # 1. 형식 선택
+    fmt_var = tk.StringVar(value="csv")
+    fmt_labels = {
+        "csv": "CSV",
+        "jsonl": "JSON Lines",
+        "columnar": app.loc.get("export_format_columnar", default="Columnar JSON"),
+    }
+    tk.Label(main_frame, text=app.loc.get("export_format", default="Format"), font=lbl_font, bg=bg_color, fg=fg_color).grid(row=0, column=0, sticky="w", pady=int(4 * sf))
+    fmt_frame = tk.Frame(main_frame, bg=bg_color)
+    fmt_frame.grid(row=0, column=1, sticky="w")
+    for code in EXPORT_FORMATS:
+        tk.Radiobutton(fmt_frame, text=fmt_labels[code], variable=fmt_var, value=code, font=lbl_font,
+                       bg=bg_color, fg=fg_color, selectcolor=app.colors["btn_bg"], activebackground=bg_color).pack(side=tk.LEFT)
+
+    # 2. 기간 및 작업 필터 (비워두면 전체)
+    start_var = tk.StringVar()
+    end_var = tk.StringVar()
+    task_var = tk.StringVar()
+    fields = [
+        (app.loc.get("export_start_date", default="From (YYYY-MM-DD)"), start_var),
+        (app.loc.get("export_end_date", default="To (YYYY-MM-DD)"), end_var),
+        (app.loc.get("export_task_filter", default="Task (optional)"), task_var),
+    ]
+    for i, (label, var) in enumerate(fields, start=1):
+        tk.Label(main_frame, text=label, font=lbl_font, bg=bg_color, fg=fg_color).grid(row=i, column=0, sticky="w", pady=int(4 * sf))
+        tk.Entry(main_frame, textvariable=var, font=lbl_font, bg=app.colors["btn_bg"], fg=fg_color, width=20).grid(row=i, column=1, sticky="we", padx=(int(10 * sf), 0))
+
+    # 3. 진행률
+    progress_bar = ttk.Progressbar(main_frame, mode="determinate", maximum=1)
+    progress_bar.grid(row=4, column=0, columnspan=2, sticky="we", pady=(int(12 * sf), int(4 * sf)))
+    progress_label = tk.Label(main_frame, text="", font=("Helvetica", int(8 * sf)), bg=bg_color, fg=app.colors["fg_sub"])
+    progress_label.grid(row=5, column=0, columnspan=2, sticky="w")
+
+    btn_frame = tk.Frame(ew, bg=bg_color)
+    btn_frame.pack(fill=tk.X, padx=int(20 * sf), pady=(0, int(15 * sf)))
+
+    state = {"exporter": None, "progress": (0, 0), "result": None}
+
+    def parse_day(text):
+        text = text.strip()
+        if not text:
+            return None
+        datetime.strptime(text, "%Y-%m-%d") # 형식 검증 (ValueError)
+        return text
+
+    def run_export(exporter):
+        # 워커 스레드: 결과는 state에 저장하고 메인 스레드의 poll_progress가 처리
+        def on_progress(done, total):
+            state["progress"] = (done, total)
+        try:
+            state["result"] = ("done", exporter.run(on_progress))
+        except ExportCancelled:
+            state["result"] = ("cancelled", None)
+        except Exception as e:
+            state["result"] = ("error", e)
+
+    def poll_progress():
+        if not ew.winfo_exists():
+            return
+        done, total = state["progress"]
+        progress_bar.configure(maximum=max(total, 1), value=done)
+        progress_label.config(text=f"{done:,} / {total:,}" if total else "")
+
+        if state["result"] is None:
+            ew.after(100, poll_progress)
+            return
+
+        kind, value = state["result"]
+        state["exporter"] = None
+        state["result"] = None
+        btn_export.config(state=tk.NORMAL)
+        if kind == "done":
+            if value == 0:
+                messagebox.showinfo(app.loc.get("notice"), app.loc.get("no_log_msg"), parent=ew)
+            else:
+                messagebox.showinfo(app.loc.get("done"), app.loc.get("export_success_msg"), parent=ew)
+                ew.destroy()
+        elif kind == "error":
+            messagebox.showerror(app.loc.get("error"), app.loc.get("export_fail_fmt", error=value), parent=ew)
+
+    def start_export():
+        try:
+            start_day = parse_day(start_var.get())
+            end_day = parse_day(end_var.get())
+        except ValueError:
+            messagebox.showwarning(app.loc.get("notice"), app.loc.get("export_date_invalid_msg", default="Please enter dates as YYYY-MM-DD."), parent=ew)
+            return
+
+        fmt = fmt_var.get()
+        ext, desc = EXPORT_FORMATS[fmt]
+        file_path = filedialog.asksaveasfilename(
+            parent=ew,
+            defaultextension=ext,
+            filetypes=[(desc, "*" + ext), ("All files", "*.*")],
+            title=app.loc.get("export_window_title", default="Export Logs"),
+            initialfile=f"godmode_logs_{datetime.now().strftime('%Y%m%d')}{ext}"
+        )
+        if not file_path:
+            return
+
+        # 앱이 기록 중인 DB 파일(use_database로 전환된 경우 포함)에서 읽음
+        exporter = LogExporter(get_db().path, file_path, fmt,
+                               start_day=start_day, end_day=end_day, task=task_var.get().strip() or None)
+        state["exporter"] = exporter
+        state["progress"] = (0, 0)
+        btn_export.config(state=tk.DISABLED)
+        threading.Thread(target=run_export, args=(exporter,), daemon=True).start()
+        poll_progress()
+
+    def on_cancel():
+        # 진행 중이면 내보내기 취소 (임시 파일은 삭제됨), 아니면 창 닫기
+        if state["exporter"] is not None:
+            state["exporter"].cancel()
+        ew.destroy()
+
+    btn_export = tk.Button(btn_frame, text=app.loc.get("export_btn", default="Export"), font=("Helvetica", int(9 * sf), "bold"),
+                           bg=app.colors["start_btn_bg"], fg=app.colors["btn_fg"], bd=0, padx=15, pady=5, command=start_export)
+    btn_export.pack(side=tk.RIGHT, padx=(int(5 * sf), 0))
+    tk.Button(btn_frame, text=app.loc.get("cancel"), font=("Helvetica", int(9 * sf)), bg=app.colors["btn_bg"], fg=fg_color,
+              bd=0, padx=15, pady=5, command=on_cancel).pack(side=tk.RIGHT)
+
+    ew.protocol("WM_DELETE_WINDOW", on_cancel)
+    ew.bind("<Escape>", lambda e: on_cancel())
+
+    # 부모 창 중앙 배치
+    ew.update_idletasks()
+    x = parent.winfo_x() + (parent.winfo_width() // 2) - (ew.winfo_width() // 2)
+    y = parent.winfo_y() + (parent.winfo_height() // 2) - (ew.winfo_height() // 2)
+    ew.geometry(f"+{x}+{y}")
+    return ew
@@ -0,0 +1,203 @@
+import csv
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+EXPORT_COLUMNS = ("timestamp", "duration", "task", "status")
+
+# 형식 코드 -> (기본 확장자, 파일 대화상자 설명)
+EXPORT_FORMATS = {
+    "csv": (".csv", "CSV files"),
+    "jsonl": (".jsonl", "JSON Lines files"),
+    "columnar": (".json", "Columnar JSON files"),
+}
+
+class ExportCancelled(Exception):
+    """사용자가 내보내기를 취소했을 때 발생합니다."""
+
+def build_export_query(start_day=None, end_day=None, task=None):
+    """필터 조건을 SQL WHERE 절로 변환하여 (조회 SQL, 개수 SQL, 파라미터)를 반환합니다.
+
+    start_day/end_day는 YYYY-MM-DD (양 끝 포함), task는 작업명 완전 일치입니다.
+    작업명은 tasks 테이블에서 조인하며, 작업 없음(빈 이름)은 NULL로 내보냅니다.
+    """
+    conditions = []
+    params = []
+    if start_day:
+        conditions.append("l.timestamp >= ?")
+        params.append(start_day)
+    if end_day:
+        conditions.append("l.timestamp < ?")
+        params.append(end_day + "~") # '~'는 시각 문자열보다 큰 문자 -> 해당 날짜 끝까지 포함
+    if task:
+        conditions.append("l.task_id = (SELECT id FROM tasks WHERE name = ?)")
+        params.append(task)
+
+    where = (" WHERE " + " AND ".join(conditions)) if conditions else ""
+    select_sql = ("SELECT l.timestamp, l.duration, NULLIF(t.name, '') AS task, l.status "
+                  f"FROM logs l LEFT JOIN tasks t ON t.id = l.task_id{where} ORDER BY l.timestamp DESC")
+    count_sql = f"SELECT COUNT(*) FROM logs l{where}"
+    return select_sql, count_sql, tuple(params)
+
+class CsvExportWriter:
+    """기존 CSV 내보내기와 동일한 형식 (엑셀 호환 UTF-8 BOM)"""
+    encoding = "utf-8-sig"
+
+    def __init__(self, f):
+        self.writer = csv.writer(f)
+
+    def begin(self):
+        self.writer.writerow(["Timestamp", "Duration (min)", "Task", "Status"])
+
+    def write_chunk(self, rows):
+        self.writer.writerows((ts, dur, task or "", status) for ts, dur, task, status in rows)
+
+    def end(self):
+        pass
+
+class JsonLinesExportWriter:
+    """한 줄에 로그 하나씩 JSON 객체로 기록"""
+    encoding = "utf-8"
+
+    def __init__(self, f):
+        self.f = f
+
+    def begin(self):
+        pass
+
+    def write_chunk(self, rows):
+        self.f.writelines(json.dumps(dict(zip(EXPORT_COLUMNS, row)), ensure_ascii=False) + "\n" for row in rows)
+
+    def end(self):
+        pass
+
+class ColumnarExportWriter:
+    """청크 단위 로우 그룹으로 열(column) 배열을 기록하는 압축 JSON 형식
+
+    {"format": "godmode-columnar", "version": 1, "columns": [...],
+     "row_groups": [{"rows": n, "timestamp": [...], "duration": [...],
+                     "task": {"dict": [...], "codes": [...]}, "status": {"dict": [...], "codes": [...]}}, ...]}
+    반복이 많은 task/status 열은 로우 그룹별 사전(dictionary) 인코딩으로 저장합니다.
+    """
+    encoding = "utf-8"
+    DICT_COLUMNS = ("task", "status")
+
+    def __init__(self, f):
+        self.f = f
+        self.first_group = True
+
+    def begin(self):
+        header = json.dumps({"format": "godmode-columnar", "version": 1, "columns": list(EXPORT_COLUMNS)}, ensure_ascii=False)
+        # 헤더 객체의 닫는 괄호 앞에 row_groups 배열을 이어서 스트리밍
+        self.f.write(header[:-1] + ', "row_groups": [')
+
+    def write_chunk(self, rows):
+        columns = list(zip(*rows))
+        group = {"rows": len(rows)}
+        for name, values in zip(EXPORT_COLUMNS, columns):
+            if name in self.DICT_COLUMNS:
+                codes_by_value = {}
+                codes = [codes_by_value.setdefault(v, len(codes_by_value)) for v in values]
+                group[name] = {"dict": list(codes_by_value), "codes": codes}
+            else:
+                group[name] = list(values)
+
+        if not self.first_group:
+            self.f.write(",")
+        self.first_group = False
+        self.f.write("\n" + json.dumps(group, ensure_ascii=False, separators=(",", ":")))
+
+    def end(self):
+        self.f.write("\n]}\n")
+
+EXPORT_WRITERS = {
+    "csv": CsvExportWriter,
+    "jsonl": JsonLinesExportWriter,
+    "columnar": ColumnarExportWriter,
+}
+
+def read_columnar_export(path):
+    """압축 JSON 내보내기 파일을 (timestamp, duration, task, status) 튜플 목록으로 복원합니다."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    rows = []
+    for group in data["row_groups"]:
+        columns = []
+        for name in data["columns"]:
+            col = group[name]
+            if isinstance(col, dict):
+                col = [col["dict"][code] for code in col["codes"]]
+            columns.append(col)
+        rows.extend(zip(*columns))
+    return rows
+
+class LogExporter:
+    """로그를 청크 단위(fetchmany)로 읽어 파일에 스트리밍으로 기록합니다.
+
+    전용 읽기 연결을 사용하므로 WAL 모드에서 앱의 쓰기와 서로 막지 않으며,
+    임시 파일에 기록한 뒤 완료 시에만 대상 파일로 교체합니다.
+    """
+
+    CHUNK_SIZE = 1000
+
+    def __init__(self, db_path, file_path, fmt="csv", start_day=None, end_day=None, task=None, chunk_size=None):
+        if fmt not in EXPORT_WRITERS:
+            raise ValueError(f"Unknown export format: {fmt}")
+        self.db_path = db_path
+        self.file_path = file_path
+        self.fmt = fmt
+        self.start_day = start_day
+        self.end_day = end_day
+        self.task = task
+        self.chunk_size = chunk_size or self.CHUNK_SIZE
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def connect(self):
+        # 읽기 전용으로 열어 스키마 생성/쓰기 잠금이 발생하지 않도록 함
+        uri = Path(os.path.abspath(self.db_path)).as_uri() + "?mode=ro"
+        return sqlite3.connect(uri, uri=True)
+
+    def run(self, progress=None):
+        """내보내기를 실행하고 기록한 행 수를 반환합니다. progress(done, total)는 청크마다 호출됩니다."""
+        select_sql, count_sql, params = build_export_query(self.start_day, self.end_day, self.task)
+        writer_cls = EXPORT_WRITERS[self.fmt]
+        tmp_path = self.file_path + ".part"
+
+        conn = self.connect()
+        try:
+            total = conn.execute(count_sql, params).fetchone()[0]
+            if progress:
+                progress(0, total)
+            if total == 0:
+                return 0
+
+            done = 0
+            cursor = conn.execute(select_sql, params)
+            with open(tmp_path, "w", encoding=writer_cls.encoding, newline="") as f:
+                writer = writer_cls(f)
+                writer.begin()
+                while True:
+                    if self.cancel_event.is_set():
+                        raise ExportCancelled()
+                    rows = cursor.fetchmany(self.chunk_size)
+                    if not rows:
+                        break
+                    writer.write_chunk(rows)
+                    done += len(rows)
+                    if progress:
+                        progress(done, total)
+                writer.end()
+            os.replace(tmp_path, self.file_path)
+            return done
+        finally:
+            conn.close()
+            if os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
@@ -0,0 +1,83 @@
+import sys
+import threading
+from collections import OrderedDict
+from PIL import ImageFont
+from common import resource_path
+
+def get_font_candidates(bold=False):
+    """플랫폼별 폰트 후보 목록을 우선순위 순으로 반환합니다."""
+    font_candidates = []
+    if sys.platform == "win32":
+        if bold:
+            font_candidates.extend(["arlrdbd.ttf", "segoeuib.ttf", "malgunbd.ttf", "arialbd.ttf"])
+        else:
+            font_candidates.extend(["segoeui.ttf", "malgun.ttf", "arial.ttf"])
+
+    # 기본 후보 (리소스 경로 포함)
+    if bold:
+        font_candidates.append("arialbd.ttf")
+    else:
+        font_candidates.append("arial.ttf")
+    return tuple(font_candidates)
+
+class FontCache:
+    """로드한 폰트 객체를 (크기, 굵기, 후보 목록) 기준으로 캐싱합니다 (LRU)."""
+
+    def __init__(self, max_size=32):
+        self.max_size = max_size
+        self._fonts = OrderedDict()
+        self._resolved = {} # 후보 목록 -> 실제로 로드에 성공한 경로 (None이면 기본 폰트)
+        self._lock = threading.Lock()
+
+    def get(self, size, bold=False, candidates=None):
+        if candidates is None:
+            candidates = get_font_candidates(bold)
+        key = (size, bold, candidates)
+
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is not None:
+                self._fonts.move_to_end(key)
+                return font
+
+            font = self._load(size, candidates)
+            self._fonts[key] = font
+            if len(self._fonts) > self.max_size:
+                self._fonts.popitem(last=False)
+            return font
+
+    def _load(self, size, candidates):
+        if candidates in self._resolved:
+            path = self._resolved[candidates]
+            if path is None:
+                return ImageFont.load_default()
+            try:
+                return ImageFont.truetype(path, size)
+            except IOError:
+                # 파일이 사라진 경우 후보 목록을 다시 탐색
+                del self._resolved[candidates]
+
+        # 최초 1회만 후보 목록을 순서대로 탐색하고, 성공한 경로를 기억함
+        for font_name in candidates:
+            for path in (font_name, resource_path(font_name)):
+                try:
+                    font = ImageFont.truetype(path, size)
+                except IOError:
+                    continue
+                self._resolved[candidates] = path
+                return font
+
+        self._resolved[candidates] = None
+        return ImageFont.load_default()
+
+    def clear(self):
+        with self._lock:
+            self._fonts.clear()
+            self._resolved.clear()
+
+# 프로세스 전역 폰트 캐시
+_font_cache = FontCache()
+
+def load_font(size, bold=False):
+    """시스템 폰트를 우선적으로 로드하여 고해상도에서 깨짐을 방지합니다 (캐시 사용)."""
+    return _font_cache.get(size, bold)
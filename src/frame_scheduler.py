@@ -0,0 +1,31 @@
+import math
+
+class FrameScheduler:
+    """화면에 보이는 변화가 생기는 시점을 계산하여 다음 프레임까지의 대기 시간(ms)을 결정합니다."""
+
+    MIN_DELAY_MS = 16      # 최대 약 60fps
+    MAX_DELAY_MS = 1000    # 보이는 상태에서는 최소 1초에 한 번 갱신
+    HIDDEN_DELAY_MS = 5000 # 최소화/숨김 상태의 저빈도 갱신 (타이틀, 작업 표시줄 진행률)
+    BOUNDARY_MARGIN = 0.005 # 초 경계를 확실히 넘긴 뒤 깨어나기 위한 여유 (초)
+    FULL_DIAL_SECONDS = 3600
+
+    def next_delay(self, remaining, arc_radius=0, visible=True):
+        """남은 시간(초)과 파이 반지름(px) 기준으로 다음 프레임까지의 대기 시간(ms)을 반환합니다."""
+        if remaining <= 0:
+            return self.MIN_DELAY_MS
+
+        # 1. 다음 초 경계 (MM:SS 표시가 바뀌는 시점)
+        frac = remaining - math.floor(remaining)
+        wait = frac + self.BOUNDARY_MARGIN
+
+        # 2. 파이 조각 끝이 1px 이상 움직이는 시점 (60분 이상이면 꽉 찬 원이라 변화 없음)
+        if visible and arc_radius > 0 and remaining < self.FULL_DIAL_SECONDS:
+            px_per_sec = arc_radius * 2 * math.pi / self.FULL_DIAL_SECONDS
+            wait = min(wait, 1.0 / px_per_sec)
+
+        if not visible:
+            # 보이지 않을 때는 저빈도로 갱신하되, 타이머 종료 시점은 놓치지 않음
+            wait = min(max(wait, self.HIDDEN_DELAY_MS / 1000), remaining + self.BOUNDARY_MARGIN)
+            return max(self.MIN_DELAY_MS, int(wait * 1000))
+
+        return max(self.MIN_DELAY_MS, min(self.MAX_DELAY_MS, int(wait * 1000)))
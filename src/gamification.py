@@ -0,0 +1,82 @@
+import math
+from datetime import date, datetime, timedelta
+
+# 레벨 공식: 1 + sqrt(총 분 / 25) -> 25분(1회)=Lv2, 100분(4회)=Lv3
+LEVEL_UNIT_MIN = 25
+
+def level_for(total_duration):
+    """총 집중 시간(분)에 해당하는 레벨을 반환합니다."""
+    return 1 + int(math.sqrt(max(total_duration, 0) / LEVEL_UNIT_MIN))
+
+def level_progress(total_duration):
+    """현재 레벨에서 다음 레벨까지의 진행률(0.0 ~ 1.0)을 반환합니다."""
+    level = level_for(total_duration)
+    start = LEVEL_UNIT_MIN * (level - 1) ** 2
+    end = LEVEL_UNIT_MIN * level ** 2
+    return (max(total_duration, 0) - start) / (end - start)
+
+class GamificationState:
+    """DB의 gamification 테이블(단일 행)에 저장된 누적 게이미피케이션 상태
+
+    총 집중 횟수/시간, last_day로 끝나는 연속 달성일(streak), 최장 연속 달성일을 보관합니다.
+    daily_stats의 트리거가 날짜 추가와 집계 변경을 O(1)로 반영하고, 날짜가 사라지거나
+    과거 날짜가 새로 생기는 등 증분으로 처리할 수 없는 변경은 dirty로 표시하여
+    다음 조회 시 load()가 전체를 다시 계산합니다.
+    """
+
+    def __init__(self, total_count=0, total_duration=0, streak=0, longest_streak=0, last_day=None):
+        self.total_count = total_count
+        self.total_duration = total_duration
+        self.streak = streak
+        self.longest_streak = longest_streak
+        self.last_day = last_day
+
+    @classmethod
+    def load(cls, conn):
+        """저장된 상태를 읽어 반환합니다 (재계산이 필요한 경우에만 daily_stats 전체를 확인)."""
+        row = conn.execute("SELECT * FROM gamification WHERE id = 1").fetchone()
+        if row is None or row['dirty']:
+            return cls.recompute(conn)
+        return cls(row['total_count'], row['total_duration'], row['streak'], row['longest_streak'], row['last_day'])
+
+    @classmethod
+    def recompute(cls, conn):
+        """daily_stats 전체로부터 상태를 다시 계산하여 저장하고 반환합니다."""
+        totals = conn.execute("SELECT IFNULL(SUM(count), 0), IFNULL(SUM(duration), 0) FROM daily_stats").fetchone()
+        state = cls(totals[0], totals[1])
+
+        prev = None
+        for (day,) in conn.execute("SELECT day FROM daily_stats ORDER BY day"):
+            try:
+                current = date.fromisoformat(day)
+            except ValueError:
+                continue
+            state.streak = state.streak + 1 if prev is not None and current - prev == timedelta(days=1) else 1
+            state.longest_streak = max(state.longest_streak, state.streak)
+            state.last_day = day
+            prev = current
+
+        conn.execute("""INSERT OR REPLACE INTO gamification
+                        (id, total_count, total_duration, streak, longest_streak, last_day, dirty)
+                        VALUES (1, ?, ?, ?, ?, ?, 0)""",
+                     (state.total_count, state.total_duration, state.streak, state.longest_streak, state.last_day))
+        return state
+
+    def current_streak(self, today=None):
+        """오늘 기준 연속 달성일 (오늘 기록이 없어도 어제까지 이어져 있으면 유지)"""
+        if not self.last_day:
+            return 0
+        today = today or datetime.now().date()
+        if self.last_day in (today.strftime("%Y-%m-%d"), (today - timedelta(days=1)).strftime("%Y-%m-%d")):
+            return self.streak
+        return 0
+
+    def snapshot(self, today=None):
+        """화면 표시에 필요한 값을 딕셔너리로 반환합니다 (DB 접근 없음)."""
+        return {
+            'level': level_for(self.total_duration),
+            'level_progress': level_progress(self.total_duration),
+            'streak': self.current_streak(today),
+            'longest_streak': self.longest_streak,
+            'total_duration': self.total_duration,
+        }
@@ -1,19 +1,27 @@
 import tkinter as tk
 from tkinter import messagebox
-from utils import play_sound, log_godmode, show_toast, play_tick_sound, parse_logs, get_gamification_stats, open_url, load_remote_image
+from utils import play_sound, log_godmode, show_toast, play_tick_sound, get_today_stats, open_url, load_remote_image, close_db, get_legacy_migrator
 from taskbar import WindowsTaskbar
 from common import resource_path, get_user_data_path
 from settings_window import open_settings_window
 from stats_window import open_stats_window
 from ad_window import show_ad_window
 from timer_engine import TimerEngine
+from timer_renderer import TimerRenderer
+from font_cache import load_font
+from icon_cache import get_icon, load_icon_atlas, save_icon_atlas
+from frame_scheduler import FrameScheduler
+from resize_coalescer import ResizeCoalescer
+from window_manager import WindowManager
+from db_worker import DBWorker
+from perf import recorder as perf_recorder, timed
 from localization import Localization
 # from sound_manager import WhiteNoisePlayer  # (구현 후 주석 해제)
 import time
 import math
 import sys
 import re
-from PIL import Image, ImageDraw, ImageFont, ImageTk
+from PIL import Image, ImageDraw, ImageTk
 import json
 import os
 from datetime import datetime
@@ -46,8 +54,12 @@ class GodModeApp:
         self.setting_white_noise = None # "rain", "fire", etc.
         self.is_mini_mode = False
         
+        self.today_count = 0
+        self.today_duration = 0
         self.user_level = 1
         self.user_streak = 0
+        self.user_longest_streak = 0
+        self.user_level_progress = 0.0
         self.window_x = None
         self.window_y = None
         self.settings_window_x = None
@@ -59,6 +71,7 @@ class GodModeApp:
         self.stats_window_w = None
         self.stats_window_h = None
         self.stats_window = None
+        self.windows = WindowManager() # 통계/설정 창은 닫으면 숨겨 두고 다시 열 때 재사용
         self.last_scale = 1.0
         self.transition_job = None
         
@@ -67,6 +80,8 @@ class GodModeApp:
         
         # 타이머 엔진 초기화
         self.engine = TimerEngine()
+        self.frame_scheduler = FrameScheduler()
+        self.countdown_job = None
         
         # 시스템 테마 감지 초기화
         self.system_theme = self.get_system_theme()
@@ -98,18 +113,31 @@ class GodModeApp:
         # 윈도우 닫기 이벤트 처리
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
-        # 윈도우 자석 효과 (Snap to Edge)
+        # 창 크기 조절/이동 이벤트는 프레임 단위로 모아서 처리 (자석 효과, DPI 확인은 드래그가 끝난 뒤)
+        self.resize_coalescer = ResizeCoalescer(self.root, self.on_resize_frame, self.on_resize_settled)
         self.root.bind("<Configure>", self.on_window_configure)
 
+        # 최소화 복원 시 즉시 화면 갱신
+        self.root.bind("<Map>", self.on_window_map)
+
         # 스페이스바 단축키
         self.root.bind("<space>", self.toggle_timer_shortcut)
 
         # 마우스 휠로 시간 조절
         self.root.bind("<MouseWheel>", self.handle_mouse_wheel)
 
+        # 성능 오버레이 토글 / 계측 데이터 JSON 저장 (숨김 단축키)
+        self.perf_label = None
+        self.perf_job = None
+        self.root.bind("<Control-Shift-P>", self.toggle_perf_overlay)
+        self.root.bind("<Control-Shift-D>", self.dump_perf_stats)
+
         self.normal_geometry = f"{self.initial_w}x{self.initial_h}"
         
+        # DB 작업은 백그라운드 워커에서 처리 (UI 프리징 방지)
+        self.db_worker = DBWorker(self.root)
         self.refresh_today_count()
+        self.start_legacy_migration()
         
         if self.window_x is not None and self.window_y is not None:
             self.root.geometry(f"+{self.window_x}+{self.window_y}")
@@ -181,7 +209,8 @@ class GodModeApp:
         self.repeat_button.bind("<Leave>", lambda e: self.repeat_button.config(bg=self.colors["btn_bg"]))
         # repeat_button은 집중 모드 대기 상태에서만 표시됨
 
-        # 아이콘 이미지 생성
+        # 아이콘 이미지 생성 (이전 실행에서 저장한 아틀라스가 있으면 그리기 생략)
+        load_icon_atlas(get_user_data_path("icon_atlas"))
         self.icon_play = self.create_button_icon("play", self.colors["icon_color"], size=(24, 24))
         self.icon_stop = self.create_button_icon("stop", "#FF5252", size=(24, 24))
         self.icon_settings = self.create_button_icon("settings", self.colors["icon_color"])
@@ -215,8 +244,10 @@ class GodModeApp:
         self.canvas = tk.Canvas(root, bg=self.colors["bg"], highlightthickness=0)
         self.canvas.pack(pady=0, expand=True, fill=tk.BOTH)
 
+        self.tk_image = None
+        self.timer_renderer = TimerRenderer(self.load_font)
         self.draw_timer()
-        self.canvas.bind("<Configure>", lambda e: self.draw_timer())
+        self.canvas.bind("<Configure>", lambda e: self.resize_coalescer.notify(redraw=True))
         self.canvas.bind("<Button-1>", self.handle_mouse_input)
         self.canvas.bind("<B1-Motion>", self.handle_mouse_input)
         self.canvas.bind("<Double-Button-1>", self.on_canvas_double_click)
@@ -225,8 +256,6 @@ class GodModeApp:
         self.canvas.bind("<Enter>", lambda e: self.root.config(cursor="hand2"))
         self.canvas.bind("<Leave>", lambda e: self.root.config(cursor=""))
 
-        self.tk_image = None
-        
         # 설정에 따라 할 일 입력창 표시 여부 결정
         self.update_task_input_visibility()
         self.update_control_buttons_visibility()
@@ -351,202 +380,38 @@ class GodModeApp:
         self.root.iconphoto(True, self.tk_icon)
 
     def create_button_icon(self, shape, color, size=(24, 24)):
-        # 고품질 렌더링을 위한 슈퍼샘플링
-        scale = 4 
-        w, h = size[0] * scale, size[1] * scale
-        image = Image.new("RGBA", (w, h), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(image)
-        
-        if shape == "play":
-            # 삼각형 (오른쪽 방향)
-            draw.polygon([(w*0.25, h*0.2), (w*0.25, h*0.8), (w*0.85, h*0.5)], fill=color)
-        elif shape == "stop":
-            # 정지(Stop) 아이콘 - 사각형
-            draw.rectangle([(w*0.25, h*0.25), (w*0.75, h*0.75)], fill=color)
-        elif shape == "settings":
-            # 톱니바퀴 아이콘 (Solid)
-            cx, cy = w/2, h/2
-            r_body = w * 0.28
-            r_tooth_start = w * 0.25
-            r_tooth_end = w * 0.42
-            tooth_width = w * 0.14
-            
-            # Draw teeth
-            for i in range(8):
-                angle = math.radians(i * 45)
-                x0 = cx + r_tooth_start * math.cos(angle)
-                y0 = cy + r_tooth_start * math.sin(angle)
-                x1 = cx + r_tooth_end * math.cos(angle)
-                y1 = cy + r_tooth_end * math.sin(angle)
-                draw.line([(x0, y0), (x1, y1)], fill=color, width=int(tooth_width))
-            
-            # Draw body
-            draw.ellipse((cx-r_body, cy-r_body, cx+r_body, cy+r_body), fill=color)
-            
-        elif shape == "stats":
-            # 막대 그래프 아이콘
-            # Bar 1
-            draw.rectangle([(w*0.2, h*0.6), (w*0.35, h*0.8)], fill=color)
-            # Bar 2
-            draw.rectangle([(w*0.425, h*0.4), (w*0.575, h*0.8)], fill=color)
-            # Bar 3
-            draw.rectangle([(w*0.65, h*0.2), (w*0.8, h*0.8)], fill=color)
-            
-        elif shape == "skip":
-            # Skip icon (Next track style: |>|)
-            # Triangle
-            draw.polygon([(w*0.25, h*0.2), (w*0.25, h*0.8), (w*0.65, h*0.5)], fill=color)
-            # Line
-            draw.rectangle([(w*0.65, h*0.2), (w*0.75, h*0.8)], fill=color)
-            
-        elif shape == "repeat":
-            # Rest icon (Coffee Cup)
-            # Cup body
-            draw.rectangle([(w*0.2, h*0.4), (w*0.75, h*0.8)], fill=color)
-            # Handle
-            draw.line([(w*0.75, h*0.5), (w*0.9, h*0.5), (w*0.9, h*0.7), (w*0.75, h*0.7)], fill=color, width=int(w*0.08))
-            # Steam
-            draw.line([(w*0.35, h*0.2), (w*0.35, h*0.3)], fill=color, width=int(w*0.06))
-            draw.line([(w*0.5, h*0.15), (w*0.5, h*0.3)], fill=color, width=int(w*0.06))
-            draw.line([(w*0.65, h*0.2), (w*0.65, h*0.3)], fill=color, width=int(w*0.06))
-
-        image = image.resize(size, resample=Image.LANCZOS)
-        return ImageTk.PhotoImage(image)
+        # (모양, 색상, 크기)별로 공유 아이콘 캐시에서 가져옴 (크기 조절/테마 변경 시 다시 그리지 않음)
+        return get_icon(shape, color, tuple(size))
 
+    @timed("draw_timer")
     def draw_timer(self):
-        self.canvas.delete("all")
-        
         w = self.canvas.winfo_width()
         h = self.canvas.winfo_height()
         if w <= 1: w = 320
         if h <= 1: h = 320
         
-        # 고품질 렌더링을 위한 슈퍼샘플링 (2배 확대 후 축소)
-        supersample = 2
-        img_w, img_h = w * supersample, h * supersample
-        
-        # UI 스케일링 비율 (기본 1.0)
-        ui_scale = getattr(self, 'last_scale', 1.0)
-        
-        # 투명 배경 대신 캔버스 배경색으로 이미지 생성
-        image = Image.new("RGBA", (img_w, img_h), self.colors["bg"])
-        draw = ImageDraw.Draw(image)
-        
-        cx, cy = img_w / 2, img_h / 2
-        radius = min(img_w, img_h) / 2 * 0.88
-        arc_radius = radius * 0.65
-        
-        # 선 두께 계산 (UI 스케일 반영)
-        outline_width = max(1, int(3 * supersample * ui_scale))
-        
-        # 0. 배경 원
-        draw.ellipse((cx-radius, cy-radius, cx+radius, cy+radius), fill=self.colors["timer_bg"], outline=self.colors["timer_outline"], width=outline_width)
-        
-        # 1. 남은 시간 영역 그리기
-        display_time = min(self.engine.current_time, 3600)
-        angle = (display_time / 3600) * 360
-        color = "#FF5252" if self.engine.mode == "work" else "#4CAF50"
-        
-        if display_time >= 3600:
-            draw.ellipse((cx-arc_radius, cy-arc_radius, cx+arc_radius, cy+arc_radius), fill=color, outline=color)
-        elif display_time > 0:
-            # PIL은 3시 방향이 0도, 시계 방향으로 증가
-            # 12시 방향은 270도
-            start_angle = 270
-            end_angle = 270 + angle
-            draw.pieslice((cx-arc_radius, cy-arc_radius, cx+arc_radius, cy+arc_radius), start=start_angle, end=end_angle, fill=color, outline=color)
-
-        # 2. 눈금 그리기 (0~60분)
-        font_size = max(9, int(radius * 0.09))
-        font = self.load_font(font_size, bold=True)
-
-        for i in range(60):
-            angle_deg = 90 - (i * 6)
-            angle_rad = math.radians(angle_deg)
-            
-            if i % 5 == 0:
-                tick_len = 10 * supersample * ui_scale
-                width = 3.2805 * supersample * ui_scale
-                
-                # 5분 단위 숫자 표시
-                text_radius = radius - (35 * supersample * ui_scale)
-                tx = cx + text_radius * math.cos(angle_rad)
-                ty = cy - text_radius * math.sin(angle_rad)
-                text = str(i if i != 0 else 60)
-                draw.text((tx, ty), text, font=font, fill=self.colors["timer_outline"], anchor="mm")
-            else:
-                tick_len = 5 * supersample * ui_scale
-                width = 1.64025 * supersample * ui_scale
-            
-            x_out = cx + radius * math.cos(angle_rad)
-            y_out = cy - radius * math.sin(angle_rad)
-            x_in = cx + (radius - tick_len) * math.cos(angle_rad)
-            y_in = cy - (radius - tick_len) * math.sin(angle_rad)
-            
-            draw.line((x_in, y_in, x_out, y_out), fill=self.colors["timer_outline"], width=int(width))
-
-        # 4. 중앙 디지털 시간 표시
-        center_radius = radius * 0.22
-        draw.ellipse((cx-center_radius, cy-center_radius, cx+center_radius, cy+center_radius), fill=self.colors["timer_center"])
-        
-        mins, secs = divmod(int(self.engine.current_time), 60)
-        time_str = "{:02d}:{:02d}".format(mins, secs)
-        
-        font_size_time = max(18, int(radius * 0.14))
-        font_time = self.load_font(font_size_time, bold=True)
-            
-        draw.text((cx, cy), time_str, font=font_time, fill=self.colors["fg"], anchor="mm")
-        
-        # 6. 집중 사이클 트래커 (Cycle Tracker) - 중앙 하단
-        if not self.is_mini_mode:
-            cycle_len = self.setting_long_break_interval
-            # 현재 사이클 내 완료 횟수 계산
-            if self.engine.mode == "break" and self.today_count > 0 and self.today_count % cycle_len == 0:
-                # 롱 브레이크 중일 때는 꽉 찬 상태로 표시
-                current_cycle_count = cycle_len
-            else:
-                current_cycle_count = self.today_count % cycle_len
-            
-            # 점 그리기 설정
-            dot_radius = 4 * supersample * ui_scale
-            dot_spacing = 10 * supersample * ui_scale
-            total_width = (cycle_len * dot_radius * 2) + ((cycle_len - 1) * dot_spacing)
-            start_x = cx - (total_width / 2) + dot_radius
-            dot_y = cy + (radius * 0.45) # 시간 텍스트 아래 적절한 위치
-            
-            dot_outline_width = max(1, int(1.5 * supersample * ui_scale))
-            
-            for i in range(cycle_len):
-                dx = start_x + i * (dot_radius * 2 + dot_spacing)
-                
-                if i < current_cycle_count:
-                    fill_color = self.colors["fg"]
-                    outline_color = self.colors["fg"]
-                else:
-                    fill_color = self.colors["timer_center"]
-                    outline_color = "#AAAAAA"
-                
-                draw.ellipse((dx - dot_radius, dot_y - dot_radius, dx + dot_radius, dot_y + dot_radius), 
-                             fill=fill_color, outline=outline_color, width=dot_outline_width)
-
-        # 7. 게이미피케이션 정보 (레벨 & 스트릭) - 상단 좌우 배치
-        if not self.is_mini_mode:
-            stats_font_size = int(14 * supersample * ui_scale) # 화면상 약 14pt
-            stats_font = self.load_font(stats_font_size, bold=True)
-            
-            pad = 20 * supersample * ui_scale
-            
-            # Lv 표시 (좌측 상단)
-            draw.text((pad, pad), f"Lv.{self.user_level}", font=stats_font, fill=self.colors["fg"], anchor="lt")
-            
-            # Streak 표시 (우측 상단)
-            if self.user_streak > 0:
-                draw.text((img_w - pad, pad), f"🔥 {self.user_streak}", font=stats_font, fill=self.colors["fg"], anchor="rt")
+        # 정적 레이어(배경 원, 눈금, 숫자 등)는 렌더러에 캐싱되며, 매 프레임 파이 조각과 시간만 새로 그림
+        image = self.timer_renderer.render(
+            w, h, self.colors,
+            ui_scale=getattr(self, 'last_scale', 1.0), # UI 스케일링 비율 (기본 1.0)
+            is_mini_mode=self.is_mini_mode,
+            current_time=self.engine.current_time,
+            mode=self.engine.mode,
+            cycle_len=self.setting_long_break_interval,
+            today_count=self.today_count,
+            level=self.user_level,
+            streak=self.user_streak,
+            level_progress=self.user_level_progress,
+            longest_streak=self.user_longest_streak
+        )
         
-        # 이미지 리사이즈 (안티앨리어싱) 및 캔버스에 표시
-        image = image.resize((w, h), resample=Image.BILINEAR)
-        self.tk_image = ImageTk.PhotoImage(image)
-        self.canvas.create_image(0, 0, image=self.tk_image, anchor=tk.NW)
+        # 크기가 같으면 기존 PhotoImage에 붙여넣어 캔버스 아이템 재생성을 피함
+        if self.tk_image and self.tk_image.width() == w and self.tk_image.height() == h:
+            self.tk_image.paste(image)
+        else:
+            self.canvas.delete("all")
+            self.tk_image = ImageTk.PhotoImage(image)
+            self.canvas.create_image(0, 0, image=self.tk_image, anchor=tk.NW)
 
         # 윈도우 타이틀 업데이트
         if self.engine.is_running:
@@ -566,29 +431,7 @@ class GodModeApp:
 
     def load_font(self, size, bold=False):
         """시스템 폰트를 우선적으로 로드하여 고해상도에서 깨짐을 방지합니다."""
-        font_candidates = []
-        if sys.platform == "win32":
-            if bold:
-                font_candidates.extend(["arlrdbd.ttf", "segoeuib.ttf", "malgunbd.ttf", "arialbd.ttf"])
-            else:
-                font_candidates.extend(["segoeui.ttf", "malgun.ttf", "arial.ttf"])
-        
-        # 기본 후보 (리소스 경로 포함)
-        if bold:
-            font_candidates.append("arialbd.ttf")
-        else:
-            font_candidates.append("arial.ttf")
-
-        for font_name in font_candidates:
-            try:
-                return ImageFont.truetype(font_name, size)
-            except IOError:
-                try:
-                    return ImageFont.truetype(resource_path(font_name), size)
-                except IOError:
-                    continue
-        
-        return ImageFont.load_default()
+        return load_font(size, bold)
 
     def toggle_mini_mode(self):
         if not self.is_mini_mode:
@@ -773,13 +616,43 @@ class GodModeApp:
             self.last_time = time.time()
             self.count_down()
 
+    @timed("count_down")
     def count_down(self):
+        # 직접 호출된 경우 예약된 루프가 중복 실행되지 않도록 취소
+        if self.countdown_job:
+            self.root.after_cancel(self.countdown_job)
+            self.countdown_job = None
+
         if self.engine.tick():
             self.finish_cycle()
         elif self.engine.is_running:
             self.draw_timer()
-            self.root.after(50, self.count_down)
+            self.schedule_count_down()
 
+    def schedule_count_down(self):
+        """화면에 보이는 변화가 생기는 시점(초 경계, 파이 1px 이동)까지 대기 후 count_down을 예약합니다."""
+        if self.countdown_job:
+            self.root.after_cancel(self.countdown_job)
+        
+        w = self.canvas.winfo_width()
+        h = self.canvas.winfo_height()
+        arc_radius = min(w, h) / 2 * 0.88 * 0.65
+        delay = self.frame_scheduler.next_delay(self.engine.current_time, arc_radius, self.is_window_visible())
+        self.countdown_job = self.root.after(delay, self.count_down)
+
+    def is_window_visible(self):
+        """윈도우가 최소화되거나 숨겨진 상태가 아니면 True를 반환합니다."""
+        try:
+            return self.root.state() != "iconic" and bool(self.root.winfo_viewable())
+        except tk.TclError:
+            return False
+
+    def on_window_map(self, event):
+        # 최소화에서 복원되면 저빈도 대기를 끊고 즉시 갱신
+        if event.widget == self.root and self.engine.is_running:
+            self.count_down()
+
+    @timed("finish_cycle")
     def finish_cycle(self):
         # 윈도우를 맨 앞으로 가져오기
         self.root.deiconify()
@@ -790,13 +663,14 @@ class GodModeApp:
             task_content = self.task_var.get()
             if task_content == self.task_placeholder:
                 task_content = None
-            log_godmode(task_content, self.setting_work_min, status="success")
+            self.db_worker.submit(log_godmode, task_content, self.setting_work_min, status="success")
             
             # 로그 저장 후 입력창 초기화 (다음 작업을 위해)
             self.task_var.set("")
             self.on_task_focus_out(None) # 플레이스홀더 복구
             
-            self.refresh_today_count()
+            # 방금 완료한 1회를 먼저 반영하고 DB 값은 백그라운드에서 확정
+            self.refresh_today_count(added=1, added_duration=self.setting_work_min)
             
             # 휴식 모드로 전환 (긴 휴식 여부 판단)
             is_long_break = self.engine.switch_to_break(self.today_count)
@@ -822,7 +696,7 @@ class GodModeApp:
                 self.update_control_buttons_visibility()
                 self.last_time = time.time()
                 self.draw_timer()
-                self.root.after(50, self.count_down)
+                self.schedule_count_down()
             else:
                 show_toast(self.loc.get("focus_complete_title"), msg)
                 self.update_topmost_status()
@@ -841,7 +715,7 @@ class GodModeApp:
                 self.update_start_button_color()
                 self.last_time = time.time()
                 self.draw_timer()
-                self.root.after(50, self.count_down)
+                self.schedule_count_down()
             else:
                 show_toast(self.loc.get("break_complete_title"), self.loc.get("break_complete_msg"))
                 self.update_topmost_status()
@@ -1022,18 +896,47 @@ class GodModeApp:
         except Exception:
             self.restore_default_settings()
 
-    def refresh_today_count(self):
-        """오늘의 집중 횟수를 로그에서 다시 읽어옵니다."""
-        daily_stats = parse_logs()
-        today_str = datetime.now().strftime("%Y-%m-%d")
-        stats = daily_stats.get(today_str, {'count': 0, 'duration': 0})
+    def refresh_today_count(self, added=0, added_duration=0):
+        """오늘의 집중 횟수를 백그라운드에서 다시 읽어옵니다.
+
+        added/added_duration은 DB 조회 결과가 도착하기 전에 즉시 반영할 값입니다.
+        """
+        if added:
+            self.today_count += added
+            self.today_duration += added_duration
+        self.db_worker.submit(get_today_stats, callback=self.on_today_stats_loaded)
+
+    def start_legacy_migration(self):
+        """기존 텍스트 로그가 있으면 DB 워커에서 배치 단위로 이관합니다 (다른 DB 작업과 번갈아 실행)."""
+        migrator = get_legacy_migrator()
+        if migrator is None:
+            return
+        print("🔄 기존 로그를 SQLite 데이터베이스로 이관 중...")
+
+        def on_error(e):
+            # 마지막 체크포인트까지는 저장되어 있으므로 다음 실행 시 이어서 진행
+            print(f"⚠️ 데이터 이관 실패: {e}")
+
+        def on_step(metrics):
+            if not metrics["done"]:
+                print(f"   ... {migrator.progress():.0%}")
+                self.db_worker.submit(migrator.step, callback=on_step, error_callback=on_error)
+                return
+            print(f"✅ 데이터 이관 완료. ({migrator.summary()})")
+            self.refresh_today_count()
+
+        self.db_worker.submit(migrator.step, callback=on_step, error_callback=on_error)
+
+    def on_today_stats_loaded(self, stats):
+        """DB에서 읽어온 오늘 통계 및 게이미피케이션 스탯을 반영합니다."""
+        game = (stats['level'], stats['streak'], stats['longest_streak'], stats['level_progress'])
+        changed = (stats['count'],) + game != (self.today_count, self.user_level, self.user_streak,
+                                               self.user_longest_streak, self.user_level_progress)
         self.today_count = stats['count']
-        self.today_duration = stats.get('duration', 0)
-        
-        # 게이미피케이션 스탯 갱신
-        game_stats = get_gamification_stats()
-        self.user_level = game_stats.get('level', 1)
-        self.user_streak = game_stats.get('streak', 0)
+        self.today_duration = stats['duration']
+        self.user_level, self.user_streak, self.user_longest_streak, self.user_level_progress = game
+        if changed:
+            self.draw_timer()
 
     def restore_default_settings(self):
         self.setting_always_on_top = True
@@ -1111,6 +1014,10 @@ class GodModeApp:
             show_toast(self.loc.get("focus_mode_title"), self.loc.get("strict_mode_exit_msg"))
             return
         self.save_settings_to_file()
+        save_icon_atlas(get_user_data_path("icon_atlas"))
+        self.resize_coalescer.cancel()
+        self.windows.destroy_all()
+        self.db_worker.stop(on_exit=close_db) # 남은 쓰기를 모두 처리한 뒤 워커 스레드에서 DB를 닫음
         self.root.destroy()
 
     def show_exit_popup(self):
@@ -1142,6 +1049,10 @@ class GodModeApp:
         def do_exit(event=None):
             popup.destroy()
             self.save_settings_to_file()
+            save_icon_atlas(get_user_data_path("icon_atlas"))
+            self.resize_coalescer.cancel()
+            self.windows.destroy_all()
+            self.db_worker.stop(on_exit=close_db)
             self.root.destroy()
 
         tk.Button(btn_frame, text=self.loc.get("exit"), font=("Helvetica", 10, "bold"), bg=self.colors["stop_btn_bg"], fg="white", bd=0, padx=15, pady=5, command=do_exit).pack(side=tk.LEFT, padx=10)
@@ -1149,11 +1060,54 @@ class GodModeApp:
         
         popup.bind('<Return>', do_exit)
 
+    def toggle_perf_overlay(self, event=None):
+        """성능 오버레이(fps, 프레임/DB 시간 p50/p99)를 켜거나 끕니다."""
+        if self.perf_label is not None:
+            if self.perf_job:
+                self.root.after_cancel(self.perf_job)
+                self.perf_job = None
+            self.perf_label.destroy()
+            self.perf_label = None
+            return
+
+        self.perf_label = tk.Label(self.root, font=("Consolas", 8), justify=tk.LEFT, anchor="sw",
+                                   bg=self.colors["bg"], fg=self.colors["fg_sub"])
+        self.perf_label.place(in_=self.canvas, x=4, rely=1.0, y=-4, anchor="sw")
+        self.update_perf_overlay()
+
+    def update_perf_overlay(self):
+        if self.perf_label is None or not self.perf_label.winfo_exists():
+            self.perf_job = None
+            return
+        self.perf_label.config(text=perf_recorder.overlay_text())
+        self.perf_job = self.root.after(500, self.update_perf_overlay)
+
+    def dump_perf_stats(self, event=None):
+        """현재까지의 계측 데이터를 사용자 데이터 폴더에 JSON으로 저장합니다."""
+        path = get_user_data_path(f"perf_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        try:
+            perf_recorder.dump_json(path)
+            print(f"📈 성능 계측 데이터 저장: {path}")
+        except OSError as e:
+            print(f"⚠️ 성능 계측 데이터 저장 실패: {e}")
+
     def on_window_configure(self, event):
         if event.widget == self.root:
-            self.check_dpi_change()
+            self.resize_coalescer.notify(event)
+
+    def on_resize_frame(self, redraw):
+        """드래그 중 프레임마다 한 번: 레이아웃(스케일) 갱신 후 필요하면 타이머를 다시 그림"""
+        relaid = self.scale_ui()
+        if redraw and not relaid: # scale_ui가 적용되면 apply_theme에서 이미 다시 그림
+            self.draw_timer()
+
+    def on_resize_settled(self, event):
+        """드래그가 끝난 뒤 한 번: DPI 확인, 가장자리 스냅, 최종 레이아웃과 렌더링"""
+        self.check_dpi_change()
+        if event is not None:
             self.snap_to_edge(event)
-            self.scale_ui()
+        if not self.scale_ui(force=True):
+            self.draw_timer()
 
     def check_dpi_change(self):
         """DPI 변경을 감지하고 스케일 팩터를 업데이트합니다."""
@@ -1166,18 +1120,22 @@ class GodModeApp:
                 if hasattr(self.stats_window, 'refresh_ui_scale'):
                     self.stats_window.refresh_ui_scale()
 
-    def scale_ui(self):
+    def scale_ui(self, force=False):
+        """창 크기에 맞춰 버튼/아이콘 크기를 조정하고, 적용했으면 True를 반환합니다.
+
+        드래그 중에는 5% 이상 바뀔 때만 적용하고, 드래그가 끝나면(force=True) 정확한 크기로 맞춥니다.
+        """
         w = self.root.winfo_width()
         h = self.root.winfo_height()
         
-        if w <= 1 or h <= 1: return
+        if w <= 1 or h <= 1: return False
         
         # 기본 크기(300x400) 기준 스케일 계산
         scale = min(w / 300, h / 400)
         
         # 변화가 작으면 무시 (성능 최적화)
-        if abs(self.last_scale - scale) < 0.05:
-            return
+        if scale == self.last_scale or (not force and abs(self.last_scale - scale) < 0.05):
+            return False
             
         self.last_scale = scale
         self.apply_theme() # 아이콘 재생성 및 적용
@@ -1190,6 +1148,7 @@ class GodModeApp:
             btn.config(width=btn_w, height=btn_h)
         
         self.task_entry.config(font=("Helvetica", font_size))
+        return True
 
     def snap_to_edge(self, event):
         if event.widget != self.root:
@@ -1229,10 +1188,10 @@ class GodModeApp:
             self.root.geometry(f"+{new_x}+{new_y}")
 
     def open_settings(self):
-        open_settings_window(self)
+        self.windows.show("settings", lambda: open_settings_window(self))
 
     def open_stats(self):
-        open_stats_window(self)
+        self.windows.show("stats", lambda: open_stats_window(self))
 
     def update_topmost_status(self):
         """현재 상태에 따라 윈도우의 최상위 속성을 업데이트합니다."""
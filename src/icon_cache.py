@@ -0,0 +1,220 @@
+import json
+import math
+import os
+import threading
+from collections import OrderedDict
+from PIL import Image, ImageDraw, ImageTk
+
+# 아이콘 그리기 코드가 바뀌면 올려서 디스크에 저장된 아틀라스를 무효화
+ICON_ATLAS_VERSION = 1
+ATLAS_ROW_WIDTH = 1024 # 아틀라스 이미지 한 줄의 최대 너비 (px)
+
+def rasterize_icon(shape, color, size=(24, 24)):
+    """버튼 아이콘을 슈퍼샘플링으로 그린 뒤 size 크기의 PIL 이미지(RGBA)로 반환합니다."""
+    # 고품질 렌더링을 위한 슈퍼샘플링
+    scale = 4
+    w, h = size[0] * scale, size[1] * scale
+    image = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+
+    if shape == "play":
+        # 삼각형 (오른쪽 방향)
+        draw.polygon([(w*0.25, h*0.2), (w*0.25, h*0.8), (w*0.85, h*0.5)], fill=color)
+    elif shape == "stop":
+        # 정지(Stop) 아이콘 - 사각형
+        draw.rectangle([(w*0.25, h*0.25), (w*0.75, h*0.75)], fill=color)
+    elif shape == "settings":
+        # 톱니바퀴 아이콘 (Solid)
+        cx, cy = w/2, h/2
+        r_body = w * 0.28
+        r_tooth_start = w * 0.25
+        r_tooth_end = w * 0.42
+        tooth_width = w * 0.14
+
+        # Draw teeth
+        for i in range(8):
+            angle = math.radians(i * 45)
+            x0 = cx + r_tooth_start * math.cos(angle)
+            y0 = cy + r_tooth_start * math.sin(angle)
+            x1 = cx + r_tooth_end * math.cos(angle)
+            y1 = cy + r_tooth_end * math.sin(angle)
+            draw.line([(x0, y0), (x1, y1)], fill=color, width=int(tooth_width))
+
+        # Draw body
+        draw.ellipse((cx-r_body, cy-r_body, cx+r_body, cy+r_body), fill=color)
+
+    elif shape == "stats":
+        # 막대 그래프 아이콘
+        # Bar 1
+        draw.rectangle([(w*0.2, h*0.6), (w*0.35, h*0.8)], fill=color)
+        # Bar 2
+        draw.rectangle([(w*0.425, h*0.4), (w*0.575, h*0.8)], fill=color)
+        # Bar 3
+        draw.rectangle([(w*0.65, h*0.2), (w*0.8, h*0.8)], fill=color)
+
+    elif shape == "skip":
+        # Skip icon (Next track style: |>|)
+        # Triangle
+        draw.polygon([(w*0.25, h*0.2), (w*0.25, h*0.8), (w*0.65, h*0.5)], fill=color)
+        # Line
+        draw.rectangle([(w*0.65, h*0.2), (w*0.75, h*0.8)], fill=color)
+
+    elif shape == "repeat":
+        # Rest icon (Coffee Cup)
+        # Cup body
+        draw.rectangle([(w*0.2, h*0.4), (w*0.75, h*0.8)], fill=color)
+        # Handle
+        draw.line([(w*0.75, h*0.5), (w*0.9, h*0.5), (w*0.9, h*0.7), (w*0.75, h*0.7)], fill=color, width=int(w*0.08))
+        # Steam
+        draw.line([(w*0.35, h*0.2), (w*0.35, h*0.3)], fill=color, width=int(w*0.06))
+        draw.line([(w*0.5, h*0.15), (w*0.5, h*0.3)], fill=color, width=int(w*0.06))
+        draw.line([(w*0.65, h*0.2), (w*0.65, h*0.3)], fill=color, width=int(w*0.06))
+
+    return image.resize(size, resample=Image.LANCZOS)
+
+class IconCache:
+    """래스터화한 버튼 아이콘을 (모양, 색상, 픽셀 크기) 기준으로 캐싱합니다 (LRU).
+
+    PIL 이미지와 Tk PhotoImage를 함께 보관하여 메인/설정/통계 창이 같은 아이콘 객체를 공유하며,
+    아틀라스(한 장의 PNG + JSON 인덱스)로 디스크에 저장해 두면 다음 실행 시 그리기를 건너뜁니다.
+    """
+
+    def __init__(self, max_size=96):
+        self.max_size = max_size
+        self._images = OrderedDict() # key -> PIL 이미지
+        self._photos = {}            # key -> ImageTk.PhotoImage (Tk 루트 생성 후에만)
+        self._dirty = False          # 아틀라스 저장 이후 새로 그린 아이콘이 있는지
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(shape, color, size):
+        return (shape, color.lower(), tuple(size))
+
+    def get_image(self, shape, color, size=(24, 24)):
+        """아이콘 PIL 이미지를 반환합니다 (캐시에 없을 때만 그림)."""
+        key = self.make_key(shape, color, size)
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+                return image
+
+            image = rasterize_icon(shape, color, key[2])
+            self._store(key, image)
+            self._dirty = True
+            return image
+
+    def get_photo(self, shape, color, size=(24, 24)):
+        """아이콘 PhotoImage를 반환합니다. 호출자는 위젯에 표시하는 동안 참조를 유지해야 합니다."""
+        key = self.make_key(shape, color, size)
+        photo = self._photos.get(key)
+        if photo is None:
+            photo = ImageTk.PhotoImage(self.get_image(shape, color, size))
+            self._photos[key] = photo
+        return photo
+
+    def _store(self, key, image):
+        self._images[key] = image
+        while len(self._images) > self.max_size:
+            old_key, _ = self._images.popitem(last=False)
+            self._photos.pop(old_key, None)
+
+    def __len__(self):
+        return len(self._images)
+
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+            self._photos.clear()
+            self._dirty = False
+
+    # --- 디스크 아틀라스 ---
+
+    def save_atlas(self, base_path):
+        """캐시된 아이콘을 base_path.png(아틀라스)와 base_path.json(인덱스)으로 저장합니다.
+
+        새로 그린 아이콘이 없으면 저장하지 않으며, 저장 여부를 반환합니다.
+        """
+        with self._lock:
+            if not self._dirty or not self._images:
+                return False
+            items = list(self._images.items())
+
+        # 선반(shelf) 방식 배치: 한 줄이 ATLAS_ROW_WIDTH를 넘으면 다음 줄로
+        boxes = []
+        x = y = row_height = atlas_width = 0
+        for _, image in items:
+            w, h = image.size
+            if x > 0 and x + w > ATLAS_ROW_WIDTH:
+                x = 0
+                y += row_height
+                row_height = 0
+            boxes.append((x, y, w, h))
+            x += w
+            row_height = max(row_height, h)
+            atlas_width = max(atlas_width, x)
+
+        atlas = Image.new("RGBA", (max(atlas_width, 1), max(y + row_height, 1)), (0, 0, 0, 0))
+        entries = []
+        for (key, image), box in zip(items, boxes):
+            atlas.paste(image, box[:2])
+            shape, color, size = key
+            entries.append({"shape": shape, "color": color, "size": list(size), "box": list(box)})
+
+        index = {"version": ICON_ATLAS_VERSION, "icons": entries}
+        # 인덱스와 이미지가 어긋나지 않도록 임시 파일에 쓴 뒤 교체
+        atlas.save(base_path + ".png.part", format="PNG")
+        with open(base_path + ".json.part", "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(base_path + ".png.part", base_path + ".png")
+        os.replace(base_path + ".json.part", base_path + ".json")
+
+        with self._lock:
+            self._dirty = False
+        return True
+
+    def load_atlas(self, base_path):
+        """저장된 아틀라스에서 아이콘을 읽어 캐시에 채우고 읽은 개수를 반환합니다.
+
+        파일이 없거나 버전이 다르거나 손상된 경우 0을 반환하고, 아이콘은 필요할 때 다시 그립니다.
+        """
+        try:
+            with open(base_path + ".json", "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("version") != ICON_ATLAS_VERSION:
+                return 0
+            with Image.open(base_path + ".png") as atlas:
+                atlas = atlas.convert("RGBA")
+                loaded = []
+                for entry in index["icons"]:
+                    x, y, w, h = entry["box"]
+                    key = self.make_key(entry["shape"], entry["color"], entry["size"])
+                    if (w, h) != key[2]:
+                        continue
+                    loaded.append((key, atlas.crop((x, y, x + w, y + h))))
+        except (OSError, ValueError, KeyError, TypeError):
+            return 0
+
+        with self._lock:
+            for key, image in loaded:
+                if key not in self._images:
+                    self._store(key, image)
+        return len(loaded)
+
+# 프로세스 전역 아이콘 캐시 (모든 창에서 공유)
+_icon_cache = IconCache()
+
+def get_icon(shape, color, size=(24, 24)):
+    """공유 캐시에서 버튼 아이콘 PhotoImage를 반환합니다."""
+    return _icon_cache.get_photo(shape, color, size)
+
+def load_icon_atlas(base_path):
+    """앱 시작 시 디스크에 저장된 아이콘 아틀라스를 공유 캐시로 읽어옵니다."""
+    return _icon_cache.load_atlas(base_path)
+
+def save_icon_atlas(base_path):
+    """앱 종료 시 새로 그린 아이콘이 있으면 공유 캐시를 아틀라스로 저장합니다."""
+    try:
+        return _icon_cache.save_atlas(base_path)
+    except OSError:
+        return False
@@ -0,0 +1,292 @@
+import os
+import json
+import time
+import random
+import sqlite3
+import argparse
+from bisect import bisect
+from itertools import accumulate
+from collections import namedtuple
+from datetime import date, timedelta
+
+import schema
+from gamification import GamificationState
+
+# 생성된 기록 한 건 (timestamp: 종료 시각 문자열, ts/day/hour/start_day: logs의 파생 컬럼과 같은 값)
+GeneratedLog = namedtuple("GeneratedLog", ["timestamp", "duration", "task", "status", "ts", "day", "hour", "start_day"])
+
+# 기본 작업 어휘 (이름, 가중치). 빈 이름은 작업 없이 기록한 경우
+DEFAULT_TASKS = (
+    ("", 20), ("Study", 18), ("Work", 16), ("Coding", 14), ("Reading", 10), ("Writing", 8),
+    ("Exercise", 5), ("English", 4), ("Math", 3), ("Side Project", 2),
+)
+
+# 집중 시간(분)과 가중치
+DEFAULT_DURATIONS = ((25, 70), (50, 12), (15, 8), (45, 6), (90, 4))
+
+# 월~일 요일별 세션 수 배율
+DEFAULT_WEEKDAY_FACTORS = (1.0, 1.0, 1.0, 1.0, 0.9, 0.5, 0.4)
+
+# 시작 시각(0~23시)별 가중치: 오전/오후/저녁 세 번의 집중 구간
+DEFAULT_HOUR_WEIGHTS = (
+    0, 0, 0, 0, 0, 0, 1, 2,      # 0~7시
+    5, 9, 10, 8, 3, 6, 9, 9,     # 8~15시
+    8, 6, 3, 5, 7, 6, 3, 1,      # 16~23시
+)
+
+# 같은 날 세션 사이의 휴식(초): 최소 1분 ~ 최대 15분
+SESSION_GAP = (60, 900)
+
+def _weighted(pairs):
+    """[(값, 가중치)]를 bisect로 뽑을 수 있도록 (값 목록, 누적 가중치)로 변환합니다."""
+    pairs = list(pairs)
+    values = [value for value, _ in pairs]
+    return values, list(accumulate(weight for _, weight in pairs))
+
+class LogGenerator:
+    """시드 기반으로 재현 가능한 대량의 가상 집중 기록을 생성합니다.
+
+    날짜마다 쉬는 날(gap_rate)과 장기 휴식(vacation_rate, 최대 vacation_days일)을 먼저 정하고,
+    요일 배율과 시간대 가중치에 따라 세션을 배치합니다. 하루의 세션은 서로 겹치지 않고 자정을 넘기지 않도록
+    휴식을 사이에 두고 차례로 놓입니다. 같은 설정과 시드면 항상 같은 기록이 나옵니다.
+    """
+
+    def __init__(self, seed=0, tasks=DEFAULT_TASKS, durations=DEFAULT_DURATIONS, sessions_per_day=6.0,
+                 weekday_factors=DEFAULT_WEEKDAY_FACTORS, hour_weights=DEFAULT_HOUR_WEIGHTS,
+                 failure_rate=0.08, failure_statuses=("fail",), gap_rate=0.1, vacation_rate=0.01, vacation_days=14):
+        self.seed = seed
+        self.tasks = [(name or "", weight) for name, weight in tasks]
+        self.durations = list(durations)
+        self.sessions_per_day = sessions_per_day
+        self.weekday_factors = tuple(weekday_factors)
+        self.hour_weights = tuple(hour_weights)
+        self.failure_rate = failure_rate
+        self.failure_statuses = tuple(failure_statuses)
+        self.gap_rate = gap_rate
+        self.vacation_rate = vacation_rate
+        self.vacation_days = vacation_days
+
+    def active_ratio(self):
+        """쉬는 날/장기 휴식을 제외하고 기록이 있을 것으로 기대되는 날의 비율"""
+        vacation = self.vacation_rate * (self.vacation_days + 1) / 2
+        return max(0.01, (1 - self.gap_rate) * (1 - min(0.9, vacation)))
+
+    def fit_rows(self, rows, days):
+        """days일 동안 약 rows개가 생성되도록 하루 평균 세션 수를 조정합니다."""
+        weekday = sum(self.weekday_factors) / len(self.weekday_factors)
+        self.sessions_per_day = rows / (days * self.active_ratio() * weekday)
+        return self.sessions_per_day
+
+    def max_sessions_per_day(self):
+        """가장 짧은 세션과 최소 휴식으로 하루(자정 전)에 겹치지 않게 넣을 수 있는 최대 세션 수"""
+        shortest = min(duration for duration, _ in self.durations) * 60
+        return 86400 // (shortest + SESSION_GAP[0])
+
+    def plan(self, start_day, end_day, limit=None):
+        """날짜별 세션 수 [(date, 개수)]를 날짜순으로 정합니다.
+
+        end_day부터 과거로 채워 가므로 기록은 항상 end_day까지 이어집니다. limit이 있으면 정확히 limit개가
+        되도록 가장 오래된 날을 자르고, start_day까지 부족하면 그 이전 날짜로 이어서 채웁니다.
+        """
+        rng = random.Random(self.seed)
+        max_count = self.max_sessions_per_day()
+        days = []
+        total = 0
+        vacation_left = 0
+        day = end_day
+        while day >= start_day or (limit is not None and total < limit and self.sessions_per_day > 0):
+            current, day = day, day - timedelta(days=1)
+            if limit is not None and total >= limit:
+                break
+            if vacation_left > 0:
+                vacation_left -= 1
+                continue
+            if rng.random() < self.vacation_rate:
+                vacation_left = rng.randint(2, max(2, self.vacation_days)) - 1
+                continue
+            if rng.random() < self.gap_rate:
+                continue
+            # 평균 주변으로 흔들리는 세션 수 (0 이상)
+            mean = self.sessions_per_day * self.weekday_factors[current.weekday()]
+            count = min(max_count, max(0, int(rng.gauss(mean, mean * 0.35) + 0.5)))
+            if limit is not None:
+                count = min(count, limit - total)
+            if count:
+                days.append((current, count))
+                total += count
+        days.reverse()
+        return days
+
+    def generate(self, start_day, end_day, limit=None):
+        """start_day부터 end_day까지(date, 포함) 시간순으로 GeneratedLog를 생성합니다. 최대 limit개."""
+        rng = random.Random(self.seed + 1)
+        task_names, task_cum = _weighted(self.tasks)
+        duration_values, duration_cum = _weighted(self.durations)
+        hour_values, hour_cum = _weighted(enumerate(self.hour_weights))
+        failure_rate = self.failure_rate
+        shortest = min(duration_values)
+
+        for current, count in self.plan(start_day, end_day, limit):
+            day_str = current.strftime("%Y-%m-%d")
+            durations = rng.choices(duration_values, cum_weights=duration_cum, k=count)
+            hours = rng.choices(hour_values, cum_weights=hour_cum, k=count)
+            wanted = sorted(hour * 3600 + rng.randrange(3600) for hour in hours)
+            gaps = [rng.randint(*SESSION_GAP) for _ in range(count)]
+            # 하루에 다 들어가지 않으면 긴 세션부터 가장 짧은 길이로 줄임 (plan이 최대 세션 수를 보장)
+            while sum(durations) * 60 + count * SESSION_GAP[0] > 86400:
+                longest = max(range(count), key=durations.__getitem__)
+                durations[longest] = shortest
+
+            # 원하는 시작 시각 순서대로 놓되, 앞 세션 종료 + 휴식 이후에 시작
+            starts = []
+            free = 0
+            for want, duration, gap in zip(wanted, durations, gaps):
+                start = max(want, free)
+                starts.append(start)
+                free = start + duration * 60 + gap
+            # 자정을 넘기는 세션은 최소 휴식 간격을 유지하며 뒤에서부터 앞으로 당김
+            latest = 86399
+            for i in range(count - 1, -1, -1):
+                starts[i] = min(starts[i], latest - durations[i] * 60)
+                latest = starts[i] - SESSION_GAP[0]
+
+            ends = [start + duration * 60 for start, duration in zip(starts, durations)]
+            tasks = rng.choices(task_names, cum_weights=task_cum, k=len(ends))
+            y, m, d = current.year, current.month, current.day
+            midnight = int(time.mktime((y, m, d, 0, 0, 0, 0, 0, -1)))
+            # 서머타임 전환이 없는 날은 자정 기준 덧셈으로 epoch 계산
+            uniform = int(time.mktime((y, m, d, 23, 59, 59, 0, 0, -1))) - midnight == 86399
+            for start, end, duration, task in zip(starts, ends, durations, tasks):
+                hour = start // 3600
+                h, rest = divmod(end, 3600)
+                mi, s = divmod(rest, 60)
+                status = rng.choice(self.failure_statuses) if rng.random() < failure_rate else "success"
+                ts = midnight + end if uniform else int(time.mktime((y, m, d, h, mi, s, 0, 0, -1)))
+                yield GeneratedLog(f"{day_str} {h:02d}:{mi:02d}:{s:02d}", duration, task, status, ts, day_str, hour, day_str)
+
+def default_range(years=3, end_day=None):
+    """오늘(또는 end_day)로 끝나는 years년 범위 (start_day, end_day)"""
+    end_day = end_day or date.today()
+    return end_day - timedelta(days=int(years * 365) - 1), end_day
+
+def write_db(path, logs, batch_size=50000):
+    """생성된 기록을 로그 DB에 대량 삽입하고 삽입된 행 수를 반환합니다.
+
+    트리거를 잠시 제거한 채 executemany로 넣은 뒤 집계 테이블을 한 번에 다시 만들고 트리거를 복구합니다.
+    기존 DB에 추가하는 경우 같은 시각의 기록은 건너뜁니다.
+    """
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=OFF")
+        schema.migrate(conn)
+
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("BEGIN")
+        schema.drop_triggers(conn)
+        # 보조 인덱스도 삽입 후 한 번에 다시 만드는 편이 빠름 (기본 키 인덱스는 유지)
+        indexes = conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'logs' AND sql IS NOT NULL").fetchall()
+        for name, _ in indexes:
+            conn.execute(f"DROP INDEX {name}")
+        task_ids = {}
+        inserted = 0
+        batch = []
+
+        def flush():
+            return conn.executemany("""INSERT OR IGNORE INTO logs (timestamp, event, duration, status, ts, day, hour, start_day, task_id)
+                                       VALUES (?, 'godmode_complete', ?, ?, ?, ?, ?, ?, ?)""", batch).rowcount
+
+        for log in logs:
+            task_id = task_ids.get(log.task)
+            if task_id is None:
+                conn.execute("INSERT OR IGNORE INTO tasks (name) VALUES (?)", (log.task,))
+                task_id = task_ids[log.task] = conn.execute("SELECT id FROM tasks WHERE name = ?", (log.task,)).fetchone()[0]
+            batch.append((log.timestamp, log.duration, log.status, log.ts, log.day, log.hour, log.start_day, task_id))
+            if len(batch) >= batch_size:
+                inserted += flush()
+                batch.clear()
+        if batch:
+            inserted += flush()
+
+        for _, sql in indexes:
+            conn.execute(sql)
+        schema.rebuild_rollups(conn)
+        GamificationState.recompute(conn)
+        schema.create_triggers(conn)
+        conn.commit()
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return inserted
+    except Exception:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+def write_legacy(path, logs, invalid_rate=0.0, seed=0):
+    """생성된 기록을 레거시 텍스트 로그(한 줄에 JSON 하나) 형식으로 저장하고 기록한 줄 수를 반환합니다.
+
+    invalid_rate > 0이면 그 비율만큼 깨진 줄을 섞어 이관(LegacyLogMigrator)의 오류 처리 경로도 검증할 수 있습니다.
+    """
+    rng = random.Random(seed)
+    broken = ("not json", '{"duration": 25}', '{"timestamp": "2020-01-01 ', "")
+    lines = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for log in logs:
+            if invalid_rate and rng.random() < invalid_rate:
+                f.write(rng.choice(broken) + "\n")
+                lines += 1
+            entry = {"timestamp": log.timestamp, "event": "godmode_complete", "duration": log.duration,
+                     "task": log.task or None, "status": log.status}
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            lines += 1
+    return lines
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="God-Mode Timer 가상 로그 DB 생성기")
+    parser.add_argument("--db", help="생성할 로그 DB 경로 (예: godmode_log.db)")
+    parser.add_argument("--legacy", help="같은 기록을 레거시 텍스트 로그로도 저장할 경로 (예: godmode_log.txt)")
+    parser.add_argument("--rows", type=int, help="생성할 기록 수 (지정 시 하루 세션 수를 자동 조정)")
+    parser.add_argument("--years", type=float, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sessions-per-day", type=float, default=6.0)
+    parser.add_argument("--tasks", help="쉼표로 구분한 작업 어휘 (같은 가중치)")
+    parser.add_argument("--failure-rate", type=float, default=0.08)
+    parser.add_argument("--gap-rate", type=float, default=0.1)
+    parser.add_argument("--vacation-rate", type=float, default=0.01)
+    parser.add_argument("--invalid-rate", type=float, default=0.0, help="레거시 로그에 섞을 깨진 줄 비율")
+    parser.add_argument("--force", action="store_true", help="이미 있는 파일을 덮어씀")
+    args = parser.parse_args(argv)
+
+    if not args.db and not args.legacy:
+        parser.error("--db 또는 --legacy 중 하나 이상을 지정하세요")
+    for path in (args.db, args.legacy):
+        if path and os.path.exists(path):
+            if not args.force:
+                parser.error(f"{path} 파일이 이미 있습니다 (--force로 덮어쓰기)")
+            os.remove(path)
+
+    options = dict(seed=args.seed, sessions_per_day=args.sessions_per_day, failure_rate=args.failure_rate,
+                   gap_rate=args.gap_rate, vacation_rate=args.vacation_rate)
+    if args.tasks:
+        options["tasks"] = [(name.strip(), 1) for name in args.tasks.split(",")]
+    generator = LogGenerator(**options)
+    start_day, end_day = default_range(args.years)
+    if args.rows:
+        generator.fit_rows(args.rows, (end_day - start_day).days + 1)
+
+    def logs():
+        return generator.generate(start_day, end_day, limit=args.rows)
+
+    if args.db:
+        started = time.perf_counter()
+        rows = write_db(args.db, logs())
+        elapsed = time.perf_counter() - started
+        print(f"💾 {args.db}: {rows:,} rows in {elapsed:.2f}s ({rows / elapsed if elapsed > 0 else 0:,.0f} rows/s)")
+    if args.legacy:
+        lines = write_legacy(args.legacy, logs(), args.invalid_rate, args.seed)
+        print(f"📝 {args.legacy}: {lines:,} lines")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+import json
+import os
+import time
+
+class LegacyLogMigrator:
+    """기존 텍스트 로그(godmode_log.txt, 한 줄에 JSON 하나)를 SQLite DB로 일괄 이관합니다.
+
+    한 번의 step()은 최대 batch_size개의 행을 executemany로 삽입하고, 읽은 파일 위치(바이트 오프셋)를
+    같은 트랜잭션 안에서 meta 테이블에 체크포인트로 기록합니다. 따라서 중간에 앱이 종료되어도
+    다음 실행 시 마지막 체크포인트부터 이어서 진행합니다.
+    """
+
+    BATCH_SIZE = 2000
+    CHECKPOINT_KEY = "legacy_migration_offset"
+    INSERT_SQL = "INSERT OR IGNORE INTO logs (timestamp, event, duration, task, status) VALUES (?, 'godmode_complete', ?, ?, ?)"
+
+    def __init__(self, txt_path, session_factory, batch_size=None):
+        self.txt_path = txt_path
+        self.session_factory = session_factory # 트랜잭션 컨텍스트를 반환하는 함수 (utils.db_session)
+        self.batch_size = batch_size or self.BATCH_SIZE
+        self.backup_path = None
+        self.metrics = {
+            "rows_read": 0,     # 파싱에 성공한 행
+            "inserted": 0,      # 새로 추가된 행
+            "duplicates": 0,    # 이미 DB에 있어 건너뛴 행
+            "invalid": 0,       # JSON 오류/timestamp 없음
+            "batches": 0,
+            "bytes_done": 0,
+            "bytes_total": 0,
+            "elapsed_sec": 0.0,
+            "done": False,
+        }
+
+    def pending(self):
+        """이관할 텍스트 로그 파일이 남아 있으면 True를 반환합니다."""
+        return os.path.exists(self.txt_path)
+
+    def progress(self):
+        """파일 기준 진행률(0.0 ~ 1.0)을 반환합니다."""
+        total = self.metrics["bytes_total"]
+        return self.metrics["bytes_done"] / total if total else 1.0
+
+    def step(self):
+        """배치 하나를 이관하고 현재 지표(metrics 복사본)를 반환합니다. 완료 시 metrics['done']이 True."""
+        if self.metrics["done"]:
+            return dict(self.metrics)
+        if not self.pending():
+            self.metrics["done"] = True
+            return dict(self.metrics)
+
+        started = time.perf_counter()
+        batch = []
+        with self.session_factory() as conn:
+            offset = self._load_checkpoint(conn)
+            file_size = os.path.getsize(self.txt_path)
+            if offset > file_size: # 파일이 바뀐 경우 처음부터
+                offset = 0
+
+            with open(self.txt_path, "rb") as f:
+                f.seek(offset)
+                while len(batch) < self.batch_size:
+                    line = f.readline()
+                    if not line:
+                        break
+                    row = self._parse_line(line)
+                    if row:
+                        batch.append(row)
+                offset = f.tell()
+
+            if batch:
+                # rowcount는 트리거(daily_stats)가 변경한 행을 제외한 실제 삽입 수 (중복은 0)
+                inserted = conn.executemany(self.INSERT_SQL, batch).rowcount
+                self.metrics["inserted"] += inserted
+                self.metrics["duplicates"] += len(batch) - inserted
+
+            finished = offset >= file_size
+            if finished:
+                conn.execute("DELETE FROM meta WHERE key = ?", (self.CHECKPOINT_KEY,))
+            else:
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (self.CHECKPOINT_KEY, str(offset)))
+
+        self.metrics["rows_read"] += len(batch)
+        self.metrics["batches"] += 1
+        self.metrics["bytes_done"] = offset
+        self.metrics["bytes_total"] = file_size
+        self.metrics["elapsed_sec"] += time.perf_counter() - started
+
+        if finished:
+            self._backup_source()
+            self.metrics["done"] = True
+        return dict(self.metrics)
+
+    def run(self, progress=None):
+        """완료될 때까지 step()을 반복하고 최종 지표를 반환합니다. progress(metrics)는 배치마다 호출됩니다."""
+        while True:
+            metrics = self.step()
+            if progress:
+                progress(metrics)
+            if metrics["done"]:
+                return metrics
+
+    def summary(self):
+        """지표를 사람이 읽을 수 있는 한 줄 요약으로 반환합니다."""
+        m = self.metrics
+        rate = m["rows_read"] / m["elapsed_sec"] if m["elapsed_sec"] > 0 else 0
+        return (f"성공: {m['inserted']}, 중복/건너뜀: {m['duplicates']}, 오류: {m['invalid']}, "
+                f"배치 {m['batches']}회, {m['elapsed_sec']:.2f}초 ({rate:,.0f}행/초)")
+
+    def _parse_line(self, line):
+        try:
+            entry = json.loads(line.decode("utf-8").strip() or "null")
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            self.metrics["invalid"] += 1
+            return None
+        if not entry:
+            return None # 빈 줄
+        if not isinstance(entry, dict) or not isinstance(entry.get("timestamp"), str) or not entry["timestamp"]:
+            self.metrics["invalid"] += 1
+            return None
+        try:
+            duration = int(entry.get("duration", 25))
+        except (TypeError, ValueError):
+            self.metrics["invalid"] += 1
+            return None
+        # 배치 전체가 바인딩 오류로 실패하지 않도록 문자열로 정규화
+        task = entry.get("task")
+        if task is not None and not isinstance(task, str):
+            task = str(task)
+        return (entry["timestamp"], duration, task, str(entry.get("status", "success")))
+
+    def _load_checkpoint(self, conn):
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (self.CHECKPOINT_KEY,)).fetchone()
+        try:
+            return int(row[0]) if row else 0
+        except (TypeError, ValueError):
+            return 0
+
+    def _backup_source(self):
+        # 이관 완료 후 원본 파일 이름 변경 (백업)
+        backup_path = self.txt_path + ".migrated"
+        if os.path.exists(backup_path):
+            backup_path = self.txt_path + f".migrated_{int(time.time())}"
+        os.rename(self.txt_path, backup_path)
+        self.backup_path = backup_path
@@ -0,0 +1,158 @@
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+class RingBuffer:
+    """최근 capacity개의 값만 보관하는 고정 크기 버퍼 (가득 차면 가장 오래된 값을 덮어씀)"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._items = [0.0] * capacity
+        self._next = 0
+        self.total = 0 # 지금까지 기록된 전체 개수
+
+    def append(self, value):
+        self._items[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        self.total += 1
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    def values(self):
+        """보관 중인 값을 오래된 순으로 반환합니다."""
+        if self.total < self.capacity:
+            return self._items[:self.total]
+        return self._items[self._next:] + self._items[:self._next]
+
+def percentile(sorted_values, pct):
+    """정렬된 값 목록에서 pct(0~100) 백분위 값을 반환합니다 (최근접 순위 방식)."""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(pct / 100 * len(sorted_values))
+    return sorted_values[max(0, min(len(sorted_values), rank) - 1)]
+
+class PerfRecorder:
+    """구간별 실행 시간(ms)과 호출 시각을 링 버퍼에 기록하는 계측기
+
+    핫패스에서 호출되므로 기록은 perf_counter 두 번과 버퍼 쓰기만 수행하고,
+    통계(백분위, fps) 계산은 오버레이/덤프 시점에만 합니다. DB 워커 스레드에서도 기록하므로 잠금을 사용합니다.
+    """
+
+    CAPACITY = 512
+
+    def __init__(self, capacity=None, clock=time.perf_counter):
+        self.capacity = capacity or self.CAPACITY
+        self.clock = clock
+        self.enabled = True
+        self._durations = {} # 이름 -> RingBuffer (ms)
+        self._starts = {}    # 이름 -> RingBuffer (호출 시각, 초)
+        self._lock = threading.Lock()
+
+    def record(self, name, duration_ms, started=None):
+        if not self.enabled:
+            return
+        if started is None:
+            started = self.clock()
+        with self._lock:
+            buf = self._durations.get(name)
+            if buf is None:
+                buf = self._durations[name] = RingBuffer(self.capacity)
+                self._starts[name] = RingBuffer(self.capacity)
+            buf.append(duration_ms)
+            self._starts[name].append(started)
+
+    @contextmanager
+    def measure(self, name):
+        """with 블록의 실행 시간을 기록합니다."""
+        started = self.clock()
+        try:
+            yield
+        finally:
+            self.record(name, (self.clock() - started) * 1000, started)
+
+    def timed(self, name):
+        """함수 실행 시간을 기록하는 데코레이터"""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                started = self.clock()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(name, (self.clock() - started) * 1000, started)
+            return wrapper
+        return decorator
+
+    def names(self):
+        with self._lock:
+            return sorted(self._durations)
+
+    def stats(self, *names, prefix=None):
+        """지정한 구간(또는 prefix로 시작하는 모든 구간)을 합친 통계를 반환합니다."""
+        with self._lock:
+            if prefix is not None:
+                names = [n for n in self._durations if n.startswith(prefix)]
+            values = []
+            total = 0
+            for name in names:
+                buf = self._durations.get(name)
+                if buf is not None:
+                    values.extend(buf.values())
+                    total += buf.total
+        values.sort()
+        return {
+            "count": total,
+            "samples": len(values),
+            "mean_ms": sum(values) / len(values) if values else 0.0,
+            "p50_ms": percentile(values, 50),
+            "p99_ms": percentile(values, 99),
+            "max_ms": values[-1] if values else 0.0,
+        }
+
+    def rate(self, name, window=5.0):
+        """최근 window초 동안의 초당 호출 횟수 (draw_timer 기준이면 fps)"""
+        now = self.clock()
+        with self._lock:
+            buf = self._starts.get(name)
+            starts = buf.values() if buf is not None else []
+        recent = [t for t in starts if now - t <= window]
+        return len(recent) / window
+
+    def snapshot(self):
+        """모든 구간의 통계를 JSON으로 직렬화 가능한 딕셔너리로 반환합니다."""
+        return {
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "capacity": self.capacity,
+            "fps": self.rate("draw_timer"),
+            "sections": {name: self.stats(name) for name in self.names()},
+            "db": self.stats(prefix="db."),
+        }
+
+    def dump_json(self, path):
+        """현재 통계를 JSON 파일로 저장하고 경로를 반환합니다."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=4, ensure_ascii=False)
+        return path
+
+    def overlay_text(self):
+        """화면 오버레이에 표시할 여러 줄 요약 문자열"""
+        frame = self.stats("draw_timer")
+        db = self.stats(prefix="db.")
+        return (f"fps {self.rate('draw_timer'):5.1f}\n"
+                f"frame p50 {frame['p50_ms']:5.2f} p99 {frame['p99_ms']:5.2f} ms\n"
+                f"db    p50 {db['p50_ms']:5.2f} p99 {db['p99_ms']:5.2f} ms ({db['count']})")
+
+    def clear(self):
+        with self._lock:
+            self._durations.clear()
+            self._starts.clear()
+
+# 프로세스 전역 계측기
+recorder = PerfRecorder()
+timed = recorder.timed
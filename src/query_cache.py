@@ -0,0 +1,46 @@
+from collections import OrderedDict
+
+MISS = object() # 캐시에 없음을 나타내는 표식 (None도 유효한 결과이므로 구분)
+
+class QueryCache:
+    """(조회 이름, 파라미터) 키로 조회 결과를 보관하는 LRU 캐시
+
+    모든 항목은 하나의 데이터 버전에 묶여 있으며, validate()에 다른 버전이 들어오면 전체를 비웁니다.
+    가득 차면 가장 오래 사용되지 않은 항목부터 제거합니다. 잠금은 호출자(DB 세션)가 담당합니다.
+    """
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+
+    def validate(self, version):
+        """현재 데이터 버전을 알려줍니다. 캐시된 버전과 다르면 모든 항목을 버립니다."""
+        if version != self.version:
+            self.entries.clear()
+            self.version = version
+
+    def get(self, key):
+        """키에 해당하는 결과를 반환합니다 (없으면 MISS)."""
+        value = self.entries.get(key, MISS)
+        if value is MISS:
+            self.misses += 1
+        else:
+            self.entries.move_to_end(key)
+            self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.version = None
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,74 @@
+import time
+
+class ResizeCoalescer:
+    """창 <Configure> 이벤트를 프레임 단위로 모아 처리합니다.
+
+    드래그 중에는 이벤트가 아무리 많이 와도 프레임(FRAME_MS)당 한 번만 on_frame(redraw)을 호출하고,
+    마지막 이벤트 이후 SETTLE_MS 동안 추가 이벤트가 없으면(드래그 종료) on_settle(event)를 한 번 호출합니다.
+    event는 마지막 정착 이후 들어온 이벤트이며, 다시 그리기 요청만 있었다면 None입니다.
+    DPI 확인, 화면 가장자리 스냅처럼 비싼 작업은 on_settle에서만 수행합니다.
+    """
+
+    FRAME_MS = 16     # 약 60fps
+    SETTLE_MS = 150   # 이 시간 동안 이벤트가 없으면 드래그가 끝난 것으로 판단
+
+    def __init__(self, root, on_frame, on_settle, clock=time.monotonic):
+        self.root = root
+        self.on_frame = on_frame
+        self.on_settle = on_settle
+        self.clock = clock
+        self.frame_job = None
+        self.settle_job = None
+        self.last_event = None
+        self.last_time = 0.0
+        self.redraw = False
+        self.pending_events = 0 # 현재 프레임에 합쳐진 이벤트 수 (디버깅/계측용)
+
+    def notify(self, event=None, redraw=False):
+        """<Configure> 이벤트를 기록합니다. redraw=True면 다음 프레임에 캔버스를 다시 그립니다."""
+        if event is not None:
+            self.last_event = event
+        self.redraw = self.redraw or redraw
+        self.last_time = self.clock()
+        self.pending_events += 1
+
+        if self.frame_job is None:
+            self.frame_job = self.root.after(self.FRAME_MS, self._run_frame)
+        # 정착 타이머는 이벤트마다 다시 걸지 않고, 만료 시 마지막 이벤트 시각을 확인하여 연장
+        if self.settle_job is None:
+            self.settle_job = self.root.after(self.SETTLE_MS, self._check_settle)
+
+    def _run_frame(self):
+        self.frame_job = None
+        redraw = self.redraw
+        self.redraw = False
+        self.pending_events = 0
+        self.on_frame(redraw)
+
+    def _check_settle(self):
+        self.settle_job = None
+        idle_ms = (self.clock() - self.last_time) * 1000
+        if idle_ms < self.SETTLE_MS:
+            self.settle_job = self.root.after(max(1, int(self.SETTLE_MS - idle_ms)), self._check_settle)
+            return
+
+        # 아직 처리되지 않은 프레임이 있으면 정착 처리에 합침
+        if self.frame_job is not None:
+            self.root.after_cancel(self.frame_job)
+            self.frame_job = None
+        self.redraw = False
+        self.pending_events = 0
+        # 이벤트는 한 번만 전달 (이후 다시 그리기만 요청된 정착에서 오래된 창 위치로 스냅하지 않도록)
+        event, self.last_event = self.last_event, None
+        self.on_settle(event)
+
+    def cancel(self):
+        """예약된 처리를 모두 취소합니다 (창 종료 시)."""
+        for job in (self.frame_job, self.settle_job):
+            if job is not None:
+                try:
+                    self.root.after_cancel(job)
+                except Exception:
+                    pass
+        self.frame_job = None
+        self.settle_job = None
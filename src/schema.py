@@ -0,0 +1,346 @@
+from datetime import timedelta
+
+# 로그 DB 스키마와 버전별 마이그레이션 (PRAGMA user_version 기준)
+#
+# 각 마이그레이션은 한 트랜잭션 안에서 실행되고, 성공 시 user_version을 해당 버전으로 올립니다.
+# 새 스키마 변경은 MIGRATIONS 끝에 함수를 추가하는 방식으로만 수행합니다 (기존 함수 수정 금지).
+
+# logs 변경 시 daily_stats를 증분 갱신하는 트리거 (삽입/삭제/수정 경로 모두 동일하게 반영)
+DAILY_STATS_TRIGGERS = (
+    """CREATE TRIGGER IF NOT EXISTS trg_logs_insert_daily AFTER INSERT ON logs
+       WHEN NEW.status = 'success'
+       BEGIN
+           INSERT OR IGNORE INTO daily_stats (day) VALUES (substr(NEW.timestamp, 1, 10));
+           UPDATE daily_stats SET count = count + 1, duration = duration + IFNULL(NEW.duration, 0)
+           WHERE day = substr(NEW.timestamp, 1, 10);
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS trg_logs_delete_daily AFTER DELETE ON logs
+       WHEN OLD.status = 'success'
+       BEGIN
+           UPDATE daily_stats SET count = count - 1, duration = duration - IFNULL(OLD.duration, 0)
+           WHERE day = substr(OLD.timestamp, 1, 10);
+           DELETE FROM daily_stats WHERE day = substr(OLD.timestamp, 1, 10) AND count <= 0;
+       END""",
+    # 작업명(task)만 바뀌는 경우는 집계에 영향이 없으므로 트리거 대상에서 제외
+    """CREATE TRIGGER IF NOT EXISTS trg_logs_update_daily AFTER UPDATE OF timestamp, duration, status ON logs
+       BEGIN
+           UPDATE daily_stats SET count = count - 1, duration = duration - IFNULL(OLD.duration, 0)
+           WHERE day = substr(OLD.timestamp, 1, 10) AND OLD.status = 'success';
+           DELETE FROM daily_stats WHERE day = substr(OLD.timestamp, 1, 10) AND count <= 0;
+           INSERT OR IGNORE INTO daily_stats (day) SELECT substr(NEW.timestamp, 1, 10) WHERE NEW.status = 'success';
+           UPDATE daily_stats SET count = count + 1, duration = duration + IFNULL(NEW.duration, 0)
+           WHERE day = substr(NEW.timestamp, 1, 10) AND NEW.status = 'success';
+       END""",
+)
+
+# timestamp(로컬 시각 문자열)로부터 ts/day/hour/start_day를 계산하는 SQL 식
+# ts: UTC 기준 epoch 초, day: 로컬 날짜(종료 시각 기준), hour: 로컬 시작 시각의 시(0~23)
+# start_day: 로컬 시작 시각의 날짜 (시간대/요일 분석은 hour와 같은 시작 시각 기준으로 묶어야 자정을 넘긴 기록이 어긋나지 않음)
+_TS_SQL = "CAST(strftime('%s', {row}.timestamp, 'utc') AS INTEGER)"
+_DAY_SQL = "substr({row}.timestamp, 1, 10)"
+_HOUR_SQL = "CAST(strftime('%H', {row}.timestamp, '-' || IFNULL({row}.duration, 0) || ' minutes') AS INTEGER)"
+_START_DAY_SQL = "date({row}.timestamp, '-' || IFNULL({row}.duration, 0) || ' minutes')"
+
+def _time_columns_sql(row):
+    return (f"ts = {_TS_SQL.format(row=row)}, day = {_DAY_SQL.format(row=row)}, "
+            f"hour = {_HOUR_SQL.format(row=row)}")
+
+def _start_day_sql(row):
+    return f"start_day = {_START_DAY_SQL.format(row=row)}"
+
+def _time_column_triggers(start_day=True):
+    """값을 직접 넣지 않은 삽입(레거시 이관 등)이나 시각/시간 수정 시 파생 컬럼을 채우는 트리거 (v2~v5는 start_day 없음)"""
+    columns = _time_columns_sql("NEW") + (f", {_start_day_sql('NEW')}" if start_day else "")
+    fill_cond = "NEW.ts IS NULL OR NEW.day IS NULL OR NEW.hour IS NULL" + (" OR NEW.start_day IS NULL" if start_day else "")
+    return (
+        f"""CREATE TRIGGER IF NOT EXISTS trg_logs_fill_time AFTER INSERT ON logs
+       WHEN {fill_cond}
+       BEGIN
+           UPDATE logs SET {columns} WHERE timestamp = NEW.timestamp;
+       END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_logs_update_time AFTER UPDATE OF timestamp, duration ON logs
+       BEGIN
+           UPDATE logs SET {columns} WHERE timestamp = NEW.timestamp;
+       END""",
+    )
+
+TIME_COLUMN_TRIGGERS = _time_column_triggers()
+
+# 작업별 집계 조건 (성공 기록 + 작업/날짜가 확정된 행만)
+_TASK_COND = "{row}.status = 'success' AND {row}.task_id IS NOT NULL AND {row}.day IS NOT NULL"
+
+def _task_stats_add_sql(row):
+    cond = _TASK_COND.format(row=row)
+    return f"""
+           INSERT OR IGNORE INTO task_daily_stats (day, task_id) SELECT {row}.day, {row}.task_id WHERE {cond};
+           UPDATE task_daily_stats SET count = count + 1, duration = duration + IFNULL({row}.duration, 0)
+           WHERE day = {row}.day AND task_id = {row}.task_id AND {cond};
+           UPDATE tasks SET count = count + 1, duration = duration + IFNULL({row}.duration, 0)
+           WHERE id = {row}.task_id AND {cond};"""
+
+def _task_stats_sub_sql(row):
+    cond = _TASK_COND.format(row=row)
+    return f"""
+           UPDATE task_daily_stats SET count = count - 1, duration = duration - IFNULL({row}.duration, 0)
+           WHERE day = {row}.day AND task_id = {row}.task_id AND {cond};
+           DELETE FROM task_daily_stats WHERE day = {row}.day AND task_id = {row}.task_id AND count <= 0;
+           UPDATE tasks SET count = count - 1, duration = duration - IFNULL({row}.duration, 0)
+           WHERE id = {row}.task_id AND {cond};"""
+
+# 작업명 문자열로 삽입/수정된 행을 tasks의 id로 치환하고 logs.task는 비움 (작업 없음은 빈 이름 '')
+_INTERN_TASK_SQL = """
+           INSERT OR IGNORE INTO tasks (name) VALUES (IFNULL(NEW.task, ''));
+           UPDATE logs SET task_id = (SELECT id FROM tasks WHERE name = IFNULL(NEW.task, '')), task = NULL
+           WHERE timestamp = NEW.timestamp;"""
+
+# 작업 차원 테이블(tasks)과 작업별 집계(tasks 누적값, task_daily_stats 날짜별)를 유지하는 트리거
+# 집계 트리거는 행의 이전 상태를 빼고 이후 상태를 더하므로, 다른 트리거가 컬럼을 나눠 채워도 한 번만 반영됩니다.
+TASK_TRIGGERS = (
+    f"""CREATE TRIGGER IF NOT EXISTS trg_logs_intern_task AFTER INSERT ON logs
+       WHEN NEW.task IS NOT NULL OR NEW.task_id IS NULL
+       BEGIN{_INTERN_TASK_SQL}
+       END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_logs_retask AFTER UPDATE OF task ON logs
+       WHEN NEW.task IS NOT NULL
+       BEGIN{_INTERN_TASK_SQL}
+       END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_logs_insert_task AFTER INSERT ON logs
+       BEGIN{_task_stats_add_sql("NEW")}
+       END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_logs_delete_task AFTER DELETE ON logs
+       BEGIN{_task_stats_sub_sql("OLD")}
+       END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_logs_update_task AFTER UPDATE OF task_id, day, duration, status ON logs
+       BEGIN{_task_stats_sub_sql("OLD")}{_task_stats_add_sql("NEW")}
+       END""",
+)
+
+def time_columns(end_dt, duration):
+    """종료 시각(로컬 datetime)과 집중 시간(분)으로 (ts, day, hour, start_day) 값을 계산합니다."""
+    start_dt = end_dt - timedelta(minutes=duration or 0)
+    return int(end_dt.timestamp()), end_dt.strftime("%Y-%m-%d"), start_dt.hour, start_dt.strftime("%Y-%m-%d")
+
+def rebuild_daily_stats(conn):
+    """logs 전체를 다시 집계하여 daily_stats를 재생성하고 집계된 날짜 수를 반환합니다."""
+    conn.execute("DELETE FROM daily_stats")
+    conn.execute("""
+        INSERT INTO daily_stats (day, count, duration)
+        SELECT substr(timestamp, 1, 10), COUNT(*), IFNULL(SUM(duration), 0)
+        FROM logs WHERE status = 'success'
+        GROUP BY substr(timestamp, 1, 10)
+    """)
+    return conn.execute("SELECT COUNT(*) FROM daily_stats").fetchone()[0]
+
+def rebuild_task_stats(conn):
+    """logs 전체를 다시 집계하여 작업별 누적값(tasks)과 날짜별 작업 집계(task_daily_stats)를 재생성합니다."""
+    conn.execute("DELETE FROM task_daily_stats")
+    conn.execute(f"""
+        INSERT INTO task_daily_stats (day, task_id, count, duration)
+        SELECT day, task_id, COUNT(*), IFNULL(SUM(duration), 0)
+        FROM logs WHERE {_TASK_COND.format(row="logs")}
+        GROUP BY day, task_id
+    """)
+    conn.execute("""
+        UPDATE tasks SET
+            count = IFNULL((SELECT SUM(count) FROM task_daily_stats WHERE task_id = tasks.id), 0),
+            duration = IFNULL((SELECT SUM(duration) FROM task_daily_stats WHERE task_id = tasks.id), 0)
+    """)
+    return conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+def _migrate_v1_base(conn):
+    """v1: 기본 로그 테이블, 날짜별 집계(daily_stats), meta 테이블
+
+    user_version 도입 이전에 만들어진 DB도 이 단계를 거치므로 모든 문장은 IF NOT EXISTS로 작성합니다.
+    """
+    conn.execute('''CREATE TABLE IF NOT EXISTS logs
+                 (timestamp TEXT PRIMARY KEY, event TEXT, duration INTEGER, task TEXT, status TEXT)''')
+    conn.execute('''CREATE INDEX IF NOT EXISTS idx_timestamp ON logs (timestamp)''')
+
+    # 날짜별 집계 테이블 (성공 기록만). 새로 만드는 경우 기존 로그로 채움
+    has_rollup = conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='daily_stats'").fetchone()
+    conn.execute('''CREATE TABLE IF NOT EXISTS daily_stats
+                 (day TEXT PRIMARY KEY, count INTEGER NOT NULL DEFAULT 0, duration INTEGER NOT NULL DEFAULT 0)''')
+    for trigger in DAILY_STATS_TRIGGERS:
+        conn.execute(trigger)
+    if not has_rollup:
+        rebuild_daily_stats(conn)
+
+    # 앱 내부 상태 저장용 키-값 테이블 (마이그레이션 체크포인트 등)
+    conn.execute('''CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)''')
+
+def _migrate_v2_time_columns(conn):
+    """v2: 정수 epoch(ts)와 로컬 날짜(day)/시작 시(hour) 컬럼 및 커버링 인덱스"""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(logs)")}
+    for name, col_type in (("ts", "INTEGER"), ("day", "TEXT"), ("hour", "INTEGER")):
+        if name not in columns:
+            conn.execute(f"ALTER TABLE logs ADD COLUMN {name} {col_type}")
+
+    # 기존 행 채우기
+    conn.execute(f"UPDATE logs SET {_time_columns_sql('logs')}")
+
+    # 상태/작업별 날짜 범위 집계를 테이블 접근 없이 처리하는 커버링 인덱스
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_status_day ON logs (status, day, duration)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_task_day ON logs (task, day, duration)")
+    for trigger in _time_column_triggers(start_day=False):
+        conn.execute(trigger)
+
+def _migrate_v3_tasks(conn):
+    """v3: 작업 차원 테이블(tasks)과 작업별 집계, logs.task_id 참조
+
+    기존 작업명 문자열은 tasks로 옮기고 logs.task는 비웁니다. logs.task 컬럼은 작업명으로
+    삽입/수정하는 기존 경로를 위해 남겨두며, 트리거가 즉시 task_id로 치환합니다.
+    """
+    conn.execute('''CREATE TABLE IF NOT EXISTS tasks
+                 (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE,
+                  count INTEGER NOT NULL DEFAULT 0, duration INTEGER NOT NULL DEFAULT 0)''')
+    conn.execute('''CREATE TABLE IF NOT EXISTS task_daily_stats
+                 (day TEXT NOT NULL, task_id INTEGER NOT NULL,
+                  count INTEGER NOT NULL DEFAULT 0, duration INTEGER NOT NULL DEFAULT 0,
+                  PRIMARY KEY (day, task_id)) WITHOUT ROWID''')
+
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(logs)")}
+    if "task_id" not in columns:
+        conn.execute("ALTER TABLE logs ADD COLUMN task_id INTEGER REFERENCES tasks(id)")
+
+    # 기존 작업명 이전
+    conn.execute("INSERT OR IGNORE INTO tasks (name) SELECT DISTINCT IFNULL(task, '') FROM logs WHERE task_id IS NULL")
+    conn.execute("""UPDATE logs SET task_id = (SELECT id FROM tasks WHERE name = IFNULL(logs.task, '')), task = NULL
+                    WHERE task_id IS NULL""")
+
+    # 작업별 조회는 이제 task_id 기준
+    conn.execute("DROP INDEX IF EXISTS idx_logs_task_day")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_task_id_day ON logs (task_id, day)")
+    for trigger in TASK_TRIGGERS:
+        conn.execute(trigger)
+    rebuild_task_stats(conn)
+
+# 새 날짜가 추가될 때의 연속 달성일: 마지막 날 다음 날이면 +1, 더 뒤면 새로 시작, 과거 날짜면 유지(dirty 처리)
+_NEXT_STREAK_SQL = """CASE WHEN last_day IS NULL OR NEW.day > date(last_day, '+1 day') THEN 1
+                           WHEN NEW.day = date(last_day, '+1 day') THEN streak + 1
+                           ELSE streak END"""
+
+# daily_stats 변경을 게이미피케이션 상태(gamification 단일 행)에 O(1)로 반영하는 트리거
+GAMIFICATION_TRIGGERS = (
+    f"""CREATE TRIGGER IF NOT EXISTS trg_daily_insert_game AFTER INSERT ON daily_stats
+       BEGIN
+           UPDATE gamification SET
+               total_count = total_count + NEW.count,
+               total_duration = total_duration + NEW.duration,
+               streak = {_NEXT_STREAK_SQL},
+               longest_streak = MAX(longest_streak, {_NEXT_STREAK_SQL}),
+               dirty = CASE WHEN last_day IS NOT NULL AND NEW.day < last_day THEN 1 ELSE dirty END,
+               last_day = CASE WHEN last_day IS NULL OR NEW.day > last_day THEN NEW.day ELSE last_day END
+           WHERE id = 1;
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS trg_daily_update_game AFTER UPDATE OF count, duration ON daily_stats
+       BEGIN
+           UPDATE gamification SET
+               total_count = total_count + NEW.count - OLD.count,
+               total_duration = total_duration + NEW.duration - OLD.duration
+           WHERE id = 1;
+       END""",
+    # 날짜가 사라지면 연속 기록이 끊길 수 있으므로 다음 조회 때 다시 계산
+    """CREATE TRIGGER IF NOT EXISTS trg_daily_delete_game AFTER DELETE ON daily_stats
+       BEGIN
+           UPDATE gamification SET
+               total_count = total_count - OLD.count,
+               total_duration = total_duration - OLD.duration,
+               dirty = 1
+           WHERE id = 1;
+       END""",
+)
+
+def _migrate_v4_gamification(conn):
+    """v4: 누적 게이미피케이션 상태(총계, 연속/최장 연속 달성일, 마지막 활동일)"""
+    conn.execute('''CREATE TABLE IF NOT EXISTS gamification
+                 (id INTEGER PRIMARY KEY CHECK (id = 1),
+                  total_count INTEGER NOT NULL DEFAULT 0, total_duration INTEGER NOT NULL DEFAULT 0,
+                  streak INTEGER NOT NULL DEFAULT 0, longest_streak INTEGER NOT NULL DEFAULT 0,
+                  last_day TEXT, dirty INTEGER NOT NULL DEFAULT 0)''')
+    # 기존 기록은 첫 조회 시 GamificationState.load()가 계산
+    conn.execute("INSERT OR REPLACE INTO gamification (id, dirty) VALUES (1, 1)")
+    for trigger in GAMIFICATION_TRIGGERS:
+        conn.execute(trigger)
+
+def _migrate_v5_hour_analytics(conn):
+    """v5: 시간대/요일/작업별 분포를 테이블 접근 없이 집계하도록 상태/날짜 커버링 인덱스에 hour, task_id 추가"""
+    conn.execute("DROP INDEX IF EXISTS idx_logs_status_day")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_status_day ON logs (status, day, hour, task_id, duration)")
+
+def _migrate_v6_start_day(conn):
+    """v6: 시작 날짜(start_day) 컬럼과 시간대 분석용 커버링 인덱스
+
+    hour는 시작 시각 기준인데 day는 종료 날짜라서, 자정을 넘긴 기록이 요일/날짜 범위에서 어긋났습니다.
+    시간대/요일/작업별 분포는 이제 start_day로 거르고 묶습니다 (날짜별 집계는 기존대로 day 기준).
+    """
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(logs)")}
+    if "start_day" not in columns:
+        conn.execute("ALTER TABLE logs ADD COLUMN start_day TEXT")
+    conn.execute(f"UPDATE logs SET {_start_day_sql('logs')}")
+
+    # 파생 컬럼 트리거가 start_day도 채우도록 다시 생성
+    conn.execute("DROP TRIGGER IF EXISTS trg_logs_fill_time")
+    conn.execute("DROP TRIGGER IF EXISTS trg_logs_update_time")
+    for trigger in TIME_COLUMN_TRIGGERS:
+        conn.execute(trigger)
+
+    conn.execute("DROP INDEX IF EXISTS idx_logs_status_day")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_status_start_day ON logs (status, start_day, hour, task_id, duration)")
+
+def _all_triggers():
+    return DAILY_STATS_TRIGGERS + TIME_COLUMN_TRIGGERS + TASK_TRIGGERS + GAMIFICATION_TRIGGERS
+
+def drop_triggers(conn):
+    """대량 삽입 전에 집계 트리거를 모두 제거합니다. 이후 create_triggers()와 rebuild_rollups()로 복구합니다."""
+    names = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")]
+    for name in names:
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+    return names
+
+def create_triggers(conn):
+    """현재 스키마 버전의 트리거를 (없으면) 다시 만듭니다."""
+    for trigger in _all_triggers():
+        conn.execute(trigger)
+
+def rebuild_rollups(conn):
+    """트리거 없이 채운 logs로부터 모든 집계(daily_stats, 작업별 집계, 게이미피케이션)를 다시 만듭니다."""
+    rebuild_daily_stats(conn)
+    rebuild_task_stats(conn)
+    # 연속 기록은 다음 조회 때 GamificationState.load()가 계산
+    conn.execute("UPDATE gamification SET dirty = 1 WHERE id = 1")
+
+MIGRATIONS = (
+    _migrate_v1_base,
+    _migrate_v2_time_columns,
+    _migrate_v3_tasks,
+    _migrate_v4_gamification,
+    _migrate_v5_hour_analytics,
+    _migrate_v6_start_day,
+)
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+def get_schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+def migrate(conn):
+    """DB를 최신 스키마 버전으로 올리고 (이전 버전, 현재 버전)을 반환합니다.
+
+    앱보다 새로운 버전의 DB(다운그레이드)는 건드리지 않습니다.
+    """
+    start_version = get_schema_version(conn)
+    version = start_version
+    if conn.in_transaction:
+        conn.commit()
+
+    for target, migration in enumerate(MIGRATIONS[version:], start=version + 1):
+        conn.execute("BEGIN")
+        try:
+            migration(conn)
+            conn.execute(f"PRAGMA user_version = {target}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        version = target
+    return start_version, version
@@ -29,22 +29,28 @@ def open_settings_window(app):
     bg_color = app.colors["bg"]
     fg_color = app.colors["fg"]
     
-    # 초기값 저장 (변경 사항 확인 및 취소 시 복구용)
-    initial_settings = {
-        "work_min": app.setting_work_min,
-        "short_break_min": app.setting_short_break_min,
-        "long_break_min": app.setting_long_break_min,
-        "long_break_interval": app.setting_long_break_interval,
-        "auto_start": app.setting_auto_start,
-        "sound": app.setting_sound,
-        "strict_mode": app.setting_strict_mode,
-        "always_on_top": app.setting_always_on_top,
-        "show_task_input": app.setting_show_task_input,
-        "opacity": app.setting_opacity,
-        "ui_scale": app.setting_ui_scale,
-        "theme": app.setting_theme,
-        "language": app.setting_language
-    }
+    def capture_settings():
+        return {
+            "work_min": app.setting_work_min,
+            "short_break_min": app.setting_short_break_min,
+            "long_break_min": app.setting_long_break_min,
+            "long_break_interval": app.setting_long_break_interval,
+            "auto_start": app.setting_auto_start,
+            "sound": app.setting_sound,
+            "strict_mode": app.setting_strict_mode,
+            "always_on_top": app.setting_always_on_top,
+            "show_task_input": app.setting_show_task_input,
+            "opacity": app.setting_opacity,
+            "ui_scale": app.setting_ui_scale,
+            "theme": app.setting_theme,
+            "language": app.setting_language
+        }
+
+    # 초기값 저장 (변경 사항 확인 및 취소 시 복구용, 숨겼다가 다시 열 때 갱신)
+    initial_settings = capture_settings()
+
+    # 현재 위젯에 적용된 언어/배경색/UI 크기 (앱 설정과 달라지면 다시 열 때 창을 새로 만듦)
+    styled = {"language": app.setting_language, "bg": app.colors["bg"], "ui_scale": app.setting_ui_scale}
 
     # 하단 버튼 영역 (레이아웃 순서 보장을 위해 먼저 배치)
     btn_frame = tk.Frame(sw, bg=bg_color)
@@ -150,13 +156,17 @@ def open_settings_window(app):
         btn_frame_pop = tk.Frame(container, bg=app.colors["bg"])
         btn_frame_pop.pack()
 
-        def do_clear():
-            if clear_all_logs():
+        def on_cleared(success):
+            if success:
                 show_toast(app.loc.get("clear_data_success_title", default="Data Cleared"), 
                            app.loc.get("clear_data_success_msg", default="All logs have been deleted."))
                 app.refresh_today_count()
             else:
                 show_toast(app.loc.get("error"), app.loc.get("clear_data_fail_msg", default="Failed to clear data."))
+
+        def do_clear():
+            # 전체 삭제(VACUUM 포함)는 백그라운드 워커에서 실행
+            app.db_worker.submit(clear_all_logs, callback=on_cleared)
             popup.destroy()
 
         btn_yes = tk.Button(btn_frame_pop, text=app.loc.get("delete_all", default="Delete All"), font=("Helvetica", int(9*sf), "bold"), 
@@ -266,6 +276,7 @@ def open_settings_window(app):
         
         def refresh_ui():
             new_colors = app.colors
+            styled["bg"] = new_colors["bg"]
             
             # Update Settings Window Backgrounds
             sw.configure(bg=new_colors["bg"])
@@ -368,6 +379,7 @@ def open_settings_window(app):
         lbl_ui_scale_val.config(text=f"{int(float(val))}%")
         app.setting_ui_scale = int(float(val))
         app.update_scale_factor()
+        styled["ui_scale"] = app.setting_ui_scale
         
         # 통계 창이 열려있다면 내부 UI만 업데이트
         if hasattr(app, 'stats_window') and app.stats_window and app.stats_window.winfo_exists():
@@ -500,7 +512,7 @@ def open_settings_window(app):
         app.settings_window_y = sw.winfo_y()
         app.settings_window_w = sw.winfo_width()
         app.settings_window_h = sw.winfo_height()
-        sw.destroy()
+        app.windows.hide("settings")
 
     def show_save_popup():
         popup = tk.Toplevel(sw)
@@ -609,7 +621,36 @@ def open_settings_window(app):
             app.refresh_language()
 
         show_toast(app.loc.get("save_settings_toast_title"), app.loc.get("save_settings_toast_msg"))
-        sw.destroy()
+        app.windows.hide("settings")
+
+    def is_stale():
+        return (styled["language"] != app.setting_language or
+                styled["bg"] != app.colors["bg"] or
+                styled["ui_scale"] != app.setting_ui_scale)
+    sw.is_stale = is_stale
+
+    def on_reopen():
+        """숨겨 둔 창을 다시 열 때 입력값을 현재 설정으로 되돌리고 변경 확인 기준값을 다시 잡습니다."""
+        initial_settings.update(capture_settings())
+        var_work.set(initial_settings["work_min"])
+        var_short.set(initial_settings["short_break_min"])
+        var_long.set(initial_settings["long_break_min"])
+        var_interval.set(initial_settings["long_break_interval"])
+        var_auto.set(initial_settings["auto_start"])
+        var_sound.set(initial_settings["sound"])
+        var_strict.set(initial_settings["strict_mode"])
+        var_top.set(initial_settings["always_on_top"])
+        var_task_input.set(initial_settings["show_task_input"])
+        var_opacity.set(initial_settings["opacity"])
+        var_ui_scale.set(initial_settings["ui_scale"])
+        var_theme.set(initial_settings["theme"])
+        var_lang.set(initial_settings["language"])
+        lbl_opacity_val.config(text=f"{int(initial_settings['opacity'] * 100)}%")
+        lbl_ui_scale_val.config(text=f"{initial_settings['ui_scale']}%")
+        update_lang_radio_style()
+        update_radio_style()
+        sw.grab_set()
+    sw.on_reopen = on_reopen
 
     # 저장 버튼 (우측 끝)
     save_btn = tk.Button(btn_frame, text=app.loc.get("save_btn"), font=("Helvetica", int(9*sf), "bold"), bg=app.colors["start_btn_bg"], fg=app.colors["btn_fg"], bd=0, padx=int(15*sf), pady=int(5*sf), command=save_settings)
@@ -624,4 +665,6 @@ def open_settings_window(app):
     restore_btn.bind("<Leave>", lambda e: restore_btn.config(bg=app.colors["btn_bg"]))
 
     # 버전 레이블 배치
-    version_label.pack(side=tk.LEFT, padx=(int(5*sf), 0))
\ No newline at end of file
+    version_label.pack(side=tk.LEFT, padx=(int(5*sf), 0))
+
+    return sw
@@ -0,0 +1,119 @@
+import time
+import argparse
+from collections import namedtuple
+from datetime import datetime, timedelta
+from timer_engine import TimerEngine
+
+# 시뮬레이션 이벤트 (kind: "work_complete" | "break_complete")
+CycleEvent = namedtuple("CycleEvent", ["kind", "mode", "break_type", "start", "end", "today_count"])
+
+class VirtualClock:
+    """TimerEngine에 주입하는 가상 시계 (초 단위)"""
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+class PomodoroSimulator:
+    """가상 시계로 TimerEngine의 집중/휴식 사이클을 이벤트 단위로 빠르게 재생합니다."""
+
+    def __init__(self, work_min=25, short_break_min=5, long_break_min=15, long_break_interval=4,
+                 auto_start=False, cycles_per_day=8, day_start_hour=9, idle_sec=60, start_date=None):
+        self.clock = VirtualClock()
+        self.engine = TimerEngine(clock=self.clock)
+        self.engine.update_settings(work_min, short_break_min, long_break_min, long_break_interval, auto_start)
+        self.cycles_per_day = cycles_per_day # 하루에 완료할 집중 횟수
+        self.day_start_hour = day_start_hour
+        self.idle_sec = idle_sec # 자동 시작이 꺼져 있을 때 사용자가 다음 타이머를 누르기까지의 대기 시간
+        self.start_date = start_date or datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def to_datetime(self, clock_value):
+        """가상 시계 값을 시뮬레이션 기준 날짜의 datetime으로 변환합니다."""
+        return self.start_date + timedelta(seconds=clock_value)
+
+    def run(self, days):
+        """days일 동안의 사이클 이벤트를 순서대로 생성합니다."""
+        engine = self.engine
+        clock = self.clock
+
+        for day in range(days):
+            # 하루 시작: 오늘 집중 횟수 초기화 후 집중 모드 대기 상태
+            clock.now = max(clock.now, day * 86400 + self.day_start_hour * 3600)
+            engine.stop()
+            engine.switch_to_work()
+            today_count = 0
+
+            engine.start()
+            while True:
+                phase_start = clock.now
+
+                # 다음 이벤트(종료 시각)까지 한 번에 이동하고, 완료 여부는 GUI 루프처럼 tick()의 결과로만 판단
+                while not engine.tick():
+                    if not engine.is_running:
+                        raise RuntimeError("타이머가 멈춘 상태에서는 사이클이 완료되지 않습니다.")
+                    clock.advance(engine.remaining())
+
+                # 완료를 보고한 시점의 엔진 상태로 이벤트 생성
+                mode, break_type = engine.mode, engine.break_type
+                if mode == "work":
+                    today_count += 1
+                    yield CycleEvent("work_complete", mode, break_type, self.to_datetime(phase_start), self.to_datetime(clock.now), today_count)
+                    engine.switch_to_break(today_count)
+                else:
+                    yield CycleEvent("break_complete", mode, break_type, self.to_datetime(phase_start), self.to_datetime(clock.now), today_count)
+                    if today_count >= self.cycles_per_day:
+                        break
+                    engine.switch_to_work()
+
+                if not engine.auto_start:
+                    clock.advance(self.idle_sec)
+                engine.start()
+
+def benchmark(days=3650, **kwargs):
+    """시뮬레이션 처리량(초당 사이클 수)을 측정합니다."""
+    sim = PomodoroSimulator(**kwargs)
+    start = time.perf_counter()
+    events = 0
+    work_cycles = 0
+    for event in sim.run(days):
+        events += 1
+        if event.kind == "work_complete":
+            work_cycles += 1
+    elapsed = time.perf_counter() - start
+    return {
+        "days": days,
+        "events": events,
+        "work_cycles": work_cycles,
+        "elapsed_sec": elapsed,
+        "cycles_per_sec": work_cycles / elapsed if elapsed > 0 else float("inf"),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="God-Mode Timer 사이클 시뮬레이션")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--work", type=int, default=25)
+    parser.add_argument("--short-break", type=int, default=5)
+    parser.add_argument("--long-break", type=int, default=15)
+    parser.add_argument("--interval", type=int, default=4)
+    parser.add_argument("--cycles-per-day", type=int, default=8)
+    parser.add_argument("--auto-start", action="store_true")
+    parser.add_argument("--benchmark", action="store_true", help="이벤트 출력 대신 처리량 측정")
+    args = parser.parse_args(argv)
+
+    options = dict(work_min=args.work, short_break_min=args.short_break, long_break_min=args.long_break,
+                   long_break_interval=args.interval, auto_start=args.auto_start, cycles_per_day=args.cycles_per_day)
+
+    if args.benchmark:
+        result = benchmark(args.days, **options)
+        print(f"⏱️ {result['work_cycles']} cycles / {result['elapsed_sec']:.3f}s = {result['cycles_per_sec']:,.0f} cycles/s")
+        return
+
+    for event in PomodoroSimulator(**options).run(args.days):
+        print(f"{event.end:%Y-%m-%d %H:%M:%S} {event.kind:<15} {event.break_type or '-':<5} #{event.today_count}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,361 @@
+import math
+import tkinter.font as tkfont
+from bisect import bisect_right
+from itertools import accumulate
+
+PIE_COLORS = ['#FF5252', '#4CAF50', '#2196F3', '#FFC107', '#9C27B0', '#00BCD4', '#FF9800', '#795548', '#607D8B', '#9E9E9E']
+LEGEND_ROWS = 8 # 범례에 표시할 최대 작업 수
+
+def blend_color(color_a, color_b, ratio):
+    """두 #RRGGBB 색상을 ratio(0.0=color_a ~ 1.0=color_b)로 섞은 색상을 반환합니다."""
+    ratio = min(max(ratio, 0.0), 1.0)
+    a = [int(color_a[i:i + 2], 16) for i in (1, 3, 5)]
+    b = [int(color_b[i:i + 2], 16) for i in (1, 3, 5)]
+    return "#" + "".join(f"{round(x + (y - x) * ratio):02x}" for x, y in zip(a, b))
+
+def pie_slice_at(bounds, x, y, cx, cy, radius):
+    """(x, y)가 속한 파이 조각의 인덱스를 반환합니다 (원 밖이면 None).
+
+    bounds는 12시 방향에서 시계 방향으로 잰 각 조각의 끝 각도(도, 누적합)입니다.
+    """
+    dx, dy = x - cx, cy - y
+    if not bounds or dx * dx + dy * dy > radius * radius:
+        return None
+    angle = (90 - math.degrees(math.atan2(dy, dx))) % 360
+    index = bisect_right(bounds, angle)
+    return index if index < len(bounds) else None
+
+class StatsChart:
+    """통계 창 그래프(막대/파이/히트맵)를 캔버스 아이템을 유지한 채 갱신하는 retained 모델.
+
+    데이터가 바뀌면 기존 아이템을 itemconfigure로 수정하고(부족하면 풀에 추가, 남으면 숨김),
+    크기만 바뀌면 layout()이 coords로 위치만 옮깁니다. 툴팁은 하나를 재사용하며, 마우스 이벤트는
+    캔버스에 한 번만 바인딩하고 좌표로 대상을 판별합니다.
+    """
+
+    def __init__(self, canvas, app):
+        self.canvas = canvas
+        self.app = app
+
+        self.small_font = tkfont.Font(family="Helvetica", size=7)
+        self.legend_font = tkfont.Font(family="Helvetica", size=8)
+        self.title_font = tkfont.Font(family="Helvetica", size=9, weight="bold")
+        self.empty_font = tkfont.Font(family="Helvetica", size=10)
+        self.tooltip_font = tkfont.Font(family="Helvetica", size=8, weight="bold")
+
+        # 모델 (현재 모드의 데이터)
+        self.mode = None      # "bars" | "pie" | "heatmap"
+        self.bars = {"labels": [], "counts": [], "max_count": 5, "tooltips": [], "label_indices": (), "highlight": None}
+        self.pie = {"stats": [], "title": "", "bounds": []}
+        self.heatmap = {"matrix": [], "weekdays": [], "peak": 0}
+        self.geometry = {}    # 마지막 layout() 결과 (마우스 위치 판별용)
+
+        # 아이템 풀
+        self.bar_items = []     # (막대, 라벨)
+        self.slice_items = []   # 파이 조각 (arc)
+        self.legend_items = []  # (색상 박스, 텍스트)
+        self.cell_items = []    # 히트맵 칸 7 x 24
+        self.weekday_items = [] # 히트맵 요일 라벨
+        self.hour_items = []    # 히트맵 시간 라벨 (0, 6, 12, 18시)
+        self.full_slice_id = canvas.create_oval(0, 0, 0, 0, state="hidden") # 100% 조각 (일부 환경에서 360도 arc가 그려지지 않음)
+        self.title_id = canvas.create_text(0, 0, anchor="nw", font=self.title_font, state="hidden")
+        self.empty_id = canvas.create_text(0, 0, font=self.empty_font, state="hidden")
+        self.tooltip_ids = (canvas.create_rectangle(0, 0, 0, 0, state="hidden"),
+                            canvas.create_text(0, 0, anchor="nw", font=self.tooltip_font, state="hidden"))
+        self.hover = None       # 툴팁이 가리키는 대상 (모드, 인덱스)
+        self.tooltip_size = (0, 0)
+
+        canvas.bind("<Motion>", self.on_motion)
+        canvas.bind("<Leave>", lambda e: self.hide_tooltip())
+        self.refresh_style()
+
+    # --- 데이터 ---
+
+    def show_bars(self, labels, counts, max_count, tooltips, label_indices=(), highlight=None):
+        """막대 그래프 데이터를 설정합니다. label_indices의 막대 아래에만 라벨을 표시합니다."""
+        self.bars = {"labels": labels, "counts": counts, "max_count": max_count or 5, "tooltips": tooltips,
+                     "label_indices": set(label_indices), "highlight": highlight}
+        self._switch("bars")
+
+    def show_pie(self, task_stats, title=""):
+        """작업별 (작업명, 시간, 비율) 목록으로 파이 차트 데이터를 설정합니다."""
+        extents = [(pct / 100) * 360 for _, _, pct in task_stats]
+        self.pie = {"stats": task_stats, "title": title, "bounds": list(accumulate(extents))}
+        self._switch("pie")
+
+    def show_heatmap(self, matrix, weekdays):
+        """요일(행) x 시간대(열) 집중 횟수 행렬로 히트맵 데이터를 설정합니다."""
+        peak = max((max(row) for row in matrix), default=0)
+        self.heatmap = {"matrix": matrix, "weekdays": weekdays, "peak": peak}
+        self._switch("heatmap")
+
+    def _switch(self, mode):
+        if mode != self.mode:
+            for item_id in self._mode_items(self.mode):
+                self.canvas.itemconfigure(item_id, state="hidden")
+            self.mode = mode
+        self.hide_tooltip()
+        self._apply()
+        self.layout()
+
+    def _mode_items(self, mode):
+        if mode == "bars":
+            return [item_id for pair in self.bar_items for item_id in pair]
+        if mode == "pie":
+            return self.slice_items + [item_id for pair in self.legend_items for item_id in pair] + [self.full_slice_id, self.title_id]
+        if mode == "heatmap":
+            return self.cell_items + self.weekday_items + self.hour_items
+        return []
+
+    def refresh_style(self):
+        """테마/UI 크기 변경 시 폰트와 색상만 갱신합니다 (아이템은 유지)."""
+        sf = self.app.scale_factor
+        self.small_font.configure(size=int(7 * sf))
+        self.legend_font.configure(size=int(8 * sf))
+        self.title_font.configure(size=int(9 * sf))
+        self.empty_font.configure(size=int(10 * sf))
+        self.tooltip_font.configure(size=int(8 * sf))
+        colors = self.app.colors
+        self.canvas.configure(bg=colors["bg"])
+        self.canvas.itemconfigure(self.tooltip_ids[0], fill=colors["timer_center"], outline=colors["fg_sub"])
+        self.canvas.itemconfigure(self.tooltip_ids[1], fill=colors["fg"])
+        self.canvas.itemconfigure(self.title_id, fill=colors["fg"])
+        self.canvas.itemconfigure(self.empty_id, fill=colors["fg_sub"])
+        self.hide_tooltip()
+        if self.mode:
+            self._apply()
+            self.layout()
+
+    # --- 아이템 속성 (데이터/테마 변경 시) ---
+
+    def _grow(self, items, count, factory):
+        while len(items) < count:
+            items.append(factory())
+
+    def _apply(self):
+        canvas = self.canvas
+        colors = self.app.colors
+        empty = False
+
+        if self.mode == "bars":
+            model = self.bars
+            counts = model["counts"]
+            self._grow(self.bar_items, len(counts), lambda: (
+                canvas.create_rectangle(0, 0, 0, 0),
+                canvas.create_text(0, 0, font=self.small_font)))
+            for i, (rect_id, label_id) in enumerate(self.bar_items):
+                if i >= len(counts):
+                    canvas.itemconfigure(rect_id, state="hidden")
+                    canvas.itemconfigure(label_id, state="hidden")
+                    continue
+                color = colors["stats_bar_today"] if counts[i] >= 5 else colors["stats_bar_other"]
+                outline = colors["fg"] if i == model["highlight"] else ""
+                canvas.itemconfigure(rect_id, fill=color, outline=outline, state="normal")
+                canvas.itemconfigure(label_id, text=model["labels"][i], fill=colors["fg_sub"],
+                                     state="normal" if i in model["label_indices"] else "hidden")
+
+        elif self.mode == "pie":
+            stats = self.pie["stats"]
+            empty = not stats
+            # 100% 조각이 있으면 arc 대신 원으로 표시
+            full = next((i for i, (_, _, pct) in enumerate(stats) if pct >= 99.99), None)
+            self._grow(self.slice_items, len(stats), lambda: canvas.create_arc(0, 0, 0, 0))
+            start_angle = 90
+            for i, arc_id in enumerate(self.slice_items):
+                if i >= len(stats) or full is not None:
+                    canvas.itemconfigure(arc_id, state="hidden")
+                    continue
+                extent = (stats[i][2] / 100) * 360
+                canvas.itemconfigure(arc_id, start=start_angle, extent=-extent, fill=PIE_COLORS[i % len(PIE_COLORS)],
+                                     outline=colors["bg"], state="normal")
+                start_angle -= extent
+            canvas.itemconfigure(self.full_slice_id, fill=PIE_COLORS[(full or 0) % len(PIE_COLORS)], outline=colors["bg"],
+                                 state="normal" if full is not None else "hidden")
+
+            legend = stats[:LEGEND_ROWS]
+            self._grow(self.legend_items, len(legend), lambda: (
+                canvas.create_rectangle(0, 0, 0, 0, outline=""),
+                canvas.create_text(0, 0, anchor="w", font=self.legend_font)))
+            for i, (box_id, text_id) in enumerate(self.legend_items):
+                if i >= len(legend):
+                    canvas.itemconfigure(box_id, state="hidden")
+                    canvas.itemconfigure(text_id, state="hidden")
+                    continue
+                task, _, pct = legend[i]
+                display_text = task if len(task) <= 10 else task[:9] + ".." # 너무 길면 자름
+                canvas.itemconfigure(box_id, fill=PIE_COLORS[i % len(PIE_COLORS)])
+                canvas.itemconfigure(text_id, text=f"{display_text} ({int(pct)}%)", fill=colors["fg"])
+            canvas.itemconfigure(self.title_id, text=self.pie["title"],
+                                 state="normal" if self.pie["title"] and stats else "hidden")
+
+        elif self.mode == "heatmap":
+            model = self.heatmap
+            peak = model["peak"]
+            empty = peak == 0
+            self._grow(self.cell_items, 7 * 24, lambda: canvas.create_rectangle(0, 0, 0, 0, outline=""))
+            self._grow(self.weekday_items, 7, lambda: canvas.create_text(0, 0, anchor="e", font=self.small_font))
+            self._grow(self.hour_items, 4, lambda: canvas.create_text(0, 0, font=self.small_font))
+            state = "hidden" if empty else "normal"
+            for day in range(7):
+                canvas.itemconfigure(self.weekday_items[day], text=model["weekdays"][day], fill=colors["fg_sub"], state=state)
+                for hour in range(24):
+                    count = model["matrix"][day][hour] if not empty else 0
+                    # 색이 진할수록 집중 횟수가 많음
+                    color = blend_color(colors["timer_center"], colors["stats_bar_today"], 0.15 + 0.85 * count / peak) if count else colors["btn_bg"]
+                    canvas.itemconfigure(self.cell_items[day * 24 + hour], fill=color, state=state)
+            for i, hour_id in enumerate(self.hour_items):
+                canvas.itemconfigure(hour_id, text=str(i * 6), fill=colors["fg_sub"], state=state)
+
+        canvas.itemconfigure(self.empty_id, text=self.app.loc.get("no_data", default="No Data"),
+                             state="normal" if empty else "hidden")
+
+    # --- 배치 (크기 변경 시 coords만 갱신) ---
+
+    def layout(self, event=None):
+        """현재 캔버스 크기에 맞춰 표시 중인 아이템의 위치/크기만 옮깁니다."""
+        canvas = self.canvas
+        sf = self.app.scale_factor
+        w = canvas.winfo_width()
+        h = canvas.winfo_height()
+        if w <= 1: w = int(300 * sf)
+        if h <= 1: h = int(200 * sf)
+        self.geometry = {"w": w, "h": h}
+        canvas.coords(self.empty_id, w / 2, h / 2)
+
+        if self.mode == "bars":
+            bar_width = int(7 * sf)
+            spacing = int(2 * sf)
+            start_x = int(15 * sf)
+            base_y = h - int(30 * sf)
+            graph_h = h - int(60 * sf)
+            max_count = self.bars["max_count"]
+            for i, count in enumerate(self.bars["counts"]):
+                rect_id, label_id = self.bar_items[i]
+                x = start_x + i * (bar_width + spacing)
+                bar_height = (count / max_count) * graph_h
+                canvas.coords(rect_id, x, base_y - bar_height, x + bar_width, base_y)
+                canvas.coords(label_id, x + bar_width / 2, base_y + int(15 * sf))
+            self.geometry.update(bar_width=bar_width, spacing=spacing, start_x=start_x, base_y=base_y, graph_h=graph_h)
+
+        elif self.mode == "pie":
+            # 레이아웃: 파이 차트는 왼쪽, 범례는 오른쪽
+            cx = w * 0.35
+            cy = h / 2
+            radius = min(w * 0.6, h) / 2 * 0.8
+            bbox = (cx - radius, cy - radius, cx + radius, cy + radius)
+            width = max(1, int(1 * sf))
+            for i in range(len(self.pie["stats"])):
+                canvas.coords(self.slice_items[i], *bbox)
+                canvas.itemconfigure(self.slice_items[i], width=width)
+            canvas.coords(self.full_slice_id, *bbox)
+            canvas.itemconfigure(self.full_slice_id, width=width)
+            canvas.coords(self.title_id, int(10 * sf), int(10 * sf))
+
+            legend_x = w * 0.65
+            legend_y = int(20 * sf)
+            legend_spacing = int(18 * sf)
+            box = int(10 * sf)
+            for i in range(min(LEGEND_ROWS, len(self.pie["stats"]))):
+                box_id, text_id = self.legend_items[i]
+                # 높이를 넘는 항목은 숨김
+                state = "normal" if legend_y + legend_spacing <= h else "hidden"
+                canvas.coords(box_id, legend_x, legend_y, legend_x + box, legend_y + box)
+                canvas.coords(text_id, legend_x + int(15 * sf), legend_y + int(5 * sf))
+                canvas.itemconfigure(box_id, state=state)
+                canvas.itemconfigure(text_id, state=state)
+                legend_y += legend_spacing
+            self.geometry.update(cx=cx, cy=cy, radius=radius)
+
+        elif self.mode == "heatmap":
+            label_w = int(30 * sf)
+            top = int(10 * sf)
+            cell_w = (w - label_w - int(10 * sf)) / 24
+            cell_h = (h - top - int(25 * sf)) / 7
+            gap = max(1, int(1 * sf))
+            for day in range(7):
+                y = top + day * cell_h
+                canvas.coords(self.weekday_items[day], label_w - int(5 * sf), y + cell_h / 2)
+                for hour in range(24):
+                    x = label_w + hour * cell_w
+                    canvas.coords(self.cell_items[day * 24 + hour], x, y, x + cell_w - gap, y + cell_h - gap)
+            for i, hour_id in enumerate(self.hour_items):
+                canvas.coords(hour_id, label_w + i * 6 * cell_w + cell_w / 2, top + 7 * cell_h + int(12 * sf))
+            self.geometry.update(label_w=label_w, top=top, cell_w=cell_w, cell_h=cell_h)
+
+        if self.hover is not None:
+            self.hide_tooltip()
+
+    # --- 툴팁 (하나를 재사용) ---
+
+    def hit(self, x, y):
+        """(x, y) 위치의 대상과 툴팁 정보 (key, 텍스트, 기준 좌표, 포인터 추적 여부)를 반환합니다."""
+        g = self.geometry
+        if not g:
+            return None
+
+        if self.mode == "bars":
+            step = g["bar_width"] + g["spacing"]
+            index = int((x - g["start_x"]) // step) if x >= g["start_x"] else -1
+            counts = self.bars["counts"]
+            if 0 <= index < len(counts) and x - g["start_x"] - index * step <= g["bar_width"]:
+                top = g["base_y"] - (counts[index] / self.bars["max_count"]) * g["graph_h"]
+                if counts[index] and top <= y <= g["base_y"]:
+                    bx = g["start_x"] + index * step + g["bar_width"] / 2
+                    return ("bars", index), self.bars["tooltips"][index], (bx, top), False
+
+        elif self.mode == "pie":
+            index = pie_slice_at(self.pie["bounds"], x, y, g["cx"], g["cy"], g["radius"])
+            if index is not None:
+                task, duration, pct = self.pie["stats"][index]
+                return ("pie", index), f"{task}: {int(duration)}m ({pct:.1f}%)", (x, y), True
+
+        elif self.mode == "heatmap" and self.heatmap["peak"]:
+            col = int((x - g["label_w"]) // g["cell_w"]) if x >= g["label_w"] else -1
+            row = int((y - g["top"]) // g["cell_h"]) if y >= g["top"] else -1
+            if 0 <= row < 7 and 0 <= col < 24:
+                count = self.heatmap["matrix"][row][col]
+                text = self.app.loc.get("stats_heatmap_tooltip_fmt", default="{weekday} {hour}:00 - {count}",
+                                        weekday=self.heatmap['weekdays'][row], hour=col, count=count)
+                return ("heatmap", row * 24 + col), text, (g["label_w"] + (col + 0.5) * g["cell_w"], g["top"] + row * g["cell_h"]), False
+        return None
+
+    def on_motion(self, event):
+        target = self.hit(event.x, event.y)
+        if target is None:
+            self.hide_tooltip()
+            return
+        key, text, (x, y), follow = target
+        if key != self.hover:
+            self.hover = key
+            self.canvas.itemconfigure(self.tooltip_ids[1], text=text)
+            sf = self.app.scale_factor
+            self.tooltip_size = (self.tooltip_font.measure(text) + 2 * int(8 * sf), int(12 * sf) + 2 * int(5 * sf))
+        elif not follow:
+            return # 같은 막대/칸 안에서는 위치 고정
+        self._place_tooltip(x, y, follow)
+
+    def _place_tooltip(self, x, y, follow):
+        sf = self.app.scale_factor
+        box_width, box_height = self.tooltip_size
+        canvas_w = self.geometry.get("w", 0)
+        if follow:
+            # 포인터 오른쪽 아래 (넘치면 왼쪽)
+            x1 = x + 15
+            if x1 + box_width > canvas_w:
+                x1 = x - box_width - 15
+            y1 = y + 10
+        else:
+            # 대상 위쪽 가운데 (캔버스 경계 안으로 조정)
+            x1 = min(max(x - box_width / 2, 0), canvas_w - box_width)
+            y1 = max(y - box_height - int(5 * sf), 0)
+        rect_id, text_id = self.tooltip_ids
+        self.canvas.coords(rect_id, x1, y1, x1 + box_width, y1 + box_height)
+        self.canvas.coords(text_id, x1 + int(8 * sf), y1 + int(5 * sf))
+        for item_id in self.tooltip_ids:
+            self.canvas.itemconfigure(item_id, state="normal")
+            self.canvas.tag_raise(item_id)
+
+    def hide_tooltip(self):
+        self.hover = None
+        for item_id in self.tooltip_ids:
+            self.canvas.itemconfigure(item_id, state="hidden")
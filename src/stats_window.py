@@ -1,13 +1,42 @@
 import tkinter as tk
-import tkinter.font as tkfont
 import math
 import os
 import sys
 from datetime import datetime, timedelta
-from utils import export_csv, get_recent_logs, get_side_position, parse_logs, delete_log, update_log, get_task_stats
+from utils import get_recent_logs, get_logs_page, get_daily_stats, get_side_position, parse_logs, delete_log, update_log, rename_task, get_task_stats, get_hourly_stats, get_weekday_hour_stats, get_data_version, get_logs_since, recent_logs_start
 from common import get_user_data_path
+from virtual_log_list import VirtualLogList
+from export_window import open_export_window
+from perf import timed
+from stats_chart import StatsChart
+from resize_coalescer import ResizeCoalescer
 import traceback
 
+def load_stats_data(days):
+    """통계 창에 필요한 날짜별 집계와 로그 목록을 조회합니다 (DB 워커 스레드에서 실행).
+
+    조회 직전의 데이터 버전을 함께 반환하므로, 조회 도중 기록된 로그는 다음 재오픈 때 반영됩니다.
+    """
+    version = get_data_version()
+    daily_stats = parse_logs(days)
+    logs, has_more = get_recent_logs(days)
+    return daily_stats, logs, has_more, version
+
+def load_recent_data(since, start_day):
+    """since 이후의 최근 로그와 start_day부터의 날짜별 집계를 조회합니다 (재오픈 시 변경분 반영용, DB 워커 스레드에서 실행)."""
+    version = get_data_version()
+    logs, has_older = get_logs_since(since)
+    daily_stats = get_daily_stats(start_day)
+    return logs, has_older, daily_stats, version
+
+def load_logs_page(before_timestamp):
+    """before_timestamp 이전의 로그 한 페이지와 해당 날짜 범위의 집계를 조회합니다 (DB 워커 스레드에서 실행)."""
+    logs, has_more = get_logs_page(before_timestamp)
+    daily_stats = {}
+    if logs:
+        daily_stats = get_daily_stats(logs[-1]['timestamp_str'][:10], logs[0]['timestamp_str'][:10])
+    return logs, has_more, daily_stats
+
 def open_stats_window(app):
     """통계 창을 엽니다."""
     try:
@@ -31,10 +60,15 @@ def open_stats_window(app):
         except Exception:
             sw.geometry(get_side_position(app.root, w, h))
 
-        # 데이터 로드
+        # 데이터 (창을 먼저 띄운 뒤 DB 워커에서 읽어와 채움)
         current_view_days = 30
-        daily_stats = parse_logs(current_view_days)
-        logs, has_more = get_recent_logs(current_view_days)
+        daily_stats = {}
+        logs = []
+        has_more = False
+        page_cursor = None # 다음 "더 보기" 페이지의 기준 timestamp (이보다 오래된 로그 조회)
+        seen_version = None # 화면에 반영된 로그 DB 데이터 버전 (재오픈 시 바뀐 경우에만 다시 조회)
+        seen_day = None # 화면에 반영된 날짜 (자정이 지나면 최근 30일 범위가 바뀌므로 다시 조회)
+        seen_view_days = None # 화면에 반영된 조회 기간 (바뀌면 전체를 다시 조회)
 
         # 메인 컨테이너 (좌우 분할)
         main_frame = tk.Frame(sw, bg=app.colors["bg"])
@@ -51,7 +85,7 @@ def open_stats_window(app):
         label_title = tk.Label(graph_header, text=app.loc.get("monthly_stats_title"), font=("Helvetica", int(11*app.scale_factor), "bold"), bg=app.colors["bg"], fg=app.colors["fg"])
         label_title.pack(side=tk.LEFT)
 
-        # 그래프 모드 변수 (daily / weekly)
+        # 그래프 모드 변수 (daily / tasks / hourly / heatmap)
         graph_mode = tk.StringVar(value="daily")
         selected_date_filter = None
 
@@ -79,26 +113,67 @@ def open_stats_window(app):
                                    font=("Helvetica", int(8*app.scale_factor)), command=change_graph_mode, bd=0, padx=5)
         rb_hourly.pack(side=tk.LEFT, padx=2)
 
+        rb_heatmap = tk.Radiobutton(mode_frame, text=app.loc.get("stats_heatmap", default="Heatmap"), variable=graph_mode, value="heatmap", 
+                                    indicatoron=0, bg=app.colors["btn_bg"], selectcolor=app.colors["start_btn_bg"],
+                                    font=("Helvetica", int(8*app.scale_factor)), command=change_graph_mode, bd=0, padx=5)
+        rb_heatmap.pack(side=tk.LEFT, padx=2)
+
         # 캔버스
         canvas = tk.Canvas(left_frame, bg=app.colors["bg"], highlightthickness=0)
         canvas.pack(fill=tk.BOTH, expand=True)
 
-        # 툴팁 폰트 (한 번만 생성)
-        tooltip_font = tkfont.Font(family="Helvetica", size=int(8 * app.scale_factor), weight="bold")
+        # 그래프 (캔버스 아이템을 유지한 채 데이터/크기 변경만 반영)
+        chart = StatsChart(canvas, app)
 
         # 그래프 데이터 변수
         dates = []
         counts = []
         max_count = 0
         task_stats = []
+        heatmap = [] # 요일(월~일) x 시간(0~23시) 집중 횟수
         today_str = datetime.now().strftime("%m/%d")
 
+        def analytics_start_day():
+            # 시간대/요일 분포 집계 범위 (로드된 로그 수와 무관하게 최근 current_view_days일)
+            return (datetime.now() - timedelta(days=current_view_days)).strftime("%Y-%m-%d")
+
+        def load_task_stats():
+            # 작업별 집계는 DB 워커에서 조회 후 그래프를 다시 그림
+            def on_loaded(result):
+                nonlocal task_stats
+                if not sw.winfo_exists() or graph_mode.get() != "tasks":
+                    return
+                task_stats = result
+                draw_graph()
+            app.db_worker.submit(get_task_stats, current_view_days, selected_date_filter, callback=on_loaded)
+
+        def load_hourly_stats():
+            # 시간대별 분포는 DB에서 집계 (로그 목록을 순회하지 않음)
+            def on_loaded(result):
+                nonlocal counts, max_count
+                if not sw.winfo_exists() or graph_mode.get() != "hourly":
+                    return
+                counts = result['count']
+                max_count = max(counts) or 5
+                draw_graph()
+            app.db_worker.submit(get_hourly_stats, analytics_start_day(), callback=on_loaded)
+
+        def load_heatmap_stats():
+            def on_loaded(result):
+                nonlocal heatmap
+                if not sw.winfo_exists() or graph_mode.get() != "heatmap":
+                    return
+                heatmap = result
+                draw_graph()
+            app.db_worker.submit(get_weekday_hour_stats, analytics_start_day(), callback=on_loaded)
+
         def prepare_graph_data():
-            nonlocal dates, counts, max_count, task_stats
+            nonlocal dates, counts, max_count, task_stats, heatmap
             dates = []
             counts = []
             max_count = 0
             task_stats = []
+            heatmap = []
             
             if graph_mode.get() == "daily":
                 # 일간 (최근 30일)
@@ -112,210 +187,61 @@ def open_stats_window(app):
                     if c > max_count: max_count = c
             elif graph_mode.get() == "tasks":
                 # 작업별 분포 (DB 집계 사용)
-                task_stats = get_task_stats(current_view_days, selected_date_filter)
+                load_task_stats()
             elif graph_mode.get() == "hourly":
-                # 시간대별 분포 (0시 ~ 23시)
-                hours = [0] * 24
-                for log in logs:
-                    # 로그의 시작 시간 기준
-                    h = log['start'].hour
-                    hours[h] += 1
-                
+                # 시간대별 분포 (0시 ~ 23시, 시작 시각 기준). 조회 전까지는 빈 막대
                 dates = [str(h) for h in range(24)]
-                counts = hours
-                max_count = max(counts) if counts else 0
+                counts = [0] * 24
+                load_hourly_stats()
+            elif graph_mode.get() == "heatmap":
+                # 요일 x 시간대 분포
+                load_heatmap_stats()
 
             if max_count == 0: max_count = 5
 
         prepare_graph_data()
 
-        # 막대 그래프 그리기
-        def draw_graph(event=None):
-            sf = app.scale_factor
-            canvas.delete("all")
-            canvas.configure(bg=app.colors["bg"])
-            
-            w = canvas.winfo_width()
-            h = canvas.winfo_height()
-            if w <= 1: w = int(300 * sf)
-            if h <= 1: h = int(200 * sf)
-            
-            if graph_mode.get() == "tasks":
-                # 파이 차트 그리기
-                if not task_stats:
-                    canvas.create_text(w/2, h/2, text=app.loc.get("no_data", default="No Data"), fill=app.colors["fg_sub"], font=("Helvetica", int(10*sf)))
-                    return
-                
-                # 선택된 날짜 표시
-                if selected_date_filter:
-                    canvas.create_text(int(10*sf), int(10*sf), text=f"Date: {selected_date_filter}", anchor="nw", font=("Helvetica", int(9*sf), "bold"), fill=app.colors["fg"])
-
-                # 레이아웃: 파이 차트는 왼쪽, 범례는 오른쪽
-                cx = w * 0.35
-                cy = h / 2
-                radius = min(w * 0.6, h) / 2 * 0.8
-                
-                colors = ['#FF5252', '#4CAF50', '#2196F3', '#FFC107', '#9C27B0', '#00BCD4', '#FF9800', '#795548', '#607D8B', '#9E9E9E']
-                start_angle = 90
-                
-                # 파이 조각 그리기
-                for i, (task, duration, pct) in enumerate(task_stats):
-                    extent = (pct / 100) * 360
-                    color = colors[i % len(colors)]
-                    
-                    if pct >= 99.99:
-                        # 100%일 경우 create_arc가 일부 환경에서 렌더링되지 않는 문제 해결을 위해 create_oval 사용
-                        slice_id = canvas.create_oval(cx-radius, cy-radius, cx+radius, cy+radius, fill=color, outline=app.colors["bg"], width=max(1, int(1*sf)))
-                    else:
-                        # 조각
-                        slice_id = canvas.create_arc(cx-radius, cy-radius, cx+radius, cy+radius, start=start_angle, extent=-extent, fill=color, outline=app.colors["bg"], width=max(1, int(1*sf)))
-                    
-                    # 툴팁
-                    tooltip_text = f"{task}: {int(duration)}m ({pct:.1f}%)"
-
-                    def on_enter_pie(e, txt=tooltip_text):
-                        canvas.delete("tooltip")
-                        sf = app.scale_factor
-                        
-                        # 1. 텍스트 크기 측정
-                        text_width = tooltip_font.measure(txt)
-                        text_height = int(12 * sf)
-                        
-                        # 2. 패딩 및 박스 크기 계산
-                        padding_x = int(8 * sf)
-                        padding_y = int(5 * sf)
-                        box_width = text_width + 2 * padding_x
-                        box_height = text_height + 2 * padding_y
-                        
-                        # 3. 박스 위치 계산 (마우스 커서 기준)
-                        box_x1 = e.x + 15
-                        box_y1 = e.y + 10
-                        
-                        # 캔버스 경계를 벗어나지 않도록 위치 조정
-                        canvas_w = canvas.winfo_width()
-                        if box_x1 + box_width > canvas_w:
-                            box_x1 = e.x - box_width - 15
-                        
-                        box_x2 = box_x1 + box_width
-                        box_y2 = box_y1 + box_height
-
-                        # 4. 툴팁 배경 및 텍스트 그리기
-                        canvas.create_rectangle(box_x1, box_y1, box_x2, box_y2, fill=app.colors["timer_center"], outline=app.colors["fg_sub"], tag="tooltip")
-                        canvas.create_text(box_x1 + padding_x, box_y1 + padding_y, text=txt, anchor="nw", font=tooltip_font, fill=app.colors["fg"], tag="tooltip")
-
-                    canvas.tag_bind(slice_id, "<Enter>", on_enter_pie)
-                    canvas.tag_bind(slice_id, "<Motion>", on_enter_pie)
-                    canvas.tag_bind(slice_id, "<Leave>", lambda e: canvas.delete("tooltip"))
-                    
-                    start_angle -= extent
-
-                # 범례 (Legend) 그리기 (상위 8개)
-                legend_x = w * 0.65
-                legend_y = int(20 * sf)
-                legend_spacing = int(18 * sf)
-                
-                for i, (task, duration, pct) in enumerate(task_stats[:8]):
-                    if legend_y + legend_spacing > h: break
-                    color = colors[i % len(colors)]
-                    
-                    # 색상 박스
-                    canvas.create_rectangle(legend_x, legend_y, legend_x + int(10*sf), legend_y + int(10*sf), fill=color, outline="")
-                    
-                    # 텍스트 (너무 길면 자름)
-                    display_text = task
-                    if len(display_text) > 10: display_text = display_text[:9] + ".."
-                    canvas.create_text(legend_x + int(15*sf), legend_y + int(5*sf), text=f"{display_text} ({int(pct)}%)", anchor="w", font=("Helvetica", int(8*sf)), fill=app.colors["fg"])
-                    legend_y += legend_spacing
-                return
-
-            canvas_height = h
-            
-            bar_width = int(7 * sf)
-            spacing = int(2 * sf)
-            start_x = int(15 * sf)
-            base_y = canvas_height - int(30 * sf)
-            
-            for i, count in enumerate(counts):
-                x = start_x + i * (bar_width + spacing)
-                bar_height = (count / max_count) * (canvas_height - int(60 * sf))
-                
-                # 색상 로직
-                if count >= 5:
-                    color = app.colors["stats_bar_today"]
-                else:
-                    color = app.colors["stats_bar_other"]
-                    
-                # 오늘 날짜 강조
-                outline = app.colors["fg"] if (graph_mode.get() == "daily" and dates[i] == today_str) else ""
-                
-                rect_id = canvas.create_rectangle(x, base_y - bar_height, x + bar_width, base_y, fill=color, outline=outline)
-                
-                # 날짜 라벨 (1일, 5일, 10일... 간격으로 표시)
-                show_label = False
-                if graph_mode.get() == "hourly":
-                    if i % 6 == 0: show_label = True # 0, 6, 12, 18시 표시
-                elif i == 0 or (i + 1) % 5 == 0:
-                    show_label = True
-                
-                if show_label:
-                    canvas.create_text(x + bar_width/2, base_y + int(15 * sf), text=dates[i], font=("Helvetica", int(7 * sf)), fill=app.colors["fg_sub"])
-                
-                # 툴팁
-                if graph_mode.get() == "daily":
-                    tooltip_text = app.loc.get("tooltip_fmt", date=dates[i], count=count)
-                else: # hourly
-                    tooltip_text = f"{dates[i]}시: {count}회"
-
-                def on_enter(e, txt=tooltip_text, bx=x, by=base_y - bar_height):
-                    canvas.delete("tooltip")
-                    sf = app.scale_factor
-                    
-                    # 1. 텍스트 크기 측정
-                    text_width = tooltip_font.measure(txt)
-                    text_height = int(12 * sf)
-                    
-                    # 2. 패딩 및 박스 크기 계산
-                    padding_x = int(8 * sf)
-                    padding_y = int(5 * sf)
-                    box_width = text_width + 2 * padding_x
-                    box_height = text_height + 2 * padding_y
-                    
-                    # 3. 박스 위치 계산 (막대 중앙 상단)
-                    box_x1 = bx + bar_width/2 - box_width/2
-                    box_y1 = by - box_height - int(5 * sf) # 막대 위로 5px
-                    
-                    # 캔버스 경계를 벗어나지 않도록 위치 조정
-                    canvas_w = canvas.winfo_width()
-                    if box_x1 < 0:
-                        box_x1 = 0
-                    if box_x1 + box_width > canvas_w:
-                        box_x1 = canvas_w - box_width
-                    
-                    box_x2 = box_x1 + box_width
-                    box_y2 = box_y1 + box_height
-
-                    # 4. 툴팁 배경 및 텍스트 그리기
-                    canvas.create_rectangle(box_x1, box_y1, box_x2, box_y2, fill=app.colors["timer_center"], outline=app.colors["fg_sub"], tag="tooltip")
-                    canvas.create_text(box_x1 + padding_x, box_y1 + padding_y, text=txt, anchor="nw", font=tooltip_font, fill=app.colors["fg"], tag="tooltip")
-
-                def on_leave(e):
-                    canvas.delete("tooltip")
-
-                canvas.tag_bind(rect_id, "<Enter>", on_enter)
-                canvas.tag_bind(rect_id, "<Leave>", on_leave)
+        @timed("stats.draw_graph")
+        def draw_graph():
+            mode = graph_mode.get()
+            if mode == "tasks":
+                # 작업별 파이 차트 (선택된 날짜 표시)
+                chart.show_pie(task_stats, f"Date: {selected_date_filter}" if selected_date_filter else "")
+            elif mode == "heatmap":
+                chart.show_heatmap(heatmap, app.loc.get("weekdays"))
+            elif mode == "hourly":
+                # 0, 6, 12, 18시 라벨
+                chart.show_bars(dates, counts, max_count, [f"{dates[i]}시: {c}회" for i, c in enumerate(counts)],
+                                label_indices=range(0, len(counts), 6))
+            else:
+                # 날짜 라벨 (1일, 5일, 10일... 간격), 오늘 날짜 강조
+                chart.show_bars(dates, counts, max_count,
+                                [app.loc.get("tooltip_fmt", date=d, count=c) for d, c in zip(dates, counts)],
+                                label_indices=[i for i in range(len(counts)) if i == 0 or (i + 1) % 5 == 0],
+                                highlight=dates.index(today_str) if today_str in dates else None)
 
         draw_graph()
-        canvas.bind("<Configure>", draw_graph)
+
+        # 창 크기 변경 중에는 프레임당 한 번만 아이템 위치를 옮김 (다시 만들지 않음)
+        resize_coalescer = ResizeCoalescer(sw, on_frame=lambda redraw: chart.layout(), on_settle=lambda event: chart.layout())
+        canvas.bind("<Configure>", lambda e: resize_coalescer.notify(e, redraw=True))
 
         # 최근 30일 통계 요약
-        total_30_count = sum(counts)
+        total_30_count = 0
         total_30_duration = 0
-        
-        for i in range(29, -1, -1):
-            d = datetime.now() - timedelta(days=i)
-            d_str = d.strftime("%Y-%m-%d")
-            if d_str in daily_stats:
-                total_30_duration += daily_stats[d_str]['duration']
+
+        def calc_summary():
+            nonlocal total_30_count, total_30_duration
+            total_30_count = 0
+            total_30_duration = 0
+            for i in range(29, -1, -1):
+                d = datetime.now() - timedelta(days=i)
+                d_str = d.strftime("%Y-%m-%d")
+                if d_str in daily_stats:
+                    total_30_count += daily_stats[d_str]['count']
+                    total_30_duration += daily_stats[d_str]['duration']
+
+        calc_summary()
                 
         def get_time_str(duration):
             hours, minutes = divmod(duration, 60)
@@ -339,28 +265,37 @@ def open_stats_window(app):
         label_log_title = tk.Label(right_frame, text=app.loc.get("recent_logs_title"), font=("Helvetica", int(11 * app.scale_factor), "bold"), bg=app.colors["bg"], fg=app.colors["fg"])
         label_log_title.pack(pady=(0, int(10 * app.scale_factor)))
 
-        # CSV 내보내기 버튼
+        # 로그 내보내기 버튼
         btn_export = tk.Button(right_frame, text=app.loc.get("csv_export"), font=("Helvetica", int(8 * app.scale_factor)), 
                             bg=app.colors["btn_bg"], fg=app.colors["btn_fg"], 
-                            bd=0, padx=10, pady=4, command=lambda: export_csv(sw, app.loc))
+                            bd=0, padx=10, pady=4, command=lambda: open_export_window(app, sw))
         btn_export.pack(side=tk.BOTTOM, pady=(5, 0), fill=tk.X)
         btn_export.bind("<Enter>", lambda e: btn_export.config(bg=app.colors["btn_hover"]))
         btn_export.bind("<Leave>", lambda e: btn_export.config(bg=app.colors["btn_bg"]))
 
         # 데이터 더 보기 함수
         def load_more_data():
-            nonlocal current_view_days, daily_stats, logs
-            current_view_days += 30
-            
-            # 데이터 추가 로드
-            daily_stats = parse_logs(current_view_days)
-            logs, has_more_new = get_recent_logs(current_view_days)
-            
-            if not has_more_new:
-                btn_more.pack_forget()
+            # 마지막으로 본 로그보다 오래된 한 페이지만 조회하여 기존 목록 뒤에 추가
+            def on_loaded(result):
+                nonlocal page_cursor, has_more
+                if not sw.winfo_exists():
+                    return
+                page, has_more, page_stats = result
+                if page:
+                    logs.extend(page)
+                    daily_stats.update(page_stats)
+                    page_cursor = page[-1]['timestamp_str']
+                if not has_more:
+                    btn_more.pack_forget()
+                btn_more.config(state=tk.NORMAL)
+
+                # 로그 리스트 갱신 (그래프는 DB 집계 기준이므로 다시 그릴 필요 없음)
+                draw_logs()
 
-            # 로그 리스트 갱신
-            draw_logs()
+            if page_cursor is None:
+                return
+            btn_more.config(state=tk.DISABLED) # 중복 클릭 방지
+            app.db_worker.submit(load_logs_page, page_cursor, callback=on_loaded)
 
         # 더 보기 버튼
         btn_more = tk.Button(right_frame, text=app.loc.get("load_more_logs"), font=("Helvetica", int(8 * app.scale_factor)), 
@@ -380,16 +315,82 @@ def open_stats_window(app):
         # 로그 캔버스 (박스 형태 시각화)
         log_canvas = tk.Canvas(list_container, bg=app.colors["bg"], highlightthickness=0, yscrollcommand=scrollbar.set)
         log_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=log_canvas.yview)
-        
-        task_font = tkfont.Font(family="Helvetica", size=int(9 * app.scale_factor))
-        time_font = tkfont.Font(family="Helvetica", size=int(8 * app.scale_factor))
         
-        # 펼쳐진 날짜 저장 (가장 최근 날짜만 기본적으로 펼침)
+        # 펼쳐진 날짜 저장 (가장 최근 날짜만 기본적으로 펼침, 첫 로드 시 설정)
         expanded_dates = set()
-        if logs:
-            most_recent_date = logs[0]['start'].strftime("%Y-%m-%d")
-            expanded_dates.add(most_recent_date)
+
+        def refresh_daily_stats():
+            """로드된 로그 범위(최소 최근 30일)의 날짜별 집계만 다시 읽어와 화면을 갱신합니다."""
+            start_day = (datetime.now() - timedelta(days=current_view_days)).strftime("%Y-%m-%d")
+            if logs:
+                start_day = min(start_day, logs[-1]['timestamp_str'][:10])
+
+            def on_loaded(result):
+                nonlocal daily_stats
+                if not sw.winfo_exists():
+                    return
+                daily_stats = result
+                calc_summary()
+                refresh_language()
+            app.db_worker.submit(get_daily_stats, start_day, callback=on_loaded)
+
+        def update_more_button():
+            if has_more:
+                if not btn_more.winfo_ismapped():
+                    btn_more.pack(side=tk.BOTTOM, pady=(5, 0), fill=tk.X, before=list_container)
+            else:
+                btn_more.pack_forget()
+
+        def reload_data():
+            """날짜별 집계와 로그 목록을 DB 워커에서 다시 읽어와 그래프/리스트를 갱신합니다."""
+            def on_loaded(result):
+                nonlocal daily_stats, logs, has_more, page_cursor, seen_version, seen_day, seen_view_days
+                if not sw.winfo_exists():
+                    return
+                daily_stats, logs, has_more, seen_version = result
+                seen_day = datetime.now().strftime("%Y-%m-%d")
+                seen_view_days = current_view_days
+                if logs:
+                    page_cursor = logs[-1]['timestamp_str']
+                else:
+                    page_cursor = (datetime.now() - timedelta(days=current_view_days)).strftime("%Y-%m-%d %H:%M:%S")
+
+                update_more_button()
+
+                if logs and not expanded_dates:
+                    expanded_dates.add(logs[0]['start'].strftime("%Y-%m-%d"))
+
+                # 요약 정보, 그래프 및 리스트 갱신
+                calc_summary()
+                refresh_language()
+            app.db_worker.submit(load_stats_data, current_view_days, callback=on_loaded)
+
+        def refresh_recent_data():
+            """최근 범위(기준일 0시부터)의 로그만 다시 읽어 목록 앞부분을 교체합니다.
+
+            "더 보기"로 불러온 이전 페이지와 페이지 커서, 스크롤 위치는 그대로 유지합니다.
+            """
+            since = recent_logs_start(current_view_days)
+            start_day = since[:10]
+            if logs:
+                start_day = min(start_day, logs[-1]['timestamp_str'][:10])
+
+            def on_loaded(result):
+                nonlocal daily_stats, has_more, page_cursor, seen_version
+                if not sw.winfo_exists():
+                    return
+                recent, has_older, daily_stats, seen_version = result
+                older = [log for log in logs if log['timestamp_str'] < since]
+                logs[:] = recent + older
+                if not older:
+                    # 이전 페이지를 불러온 적이 없으면 커서와 "더 보기" 여부를 최근 범위 기준으로 다시 잡음
+                    has_more = has_older
+                    page_cursor = logs[-1]['timestamp_str'] if logs else since
+                    update_more_button()
+
+                calc_summary()
+                refresh_language()
+            app.db_worker.submit(load_recent_data, since, start_day, callback=on_loaded)
 
         def toggle_date(date_key):
             # 접기/펼치기만 수행
@@ -417,19 +418,13 @@ def open_stats_window(app):
             if tk.messagebox.askyesno(app.loc.get("confirm_delete_title", default="Delete"), 
                                       app.loc.get("confirm_delete_msg", default="Are you sure you want to delete this log?"), 
                                       parent=sw):
-                if delete_log(timestamp_str):
-                    # 데이터 리로드
-                    nonlocal daily_stats, logs
-                    daily_stats = parse_logs(current_view_days)
-                    logs, _ = get_recent_logs(current_view_days)
-                    
-                    # 그래프 및 리스트 갱신
-                    prepare_graph_data()
-                    draw_graph()
-                    draw_logs()
-                    
-                    # 요약 정보 갱신 (간단히 재계산)
-                    refresh_language()
+                def on_deleted(success):
+                    if success:
+                        # 로드된 목록에서 제거 후 집계만 다시 조회 (그래프, 리스트, 요약 정보 갱신)
+                        logs[:] = [l for l in logs if l['timestamp_str'] != timestamp_str]
+                        refresh_daily_stats()
+
+                app.db_worker.submit(delete_log, timestamp_str, callback=on_deleted)
         
         def edit_log_item(log):
             # 편집 팝업
@@ -437,7 +432,7 @@ def open_stats_window(app):
             edit_win.title(app.loc.get("edit_log_title", default="Edit Log"))
             
             w = int(300 * app.scale_factor)
-            h = int(150 * app.scale_factor)
+            h = int(180 * app.scale_factor)
             edit_win.geometry(f"{w}x{h}")
             
             # 통계 창 중앙에 배치
@@ -456,6 +451,15 @@ def open_stats_window(app):
             entry = tk.Entry(edit_win, textvariable=var_task, font=("Helvetica", int(10*app.scale_factor)), bg=app.colors["btn_bg"], fg=app.colors["fg"])
             entry.pack(fill=tk.X, padx=int(20*app.scale_factor))
             entry.focus_set()
+
+            # 같은 작업명의 모든 기록을 한 번에 변경 (작업 없음 '-'은 제외)
+            old_task = log['task']
+            var_rename_all = tk.BooleanVar(value=False)
+            if old_task != "-":
+                tk.Checkbutton(edit_win, text=app.loc.get("edit_rename_all", default="Rename in all logs with this task"),
+                               variable=var_rename_all, font=("Helvetica", int(8*app.scale_factor)),
+                               bg=app.colors["bg"], fg=app.colors["fg"], selectcolor=app.colors["btn_bg"],
+                               activebackground=app.colors["bg"]).pack(anchor="w", padx=int(16*app.scale_factor), pady=(int(5*app.scale_factor), 0))
             
             def save_edit(event=None):
                 new_task = var_task.get().strip()
@@ -463,17 +467,27 @@ def open_stats_window(app):
                     tk.messagebox.showwarning(app.loc.get("warning"), app.loc.get("task_empty_msg", default="Task name cannot be empty."), parent=edit_win)
                     return
 
-                if update_log(log['timestamp_str'], new_task):
-                    # 데이터 리로드 및 UI 갱신
-                    nonlocal daily_stats, logs
-                    daily_stats = parse_logs(current_view_days)
-                    logs, _ = get_recent_logs(current_view_days)
-                    
-                    prepare_graph_data()
-                    draw_graph()
-                    draw_logs()
-                    refresh_language() # 요약 정보 갱신
-                    edit_win.destroy()
+                rename_all = var_rename_all.get()
+
+                def on_saved(success):
+                    if not success:
+                        return
+                    # 로드된 항목만 수정 후 UI 갱신 (작업명 변경은 날짜별 집계에 영향 없음)
+                    if rename_all:
+                        for item in logs:
+                            if item['task'] == old_task:
+                                item['task'] = new_task
+                    else:
+                        log['task'] = new_task
+                    if sw.winfo_exists():
+                        refresh_language() # 작업 그래프는 작업별 집계를 다시 조회
+                    if edit_win.winfo_exists():
+                        edit_win.destroy()
+
+                if rename_all:
+                    app.db_worker.submit(rename_task, old_task, new_task, callback=on_saved)
+                else:
+                    app.db_worker.submit(update_log, log['timestamp_str'], new_task, callback=on_saved)
             
             btn_frame = tk.Frame(edit_win, bg=app.colors["bg"])
             btn_frame.pack(pady=int(15*app.scale_factor))
@@ -486,139 +500,20 @@ def open_stats_window(app):
             edit_win.bind("<Return>", save_edit)
             edit_win.bind("<Escape>", lambda e: edit_win.destroy())
 
-        def draw_logs(event=None):
-            sf = app.scale_factor
-            # 폰트 업데이트
-            task_font.configure(size=int(9 * sf))
-            time_font.configure(size=int(8 * sf))
-            
-            try:
-                log_canvas.config(cursor="")
-                log_canvas.delete("all")
-                canvas_width = log_canvas.winfo_width()
-                if canvas_width <= 1: return
-
-                y_offset = int(10 * sf)
-                item_height = int(24 * sf)
-                padding = int(4 * sf)
-                
-                if not logs:
-                    log_canvas.create_text(canvas_width/2, int(30 * sf), text=app.loc.get("no_logs_message"), fill=app.colors["fg_sub"], font=("Helvetica", int(8 * sf)))
-                    return
+        # 로그 리스트 (보이는 행만 그리는 가상화 리스트)
+        log_list = VirtualLogList(log_canvas, app, get_time_str, toggle_date, show_date_stats, edit_log_item, delete_log_item)
+        scrollbar.config(command=log_list.yview)
 
-                current_date_key = None
-                weekdays = app.loc.get("weekdays")
-
-                for log in logs:
-                    date_disp = log['start'].strftime("%m/%d")
-                    date_key = log['start'].strftime("%Y-%m-%d")
-                    
-                    # 날짜 헤더 표시 (날짜가 바뀔 때마다)
-                    if date_key != current_date_key:
-                        if current_date_key is not None:
-                            y_offset += int(10 * sf) # 날짜 그룹 간 간격
-                        
-                        current_date_key = date_key
-                        weekday = weekdays[log['start'].weekday()]
-                        
-                        day_stats = daily_stats.get(date_key, {'count': 0, 'duration': 0})
-                        day_count = day_stats['count']
-                        day_duration = day_stats['duration']
-                        
-                        time_str = get_time_str(day_duration)
-                        
-                        is_expanded = date_key in expanded_dates
-                        icon = "▼" if is_expanded else "▶"
-                        # 아이콘과 텍스트 분리 (화살표만 클릭 가능하게 하기 위함)
-                        text_part = app.loc.get("date_header_fmt", icon="", date=date_disp, weekday=weekday, count=day_count, time=time_str).strip()
-                        
-                        # 헤더 배경
-                        header_height = int(26 * sf)
-                        bg_id = log_canvas.create_rectangle(int(2 * sf), y_offset, canvas_width-int(5 * sf), y_offset + header_height, 
-                                                    fill=app.colors["btn_bg"], outline="")
-                        
-                        # 아이콘 (화살표)
-                        icon_x = int(8 * sf)
-                        icon_y = y_offset + header_height/2
-                        icon_id = log_canvas.create_text(icon_x, icon_y, text=icon, anchor="w", font=("Helvetica", int(9 * sf), "bold"), fill=app.colors["fg"])
-                        
-                        # 텍스트 (날짜 정보)
-                        text_x = int(24 * sf)
-                        text_id = log_canvas.create_text(text_x, icon_y, text=text_part, anchor="w", font=("Helvetica", int(9 * sf), "bold"), fill=app.colors["fg"])
-                        
-                        # 클릭 영역 (아이콘 주변)
-                        click_area_w = int(24 * sf)
-                        click_area_id = log_canvas.create_rectangle(int(2 * sf), y_offset, int(2 * sf) + click_area_w, y_offset + header_height, fill="", outline="")
-                        
-                        # 이벤트 바인딩 (아이콘 및 클릭 영역 -> 접기/펼치기)
-                        for item_id in [icon_id, click_area_id]:
-                            log_canvas.tag_bind(item_id, "<Button-1>", lambda e, d=date_key: toggle_date(d))
-                            log_canvas.tag_bind(item_id, "<Enter>", lambda e: log_canvas.config(cursor="hand2"))
-                            log_canvas.tag_bind(item_id, "<Leave>", lambda e: log_canvas.config(cursor=""))
-                        
-                        # 이벤트 바인딩 (날짜 텍스트 -> 파이 차트 보기)
-                        log_canvas.tag_bind(text_id, "<Button-1>", lambda e, d=date_key: show_date_stats(d))
-                        log_canvas.tag_bind(text_id, "<Enter>", lambda e: log_canvas.config(cursor="hand2"))
-                        log_canvas.tag_bind(text_id, "<Leave>", lambda e: log_canvas.config(cursor=""))
-                        
-                        y_offset += header_height + int(4 * sf) # 헤더 높이 + 간격
-
-                    if date_key not in expanded_dates:
-                        continue
-
-                    time_range = f"{log['start'].strftime('%H:%M')} ~ {log['end'].strftime('%H:%M')} ({log['duration']}분)"
-                    task = log['task']
-                    if task == "-":
-                        task = ""
-                    task = task.replace('\n', ' ').strip()
-                    
-                    time_width = time_font.measure(time_range)
-                    
-                    # 텍스트 너비에 맞춰 말줄임표(...) 처리
-                    available_width = max(0, canvas_width - (time_width + int(50 * sf)))
-                    if task_font.measure(task) > available_width - int(20 * sf): # 삭제 버튼 공간 확보
-                        while task_font.measure(task + "...") > available_width and len(task) > 0:
-                            task = task[:-1]
-                        task += "..."
-                    
-                    # 박스 그리기
-                    rect_id = log_canvas.create_rectangle(int(10 * sf), y_offset, canvas_width-int(10 * sf), y_offset + item_height, 
-                                                fill=app.colors["btn_bg"], outline=app.colors["btn_hover"])
-                    
-                    # 시간
-                    time_id = log_canvas.create_text(int(20 * sf), y_offset + int(12 * sf), text=time_range, 
-                                        anchor="w", font=time_font, fill=app.colors["fg_sub"])
-                    
-                    # 작업명
-                    task_id = log_canvas.create_text(int(20 * sf) + time_width + int(10 * sf), y_offset + int(12 * sf), text=task, 
-                                        anchor="w", font=task_font, fill=app.colors["fg"])
-                    
-                    # 삭제 버튼 (x)
-                    del_x = canvas_width - int(20 * sf)
-                    del_y = y_offset + int(12 * sf)
-                    del_id = log_canvas.create_text(del_x, del_y, text="×", font=("Helvetica", int(12 * sf), "bold"), fill=app.colors["fg_sub"], activefill="red")
-                    
-                    log_canvas.tag_bind(del_id, "<Button-1>", lambda e, ts=log.get('timestamp_str'): delete_log_item(ts))
-                    log_canvas.tag_bind(del_id, "<Enter>", lambda e: log_canvas.config(cursor="hand2"))
-                    log_canvas.tag_bind(del_id, "<Leave>", lambda e: log_canvas.config(cursor=""))
-                    
-                    # 항목 클릭 시 수정 (배경, 시간, 작업명)
-                    for item in [rect_id, time_id, task_id]:
-                        log_canvas.tag_bind(item, "<Button-1>", lambda e, l=log: edit_log_item(l))
-                        log_canvas.tag_bind(item, "<Enter>", lambda e: log_canvas.config(cursor="hand2"))
-                        log_canvas.tag_bind(item, "<Leave>", lambda e: log_canvas.config(cursor=""))
-                    
-                    y_offset += item_height + padding
-                    
-                log_canvas.configure(scrollregion=(0, 0, canvas_width, y_offset + int(10 * sf)))
-            except Exception:
-                traceback.print_exc()
-
-        log_canvas.bind("<Configure>", draw_logs)
+        @timed("stats.draw_logs")
+        def draw_logs():
+            # 로그/펼침 상태가 바뀌었을 때 행 배치 재계산
+            log_list.set_data(logs, daily_stats, expanded_dates)
+
+        log_canvas.bind("<Configure>", log_list.render)
         
         # 마우스 휠 스크롤
         def on_mousewheel(event):
-            log_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+            log_list.scroll(int(-1*(event.delta/120)))
         
         sw.bind("<MouseWheel>", on_mousewheel)
         
@@ -627,10 +522,26 @@ def open_stats_window(app):
             app.stats_window_y = sw.winfo_y()
             app.stats_window_w = sw.winfo_width()
             app.stats_window_h = sw.winfo_height()
-            sw.destroy()
-            app.stats_window = None
+            resize_coalescer.cancel()
+            # 파괴하지 않고 숨김 (다시 열 때 위젯/캔버스를 재사용, app.stats_window도 유지하여 테마/언어 변경을 계속 반영)
+            app.windows.hide("stats")
             
         sw.protocol("WM_DELETE_WINDOW", on_close)
+
+        def on_reopen():
+            """숨겨 둔 창을 다시 열 때, 마지막으로 본 이후 바뀐 부분만 다시 조회합니다.
+
+            날짜나 조회 기간이 바뀌었으면 전체를, 로그만 바뀌었으면 최근 범위만 다시 읽습니다.
+            """
+            def on_checked(version):
+                if not sw.winfo_exists():
+                    return
+                if datetime.now().strftime("%Y-%m-%d") != seen_day or current_view_days != seen_view_days:
+                    reload_data()
+                elif version != seen_version:
+                    refresh_recent_data()
+            app.db_worker.submit(get_data_version, callback=on_checked, error_callback=lambda e: reload_data())
+        sw.on_reopen = on_reopen
         
         def refresh_theme():
             new_colors = app.colors
@@ -654,7 +565,8 @@ def open_stats_window(app):
                 for child in w.winfo_children():
                     update_recursive(child)
             update_recursive(sw)
-            draw_graph()
+            chart.refresh_style()
+            log_list.refresh_style()
             draw_logs()
             
         sw.refresh_theme = refresh_theme
@@ -677,9 +589,6 @@ def open_stats_window(app):
         def refresh_internal_ui_scale():
             sf = app.scale_factor
             
-            # 툴팁 폰트 업데이트
-            tooltip_font.configure(size=int(8*sf), weight="bold")
-            
             # Update fonts of labels and buttons
             label_title.configure(font=("Helvetica", int(11*sf), "bold"))
             label_summary.configure(font=("Helvetica", int(10*sf), "bold"))
@@ -690,13 +599,15 @@ def open_stats_window(app):
             rb_daily.configure(font=("Helvetica", int(8*sf)))
             rb_tasks.configure(font=("Helvetica", int(8*sf)))
             rb_hourly.configure(font=("Helvetica", int(8*sf)))
+            rb_heatmap.configure(font=("Helvetica", int(8*sf)))
 
             # Update paddings
             graph_header.pack_configure(pady=(0, int(10*sf)))
             label_log_title.pack_configure(pady=(0, int(10*sf)))
 
             # Redraw canvases
-            draw_graph()
+            chart.refresh_style()
+            log_list.refresh_style()
             draw_logs()
         sw.refresh_internal_ui_scale = refresh_internal_ui_scale
 
@@ -721,10 +632,14 @@ def open_stats_window(app):
                 for child in w.winfo_children():
                     update_fonts(child)
             update_fonts(sw)
-            draw_graph()
+            chart.refresh_style()
+            log_list.refresh_style()
             draw_logs()
             
         sw.refresh_ui_scale = refresh_ui_scale
+
+        reload_data()
+        return sw
         
     except Exception as e:
         traceback.print_exc()
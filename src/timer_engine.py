@@ -1,13 +1,15 @@
 import time
 
 class TimerEngine:
-    def __init__(self):
+    def __init__(self, clock=None):
+        # 시간 기준 (기본: 단조 시계). 테스트/시뮬레이션에서는 가상 시계를 주입할 수 있음
+        self.clock = clock or time.monotonic
         self.mode = "work"  # "work" or "break"
         self.break_type = None  # "short" or "long"
         self.is_running = False
-        self.current_time = 25 * 60
+        self.deadline = None  # 실행 중일 때 종료 시각 (clock 기준 절대 시간)
+        self._remaining = 25 * 60  # 정지 상태의 남은 시간 (초)
         self.target_duration = 25 * 60
-        self.last_tick_time = 0
         
         # Settings
         self.work_min = 25
@@ -33,13 +35,36 @@ class TimerEngine:
                 self.target_duration = (self.long_break_min if self.break_type == "long" else self.short_break_min) * 60
             self.current_time = self.target_duration
 
+    @property
+    def current_time(self):
+        """남은 시간(초). 실행 중에는 종료 시각과 현재 시각의 차이로 계산됩니다."""
+        return self.remaining()
+
+    @current_time.setter
+    def current_time(self, value):
+        self._remaining = value
+        if self.is_running:
+            self.deadline = self.clock() + value
+
+    def remaining(self, now=None):
+        """남은 시간(초)을 반환합니다. 상태를 변경하지 않으므로 원하는 빈도로 호출할 수 있습니다."""
+        if not self.is_running or self.deadline is None:
+            return self._remaining
+        if now is None:
+            now = self.clock()
+        return max(0.0, self.deadline - now)
+
     def start(self):
         if not self.is_running:
             self.is_running = True
-            self.last_tick_time = time.time()
+            self.deadline = self.clock() + self._remaining
 
     def stop(self):
+        if self.is_running:
+            # 일시 정지 시점의 남은 시간을 보존
+            self._remaining = self.remaining()
         self.is_running = False
+        self.deadline = None
 
     def toggle(self):
         if self.is_running:
@@ -59,18 +84,16 @@ class TimerEngine:
         self.current_time = self.target_duration
 
     def tick(self):
-        """시간을 업데이트합니다. 타이머가 종료되면 True를 반환합니다."""
+        """종료 시각 도달 여부를 확인합니다. 타이머가 종료되면 True를 반환합니다."""
         if not self.is_running:
             return False
+        if self.deadline is None:
+            self.deadline = self.clock() + self._remaining
             
-        now = time.time()
-        elapsed = now - self.last_tick_time
-        self.last_tick_time = now
-        
-        self.current_time -= elapsed
-        if self.current_time <= 0:
-            self.current_time = 0
+        if self.clock() >= self.deadline:
+            self._remaining = 0
             self.is_running = False
+            self.deadline = None
             return True
         return False
 
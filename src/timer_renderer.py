@@ -0,0 +1,231 @@
+import math
+from PIL import Image, ImageColor, ImageDraw
+
+class TimerRenderer:
+    """타이머 다이얼 이미지를 생성합니다. 변하지 않는 정적 레이어는 캐싱하여 재사용합니다.
+
+    정적 레이어는 출력 크기로 축소한 완성 프레임으로 보관하고, 매 틱에는 파이 조각과 시간 텍스트가
+    있는 영역만 슈퍼샘플링으로 그려 축소한 뒤 그 프레임 위에 붙입니다.
+    """
+
+    SUPERSAMPLE = 2  # 고품질 렌더링을 위한 슈퍼샘플링 (2배 확대 후 축소)
+    RESAMPLE_MARGIN = 2  # 축소 필터(BILINEAR)가 참조하는 영역 밖 출력 픽셀 수 (경계가 전체 축소와 같도록)
+
+    def __init__(self, load_font):
+        self.load_font = load_font
+        self._layer_key = None
+        self._frame = None          # 파이 조각이 없는 출력 크기 완성 프레임 (정적 레이어 합성 후 축소)
+        self._base_patch = None     # 동적 영역의 배경 원 (슈퍼샘플링 좌표, 파이 조각 아래)
+        self._overlay_patch = None  # 동적 영역의 눈금, 중앙 원 등 (파이 조각 위)
+        self._patch_origin = None   # 패치 좌상단의 슈퍼샘플링 좌표
+        self._patch_box = None      # 패치 안에서 출력 영역에 해당하는 축소 범위
+        self._patch_dest = None     # 축소된 패치를 붙일 출력 좌표 (x0, y0, x1, y1)
+
+    def invalidate(self):
+        """캐시된 정적 레이어를 폐기합니다 (다음 렌더링 시 재생성)."""
+        self._layer_key = None
+        self._frame = None
+        self._base_patch = None
+        self._overlay_patch = None
+
+    def get_geometry(self, w, h):
+        """슈퍼샘플링 좌표계 기준의 중심점과 반지름을 반환합니다."""
+        img_w, img_h = w * self.SUPERSAMPLE, h * self.SUPERSAMPLE
+        cx, cy = img_w / 2, img_h / 2
+        radius = min(img_w, img_h) / 2 * 0.88
+        return img_w, img_h, cx, cy, radius
+
+    def render(self, w, h, colors, ui_scale, is_mini_mode, current_time, mode,
+               cycle_len=4, today_count=0, level=1, streak=0, level_progress=0.0, longest_streak=0):
+        """현재 상태의 타이머 이미지를 (w, h) 크기의 PIL 이미지로 반환합니다."""
+        img_w, img_h, cx, cy, radius = self.get_geometry(w, h)
+        arc_radius = radius * 0.65
+
+        # 현재 사이클 내 완료 횟수 계산
+        if mode == "break" and today_count > 0 and today_count % cycle_len == 0:
+            # 롱 브레이크 중일 때는 꽉 찬 상태로 표시
+            current_cycle_count = cycle_len
+        else:
+            current_cycle_count = today_count % cycle_len
+
+        # 레벨 진행 막대는 1% 단위로만 다시 그림
+        level_progress = round(min(max(level_progress, 0.0), 1.0), 2)
+
+        # 정적 레이어 캐시 키 (크기, 테마 색상, UI 스케일, 미니 모드 및 레이어에 포함된 표시 값)
+        key = (w, h, tuple(sorted(colors.items())), ui_scale, is_mini_mode,
+               cycle_len, current_cycle_count, level, streak, level_progress, longest_streak)
+        font_size_time = max(18, int(radius * 0.14))
+        font_time = self.load_font(font_size_time, bold=True)
+
+        if key != self._layer_key:
+            base, overlay = self._build_static_layers(img_w, img_h, cx, cy, radius, colors, ui_scale,
+                                                      is_mini_mode, cycle_len, current_cycle_count, level, streak,
+                                                      level_progress, longest_streak)
+            self._build_patch(w, h, cx, cy, arc_radius, font_time, base, overlay)
+            self._layer_key = key
+
+        # 동적 영역만 슈퍼샘플링 좌표로 그림 (패치 원점만큼 이동)
+        px, py = self._patch_origin
+        cx, cy = cx - px, cy - py
+        image = self._base_patch.copy()
+        draw = ImageDraw.Draw(image)
+
+        # 1. 남은 시간 영역 그리기
+        display_time = min(current_time, 3600)
+        angle = (display_time / 3600) * 360
+        color = "#FF5252" if mode == "work" else "#4CAF50"
+
+        if display_time >= 3600:
+            draw.ellipse((cx-arc_radius, cy-arc_radius, cx+arc_radius, cy+arc_radius), fill=color, outline=color)
+        elif display_time > 0:
+            # PIL은 3시 방향이 0도, 시계 방향으로 증가
+            # 12시 방향은 270도
+            start_angle = 270
+            end_angle = 270 + angle
+            draw.pieslice((cx-arc_radius, cy-arc_radius, cx+arc_radius, cy+arc_radius), start=start_angle, end=end_angle, fill=color, outline=color)
+
+        # 2. 정적 레이어(눈금, 중앙 원 등) 합성
+        image.alpha_composite(self._overlay_patch)
+
+        # 3. 중앙 디지털 시간 표시
+        mins, secs = divmod(int(current_time), 60)
+        time_str = "{:02d}:{:02d}".format(mins, secs)
+        draw.text((cx, cy), time_str, font=font_time, fill=colors["fg"], anchor="mm")
+
+        # 동적 영역만 축소(안티앨리어싱)하여 출력 크기 프레임에 붙임
+        x0, y0, x1, y1 = self._patch_dest
+        frame = self._frame.copy()
+        frame.paste(image.resize((x1 - x0, y1 - y0), resample=Image.BILINEAR, box=self._patch_box), (x0, y0))
+        return frame
+
+    def _build_patch(self, w, h, cx, cy, arc_radius, font_time, base, overlay):
+        """파이 조각/시간 텍스트 영역을 계산하고 정적 레이어를 출력 프레임과 동적 패치로 나눕니다."""
+        s = self.SUPERSAMPLE
+        # 파이 조각 원과 가장 넓은 시간 텍스트를 덮는 영역 (출력 픽셀 단위로 정렬)
+        text_box = ImageDraw.Draw(base).textbbox((cx, cy), "00:00", font=font_time, anchor="mm")
+        left = min(cx - arc_radius, text_box[0])
+        top = min(cy - arc_radius, text_box[1])
+        right = max(cx + arc_radius, text_box[2])
+        bottom = max(cy + arc_radius, text_box[3])
+        x0, y0 = max(0, math.floor(left / s) - 1), max(0, math.floor(top / s) - 1)
+        x1, y1 = min(w, math.ceil(right / s) + 1), min(h, math.ceil(bottom / s) + 1)
+
+        # 축소 필터가 경계 밖 픽셀도 참조하므로 여백을 두고 잘라냄
+        margin = self.RESAMPLE_MARGIN
+        sx0, sy0 = max(0, x0 - margin) * s, max(0, y0 - margin) * s
+        sx1, sy1 = min(w, x1 + margin) * s, min(h, y1 + margin) * s
+        self._patch_origin = (sx0, sy0)
+        self._patch_box = (x0 * s - sx0, y0 * s - sy0, x1 * s - sx0, y1 * s - sy0)
+        self._patch_dest = (x0, y0, x1, y1)
+        self._base_patch = base.crop((sx0, sy0, sx1, sy1))
+        self._overlay_patch = overlay.crop((sx0, sy0, sx1, sy1))
+
+        # 파이 조각이 없는 완성 프레임을 출력 크기로 한 번만 축소 (슈퍼샘플링 레이어는 보관하지 않음)
+        base.alpha_composite(overlay)
+        self._frame = base.resize((w, h), resample=Image.BILINEAR)
+
+    def _build_static_layers(self, img_w, img_h, cx, cy, radius, colors, ui_scale,
+                             is_mini_mode, cycle_len, current_cycle_count, level, streak,
+                             level_progress=0.0, longest_streak=0):
+        """슈퍼샘플링 크기의 (배경 레이어, 파이 조각 위 레이어)를 그려 반환합니다."""
+        supersample = self.SUPERSAMPLE
+
+        # 선 두께 계산 (UI 스케일 반영)
+        outline_width = max(1, int(3 * supersample * ui_scale))
+
+        # 0. 배경 원 (투명 배경 대신 캔버스 배경색으로 이미지 생성)
+        base = Image.new("RGBA", (img_w, img_h), colors["bg"])
+        draw = ImageDraw.Draw(base)
+        draw.ellipse((cx-radius, cy-radius, cx+radius, cy+radius), fill=colors["timer_bg"], outline=colors["timer_outline"], width=outline_width)
+
+        # 파이 조각 위에 얹는 레이어 (완전 투명, 가장자리 혼합 시 배경 원 색상 기준)
+        overlay = Image.new("RGBA", (img_w, img_h), _transparent(colors["timer_bg"]))
+        draw = ImageDraw.Draw(overlay)
+
+        # 1. 눈금 그리기 (0~60분)
+        font_size = max(9, int(radius * 0.09))
+        font = self.load_font(font_size, bold=True)
+
+        for i in range(60):
+            angle_deg = 90 - (i * 6)
+            angle_rad = math.radians(angle_deg)
+
+            if i % 5 == 0:
+                tick_len = 10 * supersample * ui_scale
+                width = 3.2805 * supersample * ui_scale
+
+                # 5분 단위 숫자 표시
+                text_radius = radius - (35 * supersample * ui_scale)
+                tx = cx + text_radius * math.cos(angle_rad)
+                ty = cy - text_radius * math.sin(angle_rad)
+                text = str(i if i != 0 else 60)
+                draw.text((tx, ty), text, font=font, fill=colors["timer_outline"], anchor="mm")
+            else:
+                tick_len = 5 * supersample * ui_scale
+                width = 1.64025 * supersample * ui_scale
+
+            x_out = cx + radius * math.cos(angle_rad)
+            y_out = cy - radius * math.sin(angle_rad)
+            x_in = cx + (radius - tick_len) * math.cos(angle_rad)
+            y_in = cy - (radius - tick_len) * math.sin(angle_rad)
+
+            draw.line((x_in, y_in, x_out, y_out), fill=colors["timer_outline"], width=int(width))
+
+        # 2. 중앙 원 (디지털 시간 배경)
+        center_radius = radius * 0.22
+        draw.ellipse((cx-center_radius, cy-center_radius, cx+center_radius, cy+center_radius), fill=colors["timer_center"])
+
+        if not is_mini_mode:
+            # 3. 집중 사이클 트래커 (Cycle Tracker) - 중앙 하단
+            dot_radius = 4 * supersample * ui_scale
+            dot_spacing = 10 * supersample * ui_scale
+            total_width = (cycle_len * dot_radius * 2) + ((cycle_len - 1) * dot_spacing)
+            start_x = cx - (total_width / 2) + dot_radius
+            dot_y = cy + (radius * 0.45) # 시간 텍스트 아래 적절한 위치
+
+            dot_outline_width = max(1, int(1.5 * supersample * ui_scale))
+
+            for i in range(cycle_len):
+                dx = start_x + i * (dot_radius * 2 + dot_spacing)
+
+                if i < current_cycle_count:
+                    fill_color = colors["fg"]
+                    outline_color = colors["fg"]
+                else:
+                    fill_color = colors["timer_center"]
+                    outline_color = "#AAAAAA"
+
+                draw.ellipse((dx - dot_radius, dot_y - dot_radius, dx + dot_radius, dot_y + dot_radius),
+                             fill=fill_color, outline=outline_color, width=dot_outline_width)
+
+            # 4. 게이미피케이션 정보 (레벨 & 스트릭) - 상단 좌우 배치
+            # 배경 원 바깥 영역이므로 배경 레이어에 그림
+            draw_base = ImageDraw.Draw(base)
+            stats_font_size = int(14 * supersample * ui_scale) # 화면상 약 14pt
+            stats_font = self.load_font(stats_font_size, bold=True)
+
+            pad = 20 * supersample * ui_scale
+
+            # Lv 표시 (좌측 상단) 및 다음 레벨까지 진행 막대
+            draw_base.text((pad, pad), f"Lv.{level}", font=stats_font, fill=colors["fg"], anchor="lt")
+            level_box = draw_base.textbbox((pad, pad), f"Lv.{level}", font=stats_font, anchor="lt")
+            bar_top = level_box[3] + 4 * supersample * ui_scale
+            bar_height = 3 * supersample * ui_scale
+            bar_width = max(level_box[2] - level_box[0], 40 * supersample * ui_scale)
+            draw_base.rectangle((pad, bar_top, pad + bar_width, bar_top + bar_height), fill=colors["timer_outline"])
+            if level_progress > 0:
+                draw_base.rectangle((pad, bar_top, pad + bar_width * level_progress, bar_top + bar_height), fill=colors["fg"])
+
+            # Streak 표시 (우측 상단), 최장 기록은 그 아래 작게
+            if streak > 0:
+                draw_base.text((img_w - pad, pad), f"🔥 {streak}", font=stats_font, fill=colors["fg"], anchor="rt")
+            if longest_streak > streak:
+                best_font = self.load_font(int(stats_font_size * 0.7), bold=False)
+                best_y = pad + stats_font_size * 1.3
+                draw_base.text((img_w - pad, best_y), f"🏆 {longest_streak}", font=best_font, fill=colors["timer_outline"], anchor="rt")
+
+        return base, overlay
+
+def _transparent(color):
+    """색상 문자열을 알파값 0인 RGBA 튜플로 변환합니다."""
+    return ImageColor.getrgb(color)[:3] + (0,)
@@ -3,15 +3,18 @@ import os
 from datetime import datetime, timedelta
 import time
 from common import get_user_data_path
-import json
 import threading
-import csv
-from tkinter import filedialog, messagebox
 import webbrowser
-import sqlite3
-import math
 import urllib.request
+import atexit
+from contextlib import contextmanager
 from PIL import Image, ImageTk
+from database import Database
+import schema
+from migration import LegacyLogMigrator
+from gamification import GamificationState
+from perf import timed
+from query_cache import QueryCache, MISS
 
 def play_sound():
     """운영체제에 맞는 알림음을 재생합니다 (시스템 비프음 사용)."""
@@ -48,124 +51,157 @@ def play_tick_sound():
     except Exception:
         pass
 
-_db_initialized = False
+_db = None
+_db_path = None # None이면 사용자 데이터 폴더의 godmode_log.db
+_db_lock = threading.Lock()
+
+# 작업 id -> 작업명 (메모리 인터닝: 같은 작업의 로그는 모두 같은 문자열 객체를 공유)
+# DB 세션 안에서만 읽고 쓰며, 작업명 변경/전체 삭제/연결 종료 시 비웁니다.
+_task_names = {}
+
+# 이 프로세스에서 로그 DB를 수정한 횟수 (PRAGMA data_version은 같은 연결의 쓰기를 반영하지 않으므로 직접 셈)
+_write_count = 0
+
+# 조회 결과 캐시 (데이터 버전이 바뀌면 전체 무효화, DB 세션 안에서만 사용)
+QUERY_CACHE_SIZE = 64
+_query_cache = QueryCache(QUERY_CACHE_SIZE)
+
+def _mark_written():
+    """로그 DB 쓰기가 끝났음을 기록합니다 (DB 세션 안에서 호출)."""
+    global _write_count
+    _write_count += 1
+
+def _data_version(conn):
+    return conn.execute("PRAGMA data_version").fetchone()[0], _write_count
+
+def get_data_version():
+    """로그 DB의 데이터 버전을 반환합니다. 값이 같으면 그 사이에 로그가 바뀌지 않은 것입니다.
+
+    (PRAGMA data_version, 프로세스 내 쓰기 횟수) 쌍이라 다른 연결(생성기/외부 도구)의 커밋과
+    앱 자신의 쓰기를 모두 감지합니다.
+    """
+    with db_session() as conn:
+        return _data_version(conn)
+
+def _cached_query(conn, key, compute):
+    """key(조회 이름, 파라미터)의 결과를 캐시에서 찾고, 없으면 compute(conn)로 계산해 보관합니다.
+
+    데이터 버전 확인(PRAGMA 한 번)만으로 반복 조회를 처리하며, 반환값은 캐시와 공유되므로 호출자가 복사합니다.
+    """
+    _query_cache.validate(_data_version(conn))
+    result = _query_cache.get(key)
+    if result is MISS:
+        result = compute(conn)
+        _query_cache.put(key, result)
+    return result
+
+def clear_query_cache():
+    """조회 결과 캐시를 비웁니다 (벤치마크/테스트용, 정상 동작에서는 데이터 버전으로 자동 무효화)."""
+    # 캐시 조회/채우기와 같은 DB 세션 잠금 안에서 비움 (워커 스레드의 채우기와 경합 방지)
+    with db_session():
+        _query_cache.clear()
+
+@contextmanager
+def write_session():
+    """쓰기용 DB 세션입니다. 블록이 끝나면 데이터 버전을 올려 조회 캐시와 열린 창이 변경을 알게 합니다."""
+    with db_session() as conn:
+        yield conn
+        _mark_written()
+
+def _task_name(conn, task_id):
+    """작업 id에 해당하는 작업명을 반환합니다 (작업 없음은 빈 문자열)."""
+    name = _task_names.get(task_id)
+    if name is None:
+        # 모르는 id가 나오면 tasks 전체를 한 번에 다시 읽음 (작업 수만큼만)
+        _task_names.update((row['id'], row['name']) for row in conn.execute("SELECT id, name FROM tasks"))
+        name = _task_names.get(task_id, "")
+    return name
+
+def _init_db(conn):
+    """최초 연결 시 스키마를 최신 버전으로 마이그레이션합니다. (기존 텍스트 로그 이관은 LegacyLogMigrator가 별도로 수행)"""
+    from_version, to_version = schema.migrate(conn)
+    if from_version != to_version:
+        print(f"🔧 DB 스키마 업데이트: v{from_version} -> v{to_version}")
+
+def rebuild_daily_stats():
+    """날짜별/작업별 집계 테이블을 로그로부터 재생성하고 집계된 날짜 수를 반환합니다."""
+    with write_session() as conn:
+        schema.rebuild_task_stats(conn)
+        return schema.rebuild_daily_stats(conn)
+
+def get_legacy_migrator(batch_size=None):
+    """기존 텍스트 로그가 남아 있으면 이관기를, 없으면 None을 반환합니다."""
+    txt_path = get_user_data_path("godmode_log.txt")
+    if not os.path.exists(txt_path):
+        return None
+    return LegacyLogMigrator(txt_path, write_session, batch_size)
+
+def migrate_legacy_logs(progress=None):
+    """기존 텍스트 로그를 끝까지 이관하고 최종 지표를 반환합니다 (이관할 파일이 없으면 None)."""
+    migrator = get_legacy_migrator()
+    if migrator is None:
+        return None
+    print("🔄 기존 로그를 SQLite 데이터베이스로 이관 중...")
+    metrics = migrator.run(progress)
+    print(f"✅ 데이터 이관 완료. ({migrator.summary()})")
+    return metrics
+
+def get_db():
+    """앱 전체에서 공유하는 로그 DB 관리자를 반환합니다 (최초 호출 시 생성)."""
+    global _db
+    with _db_lock:
+        if _db is None:
+            _db = Database(_db_path or get_user_data_path("godmode_log.db"), on_first_connect=_init_db)
+        return _db
+
+def use_database(path=None):
+    """공유 DB를 다른 파일로 전환합니다 (벤치마크/도구용, None이면 기본 경로로 복귀)."""
+    global _db_path
+    close_db()
+    _db_path = path
+
+def close_db():
+    """공유 DB 연결을 닫습니다. 앱 종료 시 호출합니다."""
+    global _db
+    with _db_lock:
+        if _db is not None:
+            # 캐시 조회/채우기와 같은 DB 세션 잠금 안에서 닫고 비움
+            with _db.lock:
+                _db.close()
+                _query_cache.clear()
+            _db = None
+        else:
+            _query_cache.clear()
+        _task_names.clear()
+        # 새 연결의 PRAGMA data_version은 이전 연결과 비교할 수 없으므로 버전을 넘겨 둠
+        _mark_written()
+
+atexit.register(close_db)
 
 def get_db_connection():
-    """SQLite 데이터베이스 연결을 반환하고, 필요 시 테이블 생성 및 마이그레이션을 수행합니다."""
-    global _db_initialized
-    db_path = get_user_data_path("godmode_log.db")
-    
-    # 최초 실행 시 테이블 생성 및 데이터 이관
-    if not _db_initialized:
-        conn = sqlite3.connect(db_path)
-        c = conn.cursor()
-        # 테이블 생성
-        c.execute('''CREATE TABLE IF NOT EXISTS logs
-                     (timestamp TEXT PRIMARY KEY, event TEXT, duration INTEGER, task TEXT, status TEXT)''')
-        c.execute('''CREATE INDEX IF NOT EXISTS idx_timestamp ON logs (timestamp)''')
-        conn.commit()
-        
-        # 기존 텍스트 로그 파일이 있다면 DB로 마이그레이션
-        txt_path = get_user_data_path("godmode_log.txt")
-        if os.path.exists(txt_path):
-            print("🔄 기존 로그를 SQLite 데이터베이스로 이관 중...")
-            migrated_count = 0
-            skipped_count = 0
-            try:
-                with open(txt_path, "r", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line: continue
-                        try:
-                            # JSON 파싱
-                            entry = json.loads(line)
-                            ts = entry.get("timestamp")
-                            dur = entry.get("duration", 25)
-                            task = entry.get("task")
-                            status = entry.get("status", "success")
-                            
-                            if ts:
-                                c.execute("INSERT OR IGNORE INTO logs (timestamp, event, duration, task, status) VALUES (?, ?, ?, ?, ?)", 
-                                          (ts, "godmode_complete", dur, task, status))
-                                if c.rowcount > 0:
-                                    migrated_count += 1
-                                else:
-                                    skipped_count += 1
-                        except (json.JSONDecodeError, sqlite3.Error):
-                            continue
-                conn.commit()
-                # 이관 완료 후 원본 파일 이름 변경 (백업)
-                backup_path = txt_path + ".migrated"
-                if os.path.exists(backup_path):
-                    backup_path = txt_path + f".migrated_{int(time.time())}"
-                
-                os.rename(txt_path, backup_path)
-                print(f"✅ 데이터 이관 완료. (성공: {migrated_count}, 중복/건너뜀: {skipped_count})")
-            except Exception as e:
-                print(f"⚠️ 데이터 이관 실패: {e}")
-        
-        conn.close()
-        _db_initialized = True
+    """공유 SQLite 연결을 반환합니다. 연결은 앱 종료 시까지 유지되므로 닫지 마세요."""
+    return get_db().get_connection()
 
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    return conn
+def db_session():
+    """공유 연결을 잠금과 함께 사용하는 트랜잭션 컨텍스트를 반환합니다."""
+    return get_db().session()
 
+@timed("db.log_godmode")
 def log_godmode(task_name=None, duration=25, status="success"):
     """완료된 갓생(집중)을 DB에 기록합니다."""
     try:
-        conn = get_db_connection()
-        c = conn.cursor()
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        c.execute("INSERT INTO logs (timestamp, event, duration, task, status) VALUES (?, ?, ?, ?, ?)",
-                  (now, "godmode_complete", duration, task_name, status))
-        conn.commit()
-        conn.close()
+        with write_session() as conn:
+            now = datetime.now().replace(microsecond=0)
+            ts, day, hour, start_day = schema.time_columns(now, duration)
+            conn.execute("INSERT OR IGNORE INTO tasks (name) VALUES (?)", (task_name or "",))
+            conn.execute("""INSERT INTO logs (timestamp, event, duration, status, ts, day, hour, start_day, task_id)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, (SELECT id FROM tasks WHERE name = ?))""",
+                         (now.strftime("%Y-%m-%d %H:%M:%S"), "godmode_complete", duration, status, ts, day, hour, start_day,
+                          task_name or ""))
         print(f"💾 기록이 DB에 저장되었습니다.")
     except Exception as e:
         print(f"\n로그 저장 실패: {e}")
 
-def export_csv(parent, loc=None):
-    """DB 데이터를 CSV 파일로 내보냅니다."""
-    file_path = filedialog.asksaveasfilename(
-        parent=parent,
-        defaultextension=".csv",
-        filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
-        title=loc.get("export_csv_title") if loc else "CSV로 내보내기",
-        initialfile=f"godmode_logs_{datetime.now().strftime('%Y%m%d')}.csv"
-    )
-
-    if not file_path:
-        return
-
-    try:
-        conn = get_db_connection()
-        c = conn.cursor()
-        c.execute("SELECT timestamp, duration, task, status FROM logs ORDER BY timestamp DESC")
-        rows = c.fetchall()
-        conn.close()
-
-        if not rows:
-            title = loc.get("notice") if loc else "알림"
-            msg = loc.get("no_log_msg") if loc else "기록된 로그가 없습니다."
-            messagebox.showinfo(title, msg, parent=parent)
-            return
-
-        with open(file_path, "w", encoding="utf-8-sig", newline="") as f_out:
-            writer = csv.writer(f_out)
-            writer.writerow(["Timestamp", "Duration (min)", "Task", "Status"])
-            
-            for row in rows:
-                writer.writerow([row['timestamp'], row['duration'], row['task'] or "", row['status']])
-
-        title = loc.get("done") if loc else "완료"
-        msg = loc.get("export_success_msg") if loc else "CSV 내보내기가 완료되었습니다."
-        messagebox.showinfo(title, msg, parent=parent)
-    except Exception as e:
-        title = loc.get("error") if loc else "오류"
-        msg = loc.get("export_fail_fmt", error=e) if loc else f"내보내기 실패: {e}"
-        messagebox.showerror(title, msg, parent=parent)
-
 def show_toast(title, message):
     """Windows 10/11 알림 센터에 토스트 메시지를 띄웁니다. (WinRT 사용)"""
     if sys.platform != "win32":
@@ -200,165 +236,175 @@ def show_toast(title, message):
     except Exception as e:
         print(f"⚠️ 알림 전송 실패: {e}")
 
+@timed("db.delete_log")
 def delete_log(target_timestamp):
     """특정 타임스탬프의 로그를 DB에서 삭제합니다."""
     try:
-        conn = get_db_connection()
-        c = conn.cursor()
-        c.execute("DELETE FROM logs WHERE timestamp = ?", (target_timestamp,))
-        conn.commit()
-        conn.close()
+        with write_session() as conn:
+            conn.execute("DELETE FROM logs WHERE timestamp = ?", (target_timestamp,))
         return True
     except Exception:
         return False
 
+@timed("db.update_log")
 def update_log(target_timestamp, new_task_name):
     """특정 타임스탬프의 로그(작업명)를 DB에서 수정합니다."""
     try:
-        conn = get_db_connection()
-        c = conn.cursor()
-        c.execute("UPDATE logs SET task = ? WHERE timestamp = ?", (new_task_name, target_timestamp))
-        conn.commit()
-        conn.close()
+        with write_session() as conn:
+            conn.execute("UPDATE logs SET task = ? WHERE timestamp = ?", (new_task_name, target_timestamp))
+        return True
+    except Exception:
+        return False
+
+@timed("db.rename_task")
+def rename_task(old_name, new_name):
+    """모든 기록에서 작업명을 한 번에 변경합니다 (이미 있는 작업명이면 해당 작업으로 병합)."""
+    try:
+        with write_session() as conn:
+            row = conn.execute("SELECT id FROM tasks WHERE name = ?", (old_name,)).fetchone()
+            if row is None:
+                return False
+            target = conn.execute("SELECT id FROM tasks WHERE name = ?", (new_name,)).fetchone()
+            if target is None:
+                # 작업 행 하나만 수정 (로그는 id로 참조하므로 그대로)
+                conn.execute("UPDATE tasks SET name = ? WHERE id = ?", (new_name, row['id']))
+            elif target['id'] != row['id']:
+                # 병합: 로그의 참조를 옮기면 트리거가 작업별 집계도 옮김
+                conn.execute("UPDATE logs SET task_id = ? WHERE task_id = ?", (target['id'], row['id']))
+                conn.execute("DELETE FROM tasks WHERE id = ?", (row['id'],))
+            _task_names.clear()
         return True
     except Exception:
         return False
 
+@timed("db.clear_all_logs")
 def clear_all_logs():
     """DB의 모든 로그 데이터를 삭제합니다."""
     try:
-        conn = get_db_connection()
-        c = conn.cursor()
-        c.execute("DELETE FROM logs")
-        conn.commit()
-        c.execute("VACUUM")
-        conn.commit()
-        conn.close()
+        with write_session() as conn:
+            conn.execute("DELETE FROM logs")
+            conn.execute("DELETE FROM task_daily_stats")
+            conn.execute("DELETE FROM tasks")
+            GamificationState.recompute(conn)
+            _task_names.clear()
+            conn.commit()
+            conn.execute("VACUUM")
         return True
     except Exception:
         return False
 
-def parse_logs(days=30):
-    """DB를 읽어 최근 N일간의 날짜별 집중 횟수와 시간을 계산합니다."""
+def parse_logs(days=30, now=None):
+    """DB를 읽어 최근 N일간의 날짜별 집중 횟수와 시간을 계산합니다. now는 기준 시각입니다 (기본값: 현재)."""
     # 기준 날짜 설정 (오늘로부터 days일 전)
-    cutoff_date = datetime.now() - timedelta(days=days)
-    cutoff_str = cutoff_date.strftime("%Y-%m-%d %H:%M:%S")
+    cutoff_date = (now or datetime.now()) - timedelta(days=days)
+    return get_daily_stats(cutoff_date.strftime("%Y-%m-%d"))
 
+@timed("db.get_daily_stats")
+def get_daily_stats(start_day, end_day=None):
+    """start_day ~ end_day(포함, YYYY-MM-DD) 범위의 날짜별 집중 횟수와 시간을 반환합니다."""
     daily_stats = {}
     try:
-        conn = get_db_connection()
-        c = conn.cursor()
-        
-        # 날짜별 그룹화 쿼리 (SQLite substr 사용)
-        # timestamp 형식: YYYY-MM-DD HH:MM:SS
-        # substr(timestamp, 1, 10) -> YYYY-MM-DD
-        query = """
-            SELECT 
-                substr(timestamp, 1, 10) as date_key,
-                COUNT(*) as count,
-                SUM(duration) as total_duration
-            FROM logs 
-            WHERE timestamp >= ? AND status = 'success'
-            GROUP BY date_key
-        """
-        c.execute(query, (cutoff_str,))
-        rows = c.fetchall()
-        conn.close()
-
-        for row in rows:
-            date_key = row['date_key']
-            daily_stats[date_key] = {
-                'count': row['count'],
-                'duration': row['total_duration'] if row['total_duration'] else 0,
+        # 날짜별 집계 테이블(daily_stats)에서 바로 조회 (logs 전체 그룹화 불필요)
+        if end_day:
+            query = "SELECT day, count, duration FROM daily_stats WHERE day >= ? AND day <= ?"
+            params = (start_day, end_day)
+        else:
+            query = "SELECT day, count, duration FROM daily_stats WHERE day >= ?"
+            params = (start_day,)
+        with db_session() as conn:
+            rows = _cached_query(conn, ("daily_stats",) + params,
+                                 lambda conn: [(row['day'], row['count'], row['duration']) for row in conn.execute(query, params)])
+
+        # 호출자가 결과를 수정해도 캐시가 바뀌지 않도록 딕셔너리는 매번 새로 만듦 (날짜 수만큼)
+        for day, count, duration in rows:
+            daily_stats[day] = {
+                'count': count,
+                'duration': duration if duration else 0,
                 'tasks': [] # 호환성을 위해 빈 리스트 유지
             }
     except Exception:
         pass
     return daily_stats
 
+@timed("db.get_gamification_stats")
 def get_gamification_stats():
-    """사용자의 레벨과 스트릭(연속 달성일) 정보를 반환합니다."""
-    try:
-        conn = get_db_connection()
-        c = conn.cursor()
+    """사용자의 레벨과 스트릭(연속 달성일) 정보를 반환합니다.
 
-        # 1. 총 집중 시간 (레벨 계산용)
-        c.execute("SELECT SUM(duration) FROM logs WHERE status='success'")
-        res = c.fetchone()
-        total_duration = res[0] if res and res[0] else 0
-
-        # 2. 스트릭 계산 (최근 1년치 데이터만 조회)
-        c.execute("SELECT DISTINCT substr(timestamp, 1, 10) as date_key FROM logs WHERE status='success' ORDER BY date_key DESC LIMIT 365")
-        rows = c.fetchall()
-        dates = set(row[0] for row in rows)
-        
-        conn.close()
-
-        streak = 0
-        check_date = datetime.now().date()
-        date_str = check_date.strftime("%Y-%m-%d")
-
-        # 오늘 기록이 없으면 어제부터 확인 (오늘 안 했어도 스트릭이 끊기진 않음)
-        if date_str not in dates:
-            check_date -= timedelta(days=1)
-            date_str = check_date.strftime("%Y-%m-%d")
-        
-        # 과거로 거슬러 올라가며 연속된 날짜 확인
-        while date_str in dates:
-            streak += 1
-            check_date -= timedelta(days=1)
-            date_str = check_date.strftime("%Y-%m-%d")
-
-        # 레벨 계산 (공식: 1 + sqrt(총 분 / 25)) -> 25분(1회)=Lv2, 100분(4회)=Lv3
-        level = 1 + int(math.sqrt(total_duration / 25))
-
-        return {
-            'level': level,
-            'streak': streak,
-            'total_duration': total_duration
-        }
+    DB에 누적 저장된 상태(단일 행)만 읽으며, 날짜 삭제 등으로 무효화된 경우에만 전체를 다시 계산합니다.
+    """
+    try:
+        with db_session() as conn:
+            state = _cached_query(conn, ("gamification",), GamificationState.load)
+        # 연속 달성일은 오늘 날짜 기준이므로 스냅샷은 매번 계산
+        return state.snapshot()
     except Exception:
-        return {'level': 1, 'streak': 0, 'total_duration': 0}
-
-def get_task_stats(days=30, date_filter=None):
-    """DB에서 작업별 통계를 집계하여 반환합니다."""
-    cutoff_date = datetime.now() - timedelta(days=days)
-    cutoff_str = cutoff_date.strftime("%Y-%m-%d %H:%M:%S")
-    
+        return {'level': 1, 'level_progress': 0.0, 'streak': 0, 'longest_streak': 0, 'total_duration': 0}
+
+def recompute_gamification():
+    """게이미피케이션 상태를 날짜별 집계로부터 다시 계산하고 화면 표시 값을 반환합니다."""
+    with write_session() as conn:
+        return GamificationState.recompute(conn).snapshot()
+
+def get_today_stats():
+    """오늘의 집중 횟수/시간과 레벨/스트릭을 한 번에 조회합니다 (메인 화면 갱신용)."""
+    today_str = datetime.now().strftime("%Y-%m-%d")
+    stats = parse_logs(days=1).get(today_str, {'count': 0, 'duration': 0})
+    game_stats = get_gamification_stats()
+    return {
+        'count': stats['count'],
+        'duration': stats.get('duration', 0),
+        'level': game_stats.get('level', 1),
+        'level_progress': game_stats.get('level_progress', 0.0),
+        'streak': game_stats.get('streak', 0),
+        'longest_streak': game_stats.get('longest_streak', 0)
+    }
+
+@timed("db.get_task_stats")
+def get_task_stats(days=30, date_filter=None, now=None):
+    """DB에서 작업별 통계를 집계하여 반환합니다. days가 None이면 전체 기록 기준이며, now는 최근 N일의 기준 시각입니다."""
     task_stats = []
     try:
-        conn = get_db_connection()
-        c = conn.cursor()
-        
+        # logs를 그룹화하지 않고 작업별 집계 테이블만 조회 (작업 수 x 날짜 수 규모)
         if date_filter:
             # 특정 날짜 필터링 (date_filter: YYYY-MM-DD)
+            # 날짜 자체가 범위이므로 기간 제한 없이 해당 일자로 조회
+            query = """
+                SELECT task_id, SUM(duration) as total_duration
+                FROM task_daily_stats
+                WHERE day = ?
+                GROUP BY task_id
+                ORDER BY total_duration DESC
+            """
+            params = (date_filter,)
+        elif days is None:
+            # 전체 기록 (작업별 누적값)
             query = """
-                SELECT task, SUM(duration) as total_duration
-                FROM logs 
-                WHERE timestamp >= ? AND status = 'success' AND substr(timestamp, 1, 10) = ?
-                GROUP BY task
+                SELECT id AS task_id, duration AS total_duration
+                FROM tasks
+                WHERE count > 0
                 ORDER BY total_duration DESC
             """
-            c.execute(query, (cutoff_str, date_filter))
+            params = ()
         else:
-            # 전체 기간
+            # 최근 N일
+            cutoff_day = ((now or datetime.now()) - timedelta(days=days)).strftime("%Y-%m-%d")
             query = """
-                SELECT task, SUM(duration) as total_duration
-                FROM logs 
-                WHERE timestamp >= ? AND status = 'success'
-                GROUP BY task
+                SELECT task_id, SUM(duration) as total_duration
+                FROM task_daily_stats
+                WHERE day >= ?
+                GROUP BY task_id
                 ORDER BY total_duration DESC
             """
-            c.execute(query, (cutoff_str,))
-            
-        rows = c.fetchall()
-        conn.close()
+            params = (cutoff_day,)
+
+        with db_session() as conn:
+            rows = _cached_query(conn, ("task_stats", query) + params,
+                                 lambda conn: [(_task_name(conn, row['task_id']), row['total_duration']) for row in conn.execute(query, params)])
         
-        total_sum = sum(row['total_duration'] for row in rows)
+        total_sum = sum(duration for _, duration in rows)
         
-        for row in rows:
-            task = row['task'] or "-"
-            duration = row['total_duration']
+        for name, duration in rows:
+            task = name or "-"
             pct = (duration / total_sum * 100) if total_sum > 0 else 0
             task_stats.append((task, duration, pct))
             
@@ -366,47 +412,175 @@ def get_task_stats(days=30, date_filter=None):
         pass
     return task_stats
 
-def get_recent_logs(days=30):
-    """최근 N일간의 로그 기록을 DB에서 조회하여 반환합니다 (최신순)."""
-    logs = []
-    has_more = False
-    
-    cutoff_date = datetime.now() - timedelta(days=days)
-    cutoff_str = cutoff_date.strftime("%Y-%m-%d %H:%M:%S")
+# --- 시간대 분석 (logs를 SQL에서 바로 집계, idx_logs_status_start_day 커버링 인덱스 범위 스캔) ---
+# 시작 시(hour)와 같은 기준이 되도록 날짜 범위와 요일은 모두 시작 날짜(start_day)로 계산
+
+def _day_range_sql(start_day, end_day):
+    """성공 기록 + 시작 날짜 범위(YYYY-MM-DD, 포함) 조건과 파라미터. start_day가 None이면 처음부터."""
+    where = "status = 'success' AND start_day >= ?"
+    params = [start_day or ""]
+    if end_day:
+        where += " AND start_day <= ?"
+        params.append(end_day)
+    return where, params
+
+@timed("db.get_hourly_stats")
+def get_hourly_stats(start_day=None, end_day=None):
+    """시작 시각(0~23시)별 집중 횟수와 시간을 반환합니다: {'count': [24], 'duration': [24]}"""
+    result = {'count': [0] * 24, 'duration': [0] * 24}
+    try:
+        where, params = _day_range_sql(start_day, end_day)
+        with db_session() as conn:
+            rows = conn.execute(f"SELECT hour, COUNT(*), IFNULL(SUM(duration), 0) FROM logs WHERE {where} GROUP BY hour",
+                                params).fetchall()
+        for hour, count, duration in rows:
+            if hour is not None and 0 <= hour < 24:
+                result['count'][hour] = count
+                result['duration'][hour] = duration
+    except Exception:
+        pass
+    return result
 
+@timed("db.get_weekday_hour_stats")
+def get_weekday_hour_stats(start_day=None, end_day=None):
+    """요일(월=0 ~ 일=6) x 시작 시각(0~23시)별 집중 횟수 행렬(7 x 24)을 반환합니다."""
+    matrix = [[0] * 24 for _ in range(7)]
     try:
-        conn = get_db_connection()
+        where, params = _day_range_sql(start_day, end_day)
+        # strftime('%w')는 일요일=0이므로 월요일=0 기준으로 변환
+        query = f"""
+            SELECT (CAST(strftime('%w', start_day) AS INTEGER) + 6) % 7 AS weekday, hour, COUNT(*)
+            FROM logs WHERE {where}
+            GROUP BY weekday, hour
+        """
+        with db_session() as conn:
+            rows = conn.execute(query, params).fetchall()
+        for weekday, hour, count in rows:
+            if weekday is not None and hour is not None and 0 <= hour < 24:
+                matrix[weekday][hour] = count
+    except Exception:
+        pass
+    return matrix
+
+@timed("db.get_task_hour_stats")
+def get_task_hour_stats(start_day=None, end_day=None, limit=8):
+    """작업별 시작 시각(0~23시) 분포를 집중 횟수가 많은 작업부터 최대 limit개 반환합니다: [(작업명, [24])]"""
+    task_hours = []
+    try:
+        where, params = _day_range_sql(start_day, end_day)
+        with db_session() as conn:
+            rows = conn.execute(f"SELECT task_id, hour, COUNT(*) FROM logs WHERE {where} GROUP BY task_id, hour",
+                                params).fetchall()
+            by_task = {}
+            for task_id, hour, count in rows:
+                if hour is not None and 0 <= hour < 24:
+                    by_task.setdefault(task_id, [0] * 24)[hour] = count
+            ranked = sorted(by_task.items(), key=lambda item: sum(item[1]), reverse=True)[:limit]
+            task_hours = [(_task_name(conn, task_id) or "-", hours) for task_id, hours in ranked]
+    except Exception:
+        pass
+    return task_hours
+
+def _logs_since(since):
+    """since(포함) 이후의 로그(최신순)와 더 오래된 로그 존재 여부를 캐시를 통해 조회합니다 (결과는 캐시와 공유)."""
+    def load(conn):
         c = conn.cursor()
-        
+
         # 1. 범위 내 로그 조회
-        c.execute("SELECT * FROM logs WHERE timestamp >= ? ORDER BY timestamp DESC", (cutoff_str,))
+        c.execute("SELECT * FROM logs WHERE timestamp >= ? ORDER BY timestamp DESC", (since,))
         rows = c.fetchall()
-        
+
         # 2. 더 오래된 로그가 있는지 확인 (has_more)
-        c.execute("SELECT 1 FROM logs WHERE timestamp < ? LIMIT 1", (cutoff_str,))
-        has_more = c.fetchone() is not None
-        
-        conn.close()
-
-        for row in rows:
-            try:
-                end_dt = datetime.strptime(row['timestamp'], "%Y-%m-%d %H:%M:%S")
-                duration = int(row['duration'])
-                start_dt = end_dt - timedelta(minutes=duration)
-                
-                logs.append({
-                    "start": start_dt,
-                    "end": end_dt,
-                    "duration": duration,
-                    "task": row['task'] or "-",
-                    "timestamp_str": row['timestamp']
-                })
-            except ValueError:
-                continue
+        c.execute("SELECT 1 FROM logs WHERE timestamp < ? LIMIT 1", (since,))
+        return _rows_to_logs(conn, rows), c.fetchone() is not None
+
+    with db_session() as conn:
+        return _cached_query(conn, ("logs_since", since), load)
+
+@timed("db.get_logs_since")
+def get_logs_since(since):
+    """since(YYYY-MM-DD HH:MM:SS, 포함) 이후의 로그를 최신순으로 반환합니다.
+
+    반환값: (logs, has_more) - has_more는 since보다 오래된 로그가 있는지 여부입니다.
+    로그 딕셔너리는 조회 캐시와 공유하므로, 항목 수정은 DB에 기록한 뒤에만 합니다.
+    """
+    try:
+        logs, has_more = _logs_since(since)
+        return list(logs), has_more
+    except Exception:
+        return [], False
+
+@timed("db.get_recent_logs")
+def get_recent_logs(days=30, now=None):
+    """최근 N일간의 로그 기록을 DB에서 조회하여 반환합니다 (최신순). now는 기준 시각입니다 (기본값: 현재).
+
+    목록은 매번 새로 만들지만 로그 딕셔너리는 조회 캐시와 공유하므로, 항목 수정은 DB에 기록한 뒤에만 합니다.
+    """
+    logs = []
+    has_more = False
+    
+    cutoff_date = (now or datetime.now()) - timedelta(days=days)
+    cutoff_str = cutoff_date.strftime("%Y-%m-%d %H:%M:%S")
+
+    try:
+        # 기준 시각은 초 단위로 바뀌므로 그날 0시부터를 캐시하고 기준 시각 이전 항목은 잘라냄
+        day_logs, has_older = _logs_since(cutoff_date.strftime("%Y-%m-%d 00:00:00"))
+
+        end = len(day_logs)
+        while end and day_logs[end - 1]['timestamp_str'] < cutoff_str:
+            end -= 1
+        logs = day_logs[:end]
+        has_more = has_older or end < len(day_logs)
+    except Exception:
+        pass
+    return logs, has_more
+
+def recent_logs_start(days=30):
+    """최근 N일 로그 조회가 캐시하는 범위의 시작 시각 (기준일 0시)"""
+    return (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d 00:00:00")
+
+LOG_PAGE_SIZE = 100
+
+@timed("db.get_logs_page")
+def get_logs_page(before_timestamp, limit=LOG_PAGE_SIZE):
+    """before_timestamp보다 오래된 로그를 최신순으로 최대 limit개 반환합니다 (키셋 페이지네이션).
+
+    반환값: (logs, has_more) - 다음 페이지는 logs[-1]['timestamp_str']을 기준으로 조회합니다.
+    """
+    logs = []
+    has_more = False
+    try:
+        # limit+1개를 조회하여 다음 페이지 존재 여부를 함께 판단 (idx_timestamp 범위 스캔)
+        with db_session() as conn:
+            rows = conn.execute("SELECT * FROM logs WHERE timestamp < ? ORDER BY timestamp DESC LIMIT ?",
+                                (before_timestamp, limit + 1)).fetchall()
+            has_more = len(rows) > limit
+            logs = _rows_to_logs(conn, rows[:limit])
     except Exception:
         pass
     return logs, has_more
 
+def _rows_to_logs(conn, rows):
+    """DB 행을 통계 창에서 사용하는 로그 딕셔너리 목록으로 변환합니다."""
+    logs = []
+    for row in rows:
+        try:
+            # 정수 epoch(ts)로 바로 생성 (문자열 파싱 없음)
+            end_dt = datetime.fromtimestamp(row['ts']) if row['ts'] is not None else datetime.fromisoformat(row['timestamp'])
+            duration = int(row['duration'])
+            start_dt = end_dt - timedelta(minutes=duration)
+            
+            logs.append({
+                "start": start_dt,
+                "end": end_dt,
+                "duration": duration,
+                "task": _task_name(conn, row['task_id']) or "-",
+                "timestamp_str": row['timestamp']
+            })
+        except (ValueError, TypeError):
+            continue
+    return logs
+
 def get_side_position(root, width, height, offset=10):
     """메인 윈도우 우측(공간 부족 시 좌측)에 팝업 위치를 반환합니다."""
     main_x = root.winfo_x()
@@ -0,0 +1,290 @@
+import tkinter.font as tkfont
+from bisect import bisect_left, bisect_right
+
+class VirtualLogList:
+    """통계 창의 로그 목록을 화면에 보이는 행만 그리는 가상화 리스트로 표시합니다.
+
+    행(날짜 헤더/로그 항목)의 시작 y좌표를 누적합 배열로 관리하여 이분 탐색으로 보이는 구간과
+    클릭 위치를 찾고, 캔버스 아이템은 풀에 보관하여 스크롤 시 재사용합니다.
+    """
+
+    OVERSCAN_ROWS = 4  # 보이는 영역 위/아래로 미리 그려둘 행 수
+
+    def __init__(self, canvas, app, format_duration, on_toggle_date, on_select_date, on_edit, on_delete):
+        self.canvas = canvas
+        self.app = app
+        self.format_duration = format_duration
+        self.on_toggle_date = on_toggle_date
+        self.on_select_date = on_select_date
+        self.on_edit = on_edit
+        self.on_delete = on_delete
+
+        self.task_font = tkfont.Font(family="Helvetica", size=9)
+        self.time_font = tkfont.Font(family="Helvetica", size=8)
+        self.header_font = tkfont.Font(family="Helvetica", size=9, weight="bold")
+        self.delete_font = tkfont.Font(family="Helvetica", size=12, weight="bold")
+
+        self.rows = []        # ("header", date_key, text, is_expanded) 또는 ("item", log)
+        self.offsets = []     # 각 행의 시작 y좌표 (오름차순 누적합)
+        self.heights = []     # 각 행의 높이 (간격 제외)
+        self.total_height = 0
+        self.width = 0
+
+        self.active = {}      # 행 인덱스 -> 현재 표시 중인 아이템 그룹
+        self.pools = {"header": [], "item": []}
+        self.empty_text_id = None
+
+        canvas.bind("<Button-1>", self.on_click)
+        canvas.bind("<Motion>", self.on_motion)
+        canvas.bind("<Leave>", lambda e: canvas.config(cursor=""))
+        self.refresh_style()
+
+    # --- 데이터 및 레이아웃 ---
+
+    def set_data(self, logs, daily_stats, expanded_dates):
+        """로그 목록/펼침 상태가 바뀌었을 때 행 배치를 다시 계산하고 보이는 영역을 그립니다."""
+        sf = self.app.scale_factor
+        header_height = int(26 * sf)
+        item_height = int(24 * sf)
+        group_gap = int(10 * sf)
+        header_gap = int(4 * sf)
+        padding = int(4 * sf)
+        weekdays = self.app.loc.get("weekdays")
+
+        rows = []
+        offsets = []
+        heights = []
+        y = int(10 * sf)
+        current_date_key = None
+
+        for log in logs:
+            date_key = log['start'].strftime("%Y-%m-%d")
+
+            # 날짜 헤더 (날짜가 바뀔 때마다)
+            if date_key != current_date_key:
+                if current_date_key is not None:
+                    y += group_gap # 날짜 그룹 간 간격
+                current_date_key = date_key
+
+                day_stats = daily_stats.get(date_key, {'count': 0, 'duration': 0})
+                text = self.app.loc.get("date_header_fmt", icon="", date=log['start'].strftime("%m/%d"),
+                                        weekday=weekdays[log['start'].weekday()], count=day_stats['count'],
+                                        time=self.format_duration(day_stats['duration'])).strip()
+                rows.append(("header", date_key, text, date_key in expanded_dates))
+                offsets.append(y)
+                heights.append(header_height)
+                y += header_height + header_gap
+
+            if date_key not in expanded_dates:
+                continue
+
+            rows.append(("item", log))
+            offsets.append(y)
+            heights.append(item_height)
+            y += item_height + padding
+
+        self.rows = rows
+        self.offsets = offsets
+        self.heights = heights
+        self.total_height = y + int(10 * sf)
+        self.invalidate()
+
+    def refresh_style(self):
+        """테마/UI 크기 변경 시 폰트를 갱신하고 재사용 중인 아이템을 모두 새로 만듭니다."""
+        sf = self.app.scale_factor
+        self.task_font.configure(size=int(9 * sf))
+        self.time_font.configure(size=int(8 * sf))
+        self.header_font.configure(size=int(9 * sf))
+        self.delete_font.configure(size=int(12 * sf))
+        self.canvas.delete("all")
+        self.active.clear()
+        self.pools = {"header": [], "item": []}
+        self.empty_text_id = None
+
+    def invalidate(self):
+        """표시 중인 아이템을 모두 풀로 반환하고 현재 스크롤 위치 기준으로 다시 그립니다."""
+        for index in list(self.active):
+            self._release(index)
+        self.render()
+
+    def row_at(self, y):
+        """캔버스 y좌표에 있는 행 인덱스를 반환합니다 (행 사이 간격이면 None)."""
+        index = bisect_right(self.offsets, y) - 1
+        if index < 0 or y >= self.offsets[index] + self.heights[index]:
+            return None
+        return index
+
+    # --- 렌더링 ---
+
+    def render(self, event=None):
+        """스크롤 영역과 겹치는 행(+오버스캔)만 그리고 벗어난 행의 아이템은 회수합니다."""
+        canvas = self.canvas
+        width = canvas.winfo_width()
+        if width <= 1:
+            return
+
+        if width != self.width:
+            # 폭이 바뀌면 우측 정렬 아이템과 말줄임 처리가 달라지므로 전체 다시 배치
+            self.width = width
+            for index in list(self.active):
+                self._release(index)
+
+        canvas.configure(scrollregion=(0, 0, width, self.total_height))
+        self._update_empty_message()
+
+        view_top = canvas.canvasy(0)
+        view_bottom = view_top + canvas.winfo_height()
+        first = max(0, bisect_right(self.offsets, view_top) - 1 - self.OVERSCAN_ROWS)
+        last = min(len(self.rows), bisect_left(self.offsets, view_bottom) + self.OVERSCAN_ROWS)
+
+        for index in list(self.active):
+            if index < first or index >= last:
+                self._release(index)
+
+        for index in range(first, last):
+            if index not in self.active:
+                self._place(index)
+
+    def yview(self, *args):
+        """스크롤바 명령을 처리하고 새로 보이는 행을 그립니다."""
+        self.canvas.yview(*args)
+        self.render()
+
+    def scroll(self, units):
+        """마우스 휠 스크롤을 처리합니다."""
+        self.canvas.yview_scroll(units, "units")
+        self.render()
+
+    def _update_empty_message(self):
+        sf = self.app.scale_factor
+        if self.rows:
+            if self.empty_text_id is not None:
+                self.canvas.delete(self.empty_text_id)
+                self.empty_text_id = None
+            return
+        if self.empty_text_id is None:
+            self.empty_text_id = self.canvas.create_text(0, 0, fill=self.app.colors["fg_sub"], font=("Helvetica", int(8 * sf)))
+        self.canvas.itemconfigure(self.empty_text_id, text=self.app.loc.get("no_logs_message"))
+        self.canvas.coords(self.empty_text_id, self.width / 2, int(30 * sf))
+
+    def _release(self, index):
+        group = self.active.pop(index)
+        for item_id in group["ids"]:
+            self.canvas.itemconfigure(item_id, state="hidden")
+        self.pools[group["kind"]].append(group)
+
+    def _acquire(self, kind):
+        pool = self.pools[kind]
+        if pool:
+            group = pool.pop()
+            for item_id in group["ids"]:
+                self.canvas.itemconfigure(item_id, state="normal")
+            return group
+
+        canvas = self.canvas
+        colors = self.app.colors
+        if kind == "header":
+            ids = (
+                canvas.create_rectangle(0, 0, 0, 0, fill=colors["btn_bg"], outline=""),
+                canvas.create_text(0, 0, anchor="w", font=self.header_font, fill=colors["fg"]),
+                canvas.create_text(0, 0, anchor="w", font=self.header_font, fill=colors["fg"]),
+            )
+        else:
+            ids = (
+                canvas.create_rectangle(0, 0, 0, 0, fill=colors["btn_bg"], outline=colors["btn_hover"]),
+                canvas.create_text(0, 0, anchor="w", font=self.time_font, fill=colors["fg_sub"]),
+                canvas.create_text(0, 0, anchor="w", font=self.task_font, fill=colors["fg"]),
+                canvas.create_text(0, 0, text="×", font=self.delete_font, fill=colors["fg_sub"], activefill="red"),
+            )
+        return {"kind": kind, "ids": ids}
+
+    def _place(self, index):
+        canvas = self.canvas
+        sf = self.app.scale_factor
+        row = self.rows[index]
+        y = self.offsets[index]
+        width = self.width
+        group = self._acquire(row[0])
+
+        if row[0] == "header":
+            _, date_key, text, is_expanded = row
+            bg_id, icon_id, text_id = group["ids"]
+            header_height = self.heights[index]
+            mid_y = y + header_height / 2
+            canvas.coords(bg_id, int(2 * sf), y, width - int(5 * sf), y + header_height)
+            canvas.coords(icon_id, int(8 * sf), mid_y)
+            canvas.itemconfigure(icon_id, text="▼" if is_expanded else "▶")
+            canvas.coords(text_id, int(24 * sf), mid_y)
+            canvas.itemconfigure(text_id, text=text)
+        else:
+            log = row[1]
+            rect_id, time_id, task_id, del_id = group["ids"]
+            item_height = self.heights[index]
+            time_range = f"{log['start'].strftime('%H:%M')} ~ {log['end'].strftime('%H:%M')} ({log['duration']}분)"
+            time_width = self.time_font.measure(time_range)
+
+            canvas.coords(rect_id, int(10 * sf), y, width - int(10 * sf), y + item_height)
+            canvas.coords(time_id, int(20 * sf), y + int(12 * sf))
+            canvas.itemconfigure(time_id, text=time_range)
+            canvas.coords(task_id, int(20 * sf) + time_width + int(10 * sf), y + int(12 * sf))
+            canvas.itemconfigure(task_id, text=self._fit_task(log['task'], time_width))
+            canvas.coords(del_id, width - int(20 * sf), y + int(12 * sf))
+
+        self.active[index] = group
+
+    def _fit_task(self, task, time_width):
+        """작업명이 남은 너비를 넘으면 말줄임표(...)로 자릅니다."""
+        sf = self.app.scale_factor
+        if task == "-":
+            task = ""
+        task = task.replace('\n', ' ').strip()
+
+        available_width = max(0, self.width - (time_width + int(50 * sf)))
+        if self.task_font.measure(task) > available_width - int(20 * sf): # 삭제 버튼 공간 확보
+            while self.task_font.measure(task + "...") > available_width and len(task) > 0:
+                task = task[:-1]
+            task += "..."
+        return task
+
+    # --- 이벤트 (캔버스 단위로 한 번만 바인딩, 위치로 대상 판별) ---
+
+    def _hit(self, event):
+        """이벤트 위치의 (동작, 대상)을 반환합니다. 동작: toggle/select/edit/delete 또는 None."""
+        x = self.canvas.canvasx(event.x)
+        y = self.canvas.canvasy(event.y)
+        index = self.row_at(y)
+        if index is None:
+            return None, None
+
+        sf = self.app.scale_factor
+        row = self.rows[index]
+        if row[0] == "header":
+            date_key, text = row[1], row[2]
+            if int(2 * sf) <= x <= int(26 * sf): # 화살표 아이콘 주변
+                return "toggle", date_key
+            text_x = int(24 * sf)
+            if text_x <= x <= text_x + self.header_font.measure(text): # 날짜 텍스트
+                return "select", date_key
+            return None, None
+
+        log = row[1]
+        if abs(x - (self.width - int(20 * sf))) <= int(8 * sf): # 삭제 버튼 (×)
+            return "delete", log
+        if int(10 * sf) <= x <= self.width - int(10 * sf):
+            return "edit", log
+        return None, None
+
+    def on_click(self, event):
+        action, target = self._hit(event)
+        if action == "toggle":
+            self.on_toggle_date(target)
+        elif action == "select":
+            self.on_select_date(target)
+        elif action == "edit":
+            self.on_edit(target)
+        elif action == "delete":
+            self.on_delete(target.get('timestamp_str'))
+
+    def on_motion(self, event):
+        action, _ = self._hit(event)
+        self.canvas.config(cursor="hand2" if action else "")
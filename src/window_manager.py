@@ -0,0 +1,86 @@
+class WindowManager:
+    """통계/설정처럼 자주 여닫는 Toplevel 창을 닫을 때 파괴하지 않고 숨겨 두었다가 다시 보여줍니다.
+
+    창마다 위젯 트리, 폰트, 캔버스를 매번 새로 만드는 대신 한 번 만든 창을 이름으로 보관합니다.
+    창은 다음 속성(선택)으로 수명 주기에 참여합니다.
+      - on_reopen(): 숨겨 둔 창을 다시 보여준 직후 호출 (바뀐 데이터만 반영)
+      - on_hide(): 창을 숨기기 직전 호출
+      - is_stale(): True를 반환하면 재사용하지 않고 파괴 후 다시 생성
+    """
+
+    def __init__(self):
+        self.windows = {}
+
+    def get(self, name):
+        """살아 있는(숨김 포함) 창을 반환합니다. 없으면 None."""
+        win = self.windows.get(name)
+        if win is None:
+            return None
+        try:
+            if win.winfo_exists():
+                return win
+        except Exception:
+            pass
+        del self.windows[name]
+        return None
+
+    def is_visible(self, name):
+        """창이 존재하고 화면에 표시 중인지 반환합니다."""
+        win = self.get(name)
+        return win is not None and win.winfo_viewable()
+
+    def show(self, name, build):
+        """보관 중인 창이 있으면 다시 보여주고, 없으면 build()로 만들어 보관한 뒤 반환합니다."""
+        win = self.get(name)
+        if win is not None and _call_hook(win, "is_stale"):
+            self.destroy(name)
+            win = None
+
+        if win is None:
+            win = build()
+            if win is not None:
+                self.windows[name] = win
+            return win
+
+        was_hidden = win.state() == "withdrawn"
+        win.deiconify()
+        win.lift()
+        win.focus_set()
+        if was_hidden:
+            _call_hook(win, "on_reopen")
+        return win
+
+    def hide(self, name):
+        """창을 파괴하지 않고 숨깁니다 (잡고 있던 grab도 해제)."""
+        win = self.get(name)
+        if win is None:
+            return
+        _call_hook(win, "on_hide")
+        try:
+            win.grab_release()
+        except Exception:
+            pass
+        win.withdraw()
+
+    def destroy(self, name):
+        """창을 실제로 파괴하고 보관 목록에서 제거합니다."""
+        win = self.windows.pop(name, None)
+        if win is None:
+            return
+        try:
+            if win.winfo_exists():
+                win.destroy()
+        except Exception:
+            pass
+
+    def destroy_all(self):
+        """보관 중인 모든 창을 파괴합니다 (앱 종료 시 호출)."""
+        for name in list(self.windows):
+            self.destroy(name)
+
+def _call_hook(win, hook):
+    """창에 등록된 수명 주기 훅이 있으면 호출하고 결과를 반환합니다."""
+    func = getattr(win, hook, None)
+    if func is None:
+        return None
+    return func()
@@ -0,0 +1,71 @@
+import unittest
+import sys
+import os
+import sqlite3
+import tempfile
+import shutil
+
+# src 폴더와 프로젝트 루트(benchmarks 패키지)를 모듈 검색 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks import runner
+from benchmarks.dataset import build_dataset, parse_sizes, dataset_path, END_DAY
+
+class TestBenchmarkRunner(unittest.TestCase):
+    def test_measure_fixed_number(self):
+        calls = []
+        result = runner.measure(lambda: calls.append(1), repeat=3, number=4)
+        self.assertEqual(len(calls), 12)
+        self.assertLessEqual(result["min_ms"], result["median_ms"])
+        self.assertLessEqual(result["median_ms"], result["max_ms"])
+
+    def test_compare_statuses(self):
+        """기준선 대비 회귀/개선/유지/신규 판정을 검증"""
+        baseline = {"a": {"median_ms": 10.0}, "b": {"median_ms": 10.0}, "c": {"median_ms": 10.0}}
+        results = {"a": {"median_ms": 13.0}, "b": {"median_ms": 7.0}, "c": {"median_ms": 11.0}, "d": {"median_ms": 1.0}}
+        status = {row["name"]: row["status"] for row in runner.compare(results, baseline, threshold=0.2)}
+        self.assertEqual(status, {"a": "regression", "b": "improved", "c": "ok", "d": "new"})
+
+    def test_parse_sizes(self):
+        self.assertEqual(parse_sizes("1k, 100k"), [("1k", 1000), ("100k", 100000)])
+        with self.assertRaises(ValueError):
+            parse_sizes("5k")
+
+class TestBenchmarkDataset(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_build_dataset_is_deterministic(self):
+        """같은 시드면 같은 로그가 생성되고 집계 테이블도 채워지는지 검증"""
+        paths = [build_dataset(os.path.join(self.temp_dir, f"{i}.db"), 200, seed=3) for i in range(2)]
+        dumps = []
+        for path in paths:
+            conn = sqlite3.connect(path)
+            try:
+                dumps.append(conn.execute("SELECT timestamp, duration, task_id, status FROM logs ORDER BY timestamp").fetchall())
+                total = conn.execute("SELECT SUM(count) FROM daily_stats").fetchone()[0]
+                success = conn.execute("SELECT COUNT(*) FROM logs WHERE status = 'success'").fetchone()[0]
+            finally:
+                conn.close()
+            self.assertEqual(total, success)
+        self.assertEqual(len(dumps[0]), 200)
+        self.assertEqual(dumps[0], dumps[1])
+
+    def test_dataset_pinned_to_end_day(self):
+        """데이터가 실행 날짜가 아닌 고정 기준일로 끝나고, 캐시 파일명에도 기준일이 들어가는지 검증"""
+        path = build_dataset(os.path.join(self.temp_dir, "pinned.db"), 200, seed=1)
+        conn = sqlite3.connect(path)
+        try:
+            last_day = conn.execute("SELECT MAX(day) FROM logs").fetchone()[0]
+        finally:
+            conn.close()
+        self.assertLessEqual(last_day, END_DAY.isoformat())
+        self.assertGreaterEqual(last_day, (END_DAY.replace(day=1)).isoformat())
+        self.assertIn(END_DAY.strftime("%Y%m%d"), os.path.basename(dataset_path(200)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import tempfile
+import shutil
+
+# src 폴더를 모듈 검색 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import common
+from common import UserDataPaths
+
+class TestUserDataPaths(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_dir = os.path.join(self.temp_dir, "data")
+        self.legacy_dir = os.path.join(self.temp_dir, "legacy")
+        os.makedirs(self.legacy_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_resolve_once(self):
+        """데이터 폴더를 만들고, 같은 파일은 파일 시스템 확인 없이 메모리에서 답하는지 테스트"""
+        paths = UserDataPaths(self.data_dir, legacy_dirs=[])
+        path = paths.resolve("settings.json")
+        self.assertEqual(path, os.path.join(self.data_dir, "settings.json"))
+        self.assertTrue(os.path.isdir(self.data_dir))
+
+        with patch('common.os.path.exists') as exists, patch('common.os.makedirs') as makedirs:
+            self.assertEqual(paths.resolve("settings.json"), path)
+            exists.assert_not_called()
+            makedirs.assert_not_called()
+
+    def test_legacy_migration(self):
+        """새 위치에 없는 파일은 예전 위치에서 한 번만 복사되는지 테스트"""
+        with open(os.path.join(self.legacy_dir, "settings.json"), "w") as f:
+            f.write("{}")
+        paths = UserDataPaths(self.data_dir, legacy_dirs=[self.legacy_dir])
+        with patch('builtins.print'):
+            path = paths.resolve("settings.json")
+        self.assertTrue(os.path.exists(path))
+
+        # 복사 후 예전 파일이 바뀌어도 다시 복사하지 않음
+        with open(os.path.join(self.legacy_dir, "settings.json"), "w") as f:
+            f.write('{"x": 1}')
+        os.remove(path)
+        paths.resolve("settings.json")
+        self.assertFalse(os.path.exists(path))
+
+        # 명시적으로 다시 확인하면 예전 위치를 다시 탐색
+        paths.rescan()
+        with patch('builtins.print'):
+            paths.resolve("settings.json")
+        with open(path) as f:
+            self.assertEqual(f.read(), '{"x": 1}')
+
+    def test_module_registry(self):
+        """get_user_data_path가 모듈 레지스트리를 사용하고 rescan으로 초기화되는지 테스트"""
+        registry = UserDataPaths(self.data_dir, legacy_dirs=[])
+        with patch('common._user_data_paths', registry):
+            self.assertEqual(common.get_user_data_path("a.db"), os.path.join(self.data_dir, "a.db"))
+            self.assertIn("a.db", registry.paths)
+            common.rescan_user_data_paths()
+            self.assertEqual(registry.paths, {})
+            self.assertIsNone(registry.data_dir)
+
+if __name__ == '__main__':
+    unittest.main()
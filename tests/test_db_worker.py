@@ -0,0 +1,124 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import threading
+import time
+
+# src 폴더를 모듈 검색 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from db_worker import DBWorker
+
+class FakeRoot:
+    """root.after 예약을 기록만 하고, 테스트에서 직접 실행하는 가짜 Tk 루트"""
+    def __init__(self):
+        self.jobs = {}
+        self.next_id = 0
+
+    def after(self, ms, func):
+        self.next_id += 1
+        self.jobs[self.next_id] = func
+        return self.next_id
+
+    def after_cancel(self, job_id):
+        self.jobs.pop(job_id, None)
+
+    def run_pending(self):
+        jobs, self.jobs = self.jobs, {}
+        for func in jobs.values():
+            func()
+
+class TestDBWorker(unittest.TestCase):
+    def setUp(self):
+        self.root = FakeRoot()
+        self.worker = DBWorker(self.root)
+
+    def tearDown(self):
+        self.worker.stop()
+
+    def wait_idle(self):
+        # 워커 스레드가 모든 요청을 처리할 때까지 예약된 폴링을 반복 실행
+        deadline = time.time() + 2
+        while self.worker.pending and time.time() < deadline:
+            time.sleep(0.005)
+            self.root.run_pending()
+        self.assertEqual(self.worker.pending, 0)
+
+    def test_callbacks_run_on_caller_thread_in_order(self):
+        """요청은 제출 순서대로 실행되고 콜백은 폴링한 스레드에서 호출되는지 테스트"""
+        worker_threads = []
+        results = []
+
+        def job(value):
+            worker_threads.append(threading.current_thread())
+            return value * 2
+
+        for i in range(5):
+            self.worker.submit(job, i, callback=lambda r: results.append((r, threading.current_thread())))
+
+        # 폴링 전에는 콜백이 호출되지 않음
+        self.assertEqual(results, [])
+        self.wait_idle()
+
+        self.assertEqual([r for r, _ in results], [0, 2, 4, 6, 8])
+        self.assertTrue(all(t is threading.current_thread() for _, t in results))
+        self.assertTrue(all(t is self.worker.thread for t in worker_threads))
+        self.assertEqual(self.worker.pending, 0)
+
+    def test_error_callback(self):
+        """예외 발생 시 error_callback으로 전달되고 워커는 계속 동작하는지 테스트"""
+        errors = []
+        results = []
+
+        def fail():
+            raise ValueError("boom")
+
+        with patch('traceback.print_exc'):
+            self.worker.submit(fail, error_callback=errors.append)
+            self.worker.submit(lambda: "ok", callback=results.append)
+            self.wait_idle()
+
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], ValueError)
+        self.assertEqual(results, ["ok"])
+
+    def test_polling_only_while_pending(self):
+        """처리 대기 중인 요청이 없으면 폴링을 예약하지 않는지 테스트"""
+        self.assertEqual(self.root.jobs, {})
+        self.worker.submit(lambda: None)
+        self.assertEqual(len(self.root.jobs), 1)
+        self.wait_idle()
+        self.assertEqual(self.root.jobs, {})
+
+    def test_stop_flushes_queued_requests(self):
+        """종료 시 큐에 남은 쓰기 요청을 모두 처리하는지 테스트"""
+        written = []
+        for i in range(10):
+            self.worker.submit(written.append, i)
+        self.worker.stop()
+        self.assertFalse(self.worker.thread.is_alive())
+        self.assertEqual(written, list(range(10)))
+        self.assertEqual(self.root.jobs, {})
+
+    def test_stop_runs_on_exit_after_queue(self):
+        """on_exit(DB 닫기)가 남은 요청을 모두 처리한 뒤 워커 스레드에서 실행되는지 테스트"""
+        import threading
+        release = threading.Event()
+        order = []
+        self.worker.submit(lambda: (release.wait(5), order.append("write")))
+        def on_exit():
+            order.append(("close", threading.current_thread() is self.worker.thread))
+        self.assertFalse(self.worker.stop(timeout=0.05, on_exit=on_exit)) # 아직 쓰기 중
+        self.assertEqual(order, []) # 쓰기가 끝나기 전에는 닫지 않음
+        release.set()
+        self.worker.thread.join(5)
+        self.assertEqual(order, ["write", ("close", True)])
+
+        # 이미 종료된 워커는 호출한 스레드에서 바로 실행
+        closed = []
+        self.assertTrue(self.worker.stop(on_exit=lambda: closed.append(True)))
+        self.assertEqual(closed, [True])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+import sys
+import os
+import csv
+import json
+import sqlite3
+import tempfile
+import shutil
+
+# src 폴더를 모듈 검색 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import schema
+from exporter import LogExporter, ExportCancelled, build_export_query, read_columnar_export
+
+ROWS = [
+    ("2024-01-01 10:00:00", 25, "Study", "success"),
+    ("2024-01-01 11:00:00", 50, None, "success"),
+    ("2024-01-02 09:00:00", 25, "Work", "fail"),
+    ("2024-01-03 23:59:59", 25, "Study", "success"),
+    ("2024-01-04 08:00:00", 30, "Work", "success"),
+]
+
+class TestLogExporter(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "godmode_log.db")
+        conn = sqlite3.connect(self.db_path)
+        schema.migrate(conn)
+        conn.executemany("INSERT INTO logs (timestamp, event, duration, task, status) VALUES (?, 'godmode_complete', ?, ?, ?)", ROWS)
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def export(self, fmt, name, **kwargs):
+        path = os.path.join(self.temp_dir, name)
+        progress = []
+        count = LogExporter(self.db_path, path, fmt, chunk_size=2, **kwargs).run(lambda d, t: progress.append((d, t)))
+        return path, count, progress
+
+    def test_csv_export_streams_in_chunks(self):
+        """CSV 형식이 기존과 동일하고 청크마다 진행률이 보고되는지 테스트"""
+        path, count, progress = self.export("csv", "out.csv")
+        self.assertEqual(count, 5)
+        self.assertEqual(progress, [(0, 5), (2, 5), (4, 5), (5, 5)])
+
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ["Timestamp", "Duration (min)", "Task", "Status"])
+        self.assertEqual(rows[1], ["2024-01-04 08:00:00", "30", "Work", "success"]) # 최신순
+        self.assertEqual(rows[4], ["2024-01-01 11:00:00", "50", "", "success"])
+        self.assertFalse(os.path.exists(path + ".part"))
+
+    def test_jsonl_export(self):
+        """JSON Lines 형식 테스트"""
+        path, count, _ = self.export("jsonl", "out.jsonl")
+        with open(path, encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(len(lines), count)
+        self.assertEqual(lines[-1], {"timestamp": "2024-01-01 10:00:00", "duration": 25, "task": "Study", "status": "success"})
+
+    def test_columnar_roundtrip(self):
+        """열 기반 형식이 로우 그룹/사전 인코딩으로 저장되고 원래 행으로 복원되는지 테스트"""
+        path, _, _ = self.export("columnar", "out.json")
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.assertEqual(len(data["row_groups"]), 3) # 청크 크기 2 -> 2, 2, 1
+        self.assertEqual(data["row_groups"][0]["task"], {"dict": ["Work", "Study"], "codes": [0, 1]})
+
+        expected = sorted(ROWS, reverse=True)
+        self.assertEqual(read_columnar_export(path), expected)
+
+    def test_filters_pushed_into_sql(self):
+        """기간/작업 필터가 SQL 조건으로 적용되는지 테스트 (종료일은 당일 끝까지 포함)"""
+        path, count, _ = self.export("jsonl", "filtered.jsonl", start_day="2024-01-02", end_day="2024-01-03", task="Study")
+        with open(path, encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(count, 1)
+        self.assertEqual(lines[0]["timestamp"], "2024-01-03 23:59:59")
+
+        select_sql, count_sql, params = build_export_query(start_day="2024-01-02", task="Work")
+        self.assertIn("WHERE l.timestamp >= ? AND l.task_id = (SELECT id FROM tasks WHERE name = ?)", select_sql)
+        self.assertEqual(params, ("2024-01-02", "Work"))
+
+    def test_empty_result_writes_nothing(self):
+        """조건에 맞는 기록이 없으면 파일을 만들지 않는지 테스트"""
+        path, count, _ = self.export("csv", "empty.csv", task="None")
+        self.assertEqual(count, 0)
+        self.assertFalse(os.path.exists(path))
+
+    def test_cancel_removes_partial_file(self):
+        """취소 시 기존 파일을 덮어쓰지 않고 임시 파일을 삭제하는지 테스트"""
+        path = os.path.join(self.temp_dir, "cancel.csv")
+        with open(path, "w") as f:
+            f.write("previous")
+
+        exporter = LogExporter(self.db_path, path, "csv", chunk_size=1)
+        def progress(done, total):
+            if done >= 2:
+                exporter.cancel()
+        with self.assertRaises(ExportCancelled):
+            exporter.run(progress)
+
+        with open(path) as f:
+            self.assertEqual(f.read(), "previous")
+        self.assertFalse(os.path.exists(path + ".part"))
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            LogExporter(self.db_path, "x", "xml")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+# src 폴더를 모듈 검색 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from font_cache import FontCache
+
+class TestFontCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = FontCache(max_size=2)
+        self.candidates = ("missing.ttf", "found.ttf")
+
+    def fake_truetype(self, path, size):
+        if "missing" in path:
+            raise IOError("not found")
+        return MagicMock(path=path, size=size)
+
+    @patch('font_cache.ImageFont.truetype')
+    def test_cache_hit(self, mock_truetype):
+        """같은 크기/굵기 요청은 폰트 파일을 다시 열지 않는지 검증"""
+        mock_truetype.side_effect = self.fake_truetype
+        first = self.cache.get(12, True, self.candidates)
+        calls = mock_truetype.call_count
+        second = self.cache.get(12, True, self.candidates)
+        self.assertIs(first, second)
+        self.assertEqual(mock_truetype.call_count, calls)
+
+    @patch('font_cache.ImageFont.truetype')
+    def test_resolved_path_remembered(self, mock_truetype):
+        """실패한 후보는 새 크기 요청 시 다시 시도하지 않는지 검증"""
+        mock_truetype.side_effect = self.fake_truetype
+        self.cache.get(12, True, self.candidates)
+        mock_truetype.reset_mock()
+
+        font = self.cache.get(20, True, self.candidates)
+        mock_truetype.assert_called_once_with("found.ttf", 20)
+        self.assertEqual(font.size, 20)
+
+    @patch('font_cache.ImageFont.load_default')
+    @patch('font_cache.ImageFont.truetype', side_effect=IOError("not found"))
+    def test_default_font_fallback(self, mock_truetype, mock_default):
+        """모든 후보가 실패하면 기본 폰트를 사용하고 이후 탐색을 생략하는지 검증"""
+        self.cache.get(12, False, self.candidates)
+        mock_truetype.reset_mock()
+        self.cache.get(14, False, self.candidates)
+        mock_truetype.assert_not_called()
+        self.assertEqual(mock_default.call_count, 2)
+
+    @patch('font_cache.ImageFont.truetype')
+    def test_lru_eviction(self, mock_truetype):
+        """최대 크기를 넘으면 가장 오래 사용하지 않은 폰트를 제거하는지 검증"""
+        mock_truetype.side_effect = self.fake_truetype
+        f10 = self.cache.get(10, True, self.candidates)
+        self.cache.get(11, True, self.candidates)
+        self.cache.get(10, True, self.candidates) # 10을 최근 사용으로 갱신
+        self.cache.get(12, True, self.candidates) # 11이 제거되어야 함
+
+        self.assertIs(self.cache.get(10, True, self.candidates), f10)
+        mock_truetype.reset_mock()
+        self.cache.get(11, True, self.candidates)
+        mock_truetype.assert_called_once_with("found.ttf", 11)
+
+if __name__ == '__main__':
+    unittest.main()
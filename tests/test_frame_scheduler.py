@@ -0,0 +1,39 @@
+import unittest
+import sys
+import os
+
+# src 폴더를 모듈 검색 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from frame_scheduler import FrameScheduler
+
+class TestFrameScheduler(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = FrameScheduler()
+
+    def test_wakes_at_next_second_boundary(self):
+        """작은 다이얼에서는 다음 초 경계 직후에 깨어나는지 검증"""
+        self.assertEqual(self.scheduler.next_delay(100.25, arc_radius=80), 255)
+        self.assertEqual(self.scheduler.next_delay(100.9, arc_radius=80), 905)
+
+    def test_minimum_delay(self):
+        """초 경계 직전이라도 최소 대기 시간을 지키는지 검증"""
+        self.assertEqual(self.scheduler.next_delay(100.0, arc_radius=80), FrameScheduler.MIN_DELAY_MS)
+        self.assertEqual(self.scheduler.next_delay(0, arc_radius=80), FrameScheduler.MIN_DELAY_MS)
+
+    def test_large_arc_wakes_for_pixel_motion(self):
+        """큰 다이얼에서는 파이 조각이 1px 움직이는 시점에 깨어나는지 검증"""
+        # 반지름 1000px -> 초당 약 1.75px 이동 -> 약 573ms 마다 1px
+        self.assertEqual(self.scheduler.next_delay(100.99, arc_radius=1000), 572)
+
+    def test_full_dial_ignores_arc(self):
+        """60분 이상(꽉 찬 원)에서는 초 경계만 고려하는지 검증"""
+        self.assertEqual(self.scheduler.next_delay(3700.5, arc_radius=1000), 505)
+
+    def test_hidden_window_low_rate(self):
+        """최소화 상태에서는 저빈도로 갱신하되 종료 시점은 지키는지 검증"""
+        self.assertEqual(self.scheduler.next_delay(600.5, arc_radius=80, visible=False), FrameScheduler.HIDDEN_DELAY_MS)
+        self.assertEqual(self.scheduler.next_delay(2.5, arc_radius=80, visible=False), 2505)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import sys
+import os
+import sqlite3
+from datetime import date
+
+# src 폴더를 모듈 검색 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import schema
+from gamification import GamificationState, level_for, level_progress
+
+class TestLevelFormula(unittest.TestCase):
+    def test_level_for(self):
+        """기존 레벨 공식(1 + sqrt(총 분 / 25))과 동일한지 검증"""
+        self.assertEqual(level_for(0), 1)
+        self.assertEqual(level_for(25), 2)
+        self.assertEqual(level_for(99), 2)
+        self.assertEqual(level_for(100), 3)
+
+    def test_level_progress(self):
+        """현재 레벨 구간 내 진행률 검증 (Lv2: 25분 ~ 100분)"""
+        self.assertEqual(level_progress(0), 0.0)
+        self.assertEqual(level_progress(25), 0.0)
+        self.assertAlmostEqual(level_progress(62.5), 0.5)
+        self.assertEqual(level_progress(100), 0.0)
+
+class TestGamificationState(unittest.TestCase):
+    """daily_stats 트리거에 의한 증분 갱신과 재계산 결과가 일치하는지 검증"""
+
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.row_factory = sqlite3.Row
+        schema.migrate(self.conn)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def insert(self, timestamp, duration=25, status="success"):
+        self.conn.execute("INSERT INTO logs (timestamp, event, duration, task, status) VALUES (?, 'godmode_complete', ?, 'A', ?)",
+                          (timestamp, duration, status))
+
+    def stored(self):
+        return dict(self.conn.execute("SELECT * FROM gamification WHERE id = 1").fetchone())
+
+    def assert_matches_recompute(self):
+        incremental = vars(GamificationState.load(self.conn))
+        self.assertEqual(incremental, vars(GamificationState.recompute(self.conn)))
+
+    def test_incremental_streak(self):
+        """연속된 날짜는 스트릭을 늘리고, 하루 이상 비면 새로 시작하는지 검증"""
+        GamificationState.load(self.conn) # 마이그레이션 직후 최초 계산
+        for ts in ("2024-01-01 10:00:00", "2024-01-02 10:00:00", "2024-01-02 11:00:00", "2024-01-03 10:00:00"):
+            self.insert(ts)
+        self.insert("2024-01-03 12:00:00", status="fail") # 실패 기록은 제외
+
+        row = self.stored()
+        self.assertEqual(row['dirty'], 0)
+        self.assertEqual((row['total_count'], row['total_duration']), (4, 100))
+        self.assertEqual((row['streak'], row['longest_streak'], row['last_day']), (3, 3, "2024-01-03"))
+
+        self.insert("2024-01-05 10:00:00")
+        row = self.stored()
+        self.assertEqual((row['streak'], row['longest_streak'], row['last_day']), (1, 3, "2024-01-05"))
+        self.assert_matches_recompute()
+
+    def test_day_removal_marks_dirty(self):
+        """날짜가 사라지면 dirty로 표시되고 다음 조회 시 다시 계산되는지 검증"""
+        GamificationState.load(self.conn)
+        for ts in ("2024-01-01 10:00:00", "2024-01-02 10:00:00", "2024-01-03 10:00:00"):
+            self.insert(ts)
+        self.conn.execute("DELETE FROM logs WHERE timestamp = '2024-01-02 10:00:00'")
+        self.assertEqual(self.stored()['dirty'], 1)
+
+        state = GamificationState.load(self.conn)
+        self.assertEqual((state.streak, state.longest_streak, state.total_duration), (1, 1, 50))
+        self.assertEqual(self.stored()['dirty'], 0)
+
+    def test_backfilled_past_day(self):
+        """과거 날짜가 새로 추가되면 (예: 기록 이관) 재계산으로 연속 구간이 합쳐지는지 검증"""
+        GamificationState.load(self.conn)
+        self.insert("2024-01-01 10:00:00")
+        self.insert("2024-01-03 10:00:00")
+        self.insert("2024-01-02 10:00:00")
+        self.assertEqual(self.stored()['dirty'], 1)
+        state = GamificationState.load(self.conn)
+        self.assertEqual((state.streak, state.longest_streak), (3, 3))
+
+    def test_current_streak_relative_to_today(self):
+        """오늘/어제까지 이어진 스트릭만 현재 스트릭으로 표시하는지 검증"""
+        state = GamificationState(streak=4, longest_streak=6, last_day="2024-01-10")
+        self.assertEqual(state.current_streak(date(2024, 1, 10)), 4)
+        self.assertEqual(state.current_streak(date(2024, 1, 11)), 4)
+        self.assertEqual(state.current_streak(date(2024, 1, 12)), 0)
+        self.assertEqual(state.snapshot(date(2024, 1, 12))['longest_streak'], 6)
+
+if __name__ == '__main__':
+    unittest.main()
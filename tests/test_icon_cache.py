@@ -0,0 +1,80 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import json
+import tempfile
+import shutil
+
+# src 폴더를 모듈 검색 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import icon_cache
+from icon_cache import IconCache, rasterize_icon
+
+SHAPES = ("play", "stop", "settings", "stats", "skip", "repeat")
+
+class TestIconCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = IconCache(max_size=4)
+        self.temp_dir = tempfile.mkdtemp()
+        self.base_path = os.path.join(self.temp_dir, "icon_atlas")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_cache_hit(self):
+        """같은 (모양, 색상, 크기) 요청은 다시 그리지 않는지 검증 (색상 대소문자 무시)"""
+        with patch('icon_cache.rasterize_icon', wraps=rasterize_icon) as draw:
+            first = self.cache.get_image("play", "#FFFFFF", (24, 24))
+            second = self.cache.get_image("play", "#ffffff", (24, 24))
+            self.assertIs(first, second)
+            self.cache.get_image("play", "#FFFFFF", (30, 30))
+            self.assertEqual(draw.call_count, 2)
+        self.assertEqual(first.size, (24, 24))
+
+    def test_lru_eviction(self):
+        """최대 개수를 넘으면 가장 오래 사용하지 않은 아이콘부터 제거하는지 검증"""
+        for shape in SHAPES[:4]:
+            self.cache.get_image(shape, "#000000")
+        self.cache.get_image("play", "#000000") # 최근 사용으로 갱신
+        self.cache.get_image("skip", "#000000")
+        self.assertEqual(len(self.cache), 4)
+        with patch('icon_cache.rasterize_icon', wraps=rasterize_icon) as draw:
+            self.cache.get_image("play", "#000000")
+            self.assertEqual(draw.call_count, 0)
+            self.cache.get_image("stop", "#000000")
+            self.assertEqual(draw.call_count, 1)
+
+    def test_atlas_round_trip(self):
+        """아틀라스로 저장한 아이콘을 다음 실행에서 그리지 않고 같은 픽셀로 복원하는지 검증"""
+        cache = IconCache()
+        originals = {}
+        for i, shape in enumerate(SHAPES):
+            size = (20 + i * 7, 20 + i * 7)
+            originals[(shape, size)] = cache.get_image(shape, "#FF5252", size).tobytes()
+        self.assertTrue(cache.save_atlas(self.base_path))
+        self.assertFalse(cache.save_atlas(self.base_path)) # 변경 없으면 다시 저장하지 않음
+
+        warm = IconCache()
+        self.assertEqual(warm.load_atlas(self.base_path), len(SHAPES))
+        with patch('icon_cache.rasterize_icon') as draw:
+            for (shape, size), data in originals.items():
+                self.assertEqual(warm.get_image(shape, "#ff5252", size).tobytes(), data)
+            draw.assert_not_called()
+
+    def test_atlas_version_mismatch_ignored(self):
+        """아이콘 버전이 다르거나 파일이 없으면 아틀라스를 사용하지 않는지 검증"""
+        self.assertEqual(self.cache.load_atlas(self.base_path), 0)
+
+        self.cache.get_image("play", "#000000")
+        self.cache.save_atlas(self.base_path)
+        with open(self.base_path + ".json", "r", encoding="utf-8") as f:
+            index = json.load(f)
+        index["version"] = icon_cache.ICON_ATLAS_VERSION + 1
+        with open(self.base_path + ".json", "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        self.assertEqual(IconCache().load_atlas(self.base_path), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+import sys
+import os
+import sqlite3
+import tempfile
+import shutil
+from collections import Counter
+from datetime import date, datetime, timedelta
+
+# src 폴더를 모듈 검색 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import utils
+from log_generator import LogGenerator, SESSION_GAP, write_db, write_legacy
+from migration import LegacyLogMigrator
+
+START, END = date(2023, 1, 1), date(2023, 6, 30)
+
+class TestLogGenerator(unittest.TestCase):
+    def setUp(self):
+        utils.close_db()
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        utils.use_database(None)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def dump(self, path):
+        conn = sqlite3.connect(path)
+        try:
+            logs = conn.execute("""SELECT l.timestamp, l.duration, l.status, l.ts, l.day, l.hour, l.start_day, t.name
+                                   FROM logs l JOIN tasks t ON t.id = l.task_id ORDER BY l.timestamp""").fetchall()
+            daily = conn.execute("SELECT * FROM daily_stats ORDER BY day").fetchall()
+            tasks = conn.execute("""SELECT t.name, s.day, s.count, s.duration FROM task_daily_stats s
+                                    JOIN tasks t ON t.id = s.task_id ORDER BY 1, 2""").fetchall()
+            totals = conn.execute("SELECT name, count, duration FROM tasks WHERE count > 0 ORDER BY name").fetchall()
+            return logs, daily, tasks, totals
+        finally:
+            conn.close()
+
+    def test_deterministic_with_patterns(self):
+        """같은 시드면 같은 기록이 나오고, 쉬는 날/실패 기록/작업 어휘가 설정대로 반영되는지 검증"""
+        options = dict(seed=7, tasks=[("A", 3), ("B", 1)], failure_rate=0.2, gap_rate=0.3)
+        first = list(LogGenerator(**options).generate(START, END))
+        self.assertEqual(first, list(LogGenerator(**options).generate(START, END)))
+        self.assertNotEqual(first, list(LogGenerator(**dict(options, seed=8)).generate(START, END)))
+
+        self.assertEqual({log.task for log in first}, {"A", "B"})
+        self.assertIn("fail", {log.status for log in first})
+        self.assertEqual(len({log.timestamp for log in first}), len(first))
+        self.assertEqual([log.timestamp for log in first], sorted(log.timestamp for log in first))
+        active_days = {log.day for log in first}
+        self.assertLess(len(active_days), (END - START).days + 1)
+
+    def assert_no_overlap(self, logs):
+        """기록이 시간순으로 최소 휴식 간격을 두고 이어지며, 시작 시각의 날짜/시가 파생 컬럼과 같은지 확인"""
+        previous_end = None
+        for log in logs:
+            end = datetime.strptime(log.timestamp, "%Y-%m-%d %H:%M:%S")
+            start = end - timedelta(minutes=log.duration)
+            self.assertEqual((start.strftime("%Y-%m-%d"), start.hour), (log.start_day, log.hour))
+            self.assertEqual(log.start_day, log.day) # 자정을 넘기지 않음
+            if previous_end is not None:
+                self.assertGreaterEqual(start, previous_end + timedelta(seconds=SESSION_GAP[0]), log.timestamp)
+            previous_end = end
+
+    def test_sessions_never_overlap(self):
+        """하루에 세션이 몰려도 서로 겹치지 않게 차례로 배치되는지 검증"""
+        logs = list(LogGenerator(seed=5, sessions_per_day=40).generate(START, END))
+        self.assertGreater(max(Counter(log.day for log in logs).values()), 30)
+        self.assert_no_overlap(logs)
+
+        # 하루에 들어갈 수 있는 최대치를 넘는 요청은 최대치로 줄여서 배치
+        crowded = LogGenerator(seed=5, sessions_per_day=500, gap_rate=0, vacation_rate=0)
+        logs = list(crowded.generate(END, END))
+        self.assertEqual(len(logs), crowded.max_sessions_per_day())
+        self.assert_no_overlap(logs)
+
+    def test_limit_keeps_most_recent_days(self):
+        """limit 지정 시 정확히 limit개이며 마지막 날까지 기록이 이어지는지 검증"""
+        generator = LogGenerator(seed=1, gap_rate=0, vacation_rate=0)
+        generator.fit_rows(500, (END - START).days + 1)
+        logs = list(generator.generate(START, END, limit=500))
+        self.assertEqual(len(logs), 500)
+        self.assertEqual(logs[-1].day, END.isoformat())
+
+    def test_bulk_write_matches_legacy_migration(self):
+        """대량 삽입 결과(집계 포함)가 같은 기록을 레거시 텍스트 로그로 이관한 결과와 같은지 검증"""
+        generator = LogGenerator(seed=3, failure_rate=0.1)
+        bulk_path = os.path.join(self.temp_dir, "bulk.db")
+        txt_path = os.path.join(self.temp_dir, "godmode_log.txt")
+        migrated_path = os.path.join(self.temp_dir, "migrated.db")
+
+        inserted = write_db(bulk_path, generator.generate(START, END))
+        write_legacy(txt_path, generator.generate(START, END), invalid_rate=0.05, seed=3)
+
+        utils.use_database(migrated_path)
+        metrics = LegacyLogMigrator(txt_path, utils.db_session, batch_size=100).run()
+        utils.use_database(None)
+
+        self.assertEqual(metrics["inserted"], inserted)
+        self.assertGreater(metrics["invalid"], 0)
+        self.assertEqual(self.dump(bulk_path), self.dump(migrated_path))
+
+        # 대량 삽입 후 트리거가 복구되어 이후 기록도 집계에 반영됨
+        conn = sqlite3.connect(bulk_path)
+        try:
+            before = conn.execute("SELECT total_count FROM gamification").fetchone()[0]
+            conn.execute("INSERT INTO logs (timestamp, duration, task, status) VALUES ('2023-07-01 10:00:00', 25, 'A', 'success')")
+            conn.commit()
+            self.assertEqual(conn.execute("SELECT total_count FROM gamification").fetchone()[0], before + 1)
+        finally:
+            conn.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import json
+import tempfile
+import shutil
+
+# src 폴더를 모듈 검색 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import utils
+from migration import LegacyLogMigrator
+
+class TestLegacyLogMigrator(unittest.TestCase):
+    def setUp(self):
+        utils.close_db()
+        self.temp_dir = tempfile.mkdtemp()
+        self.patcher = patch('utils.get_user_data_path', side_effect=lambda name: os.path.join(self.temp_dir, name))
+        self.patcher.start()
+        self.txt_path = os.path.join(self.temp_dir, "godmode_log.txt")
+
+    def tearDown(self):
+        utils.close_db()
+        self.patcher.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_legacy(self, count, extra_lines=()):
+        with open(self.txt_path, "w", encoding="utf-8") as f:
+            for i in range(count):
+                day, minute = divmod(i, 60)
+                f.write(json.dumps({"timestamp": f"2023-01-{day + 1:02d} 10:{minute:02d}:00", "duration": 25, "task": f"T{i}"}) + "\n")
+            for line in extra_lines:
+                f.write(line + "\n")
+
+    def count_logs(self):
+        with utils.db_session() as conn:
+            return conn.execute("SELECT COUNT(*) FROM logs").fetchone()[0]
+
+    def test_batched_migration_with_metrics(self):
+        """배치 단위로 모두 이관하고 지표와 백업 파일을 남기는지 테스트"""
+        self.write_legacy(250, extra_lines=["", "not json", '{"duration": 25}', '{"timestamp": "2023-01-01 10:00:00"}'])
+        migrator = utils.get_legacy_migrator(batch_size=100)
+        metrics = migrator.run()
+
+        self.assertTrue(metrics["done"])
+        self.assertEqual(metrics["inserted"], 250)
+        self.assertEqual(metrics["duplicates"], 1)
+        self.assertEqual(metrics["invalid"], 2)
+        self.assertEqual(metrics["batches"], 3)
+        self.assertEqual(migrator.progress(), 1.0)
+        self.assertEqual(self.count_logs(), 250)
+
+        # 원본은 백업으로 이름 변경, 체크포인트 삭제, 집계 테이블 반영
+        self.assertFalse(os.path.exists(self.txt_path))
+        self.assertTrue(os.path.exists(self.txt_path + ".migrated"))
+        self.assertIsNone(utils.get_legacy_migrator())
+        with utils.db_session() as conn:
+            self.assertIsNone(conn.execute("SELECT value FROM meta WHERE key = ?", (LegacyLogMigrator.CHECKPOINT_KEY,)).fetchone())
+            self.assertEqual(conn.execute("SELECT SUM(count) FROM daily_stats").fetchone()[0], 250)
+
+    def test_resume_from_checkpoint(self):
+        """중간에 중단되어도 새 이관기가 체크포인트부터 이어서 진행하는지 테스트"""
+        self.write_legacy(250)
+        first = utils.get_legacy_migrator(batch_size=100)
+        first.step()
+        self.assertEqual(self.count_logs(), 100)
+        self.assertGreater(first.progress(), 0.0)
+
+        # 앱 재시작 시뮬레이션
+        utils.close_db()
+        second = utils.get_legacy_migrator(batch_size=100)
+        metrics = second.run()
+        self.assertEqual(metrics["rows_read"], 150) # 이미 이관한 100행은 다시 읽지 않음
+        self.assertEqual(metrics["duplicates"], 0)
+        self.assertEqual(self.count_logs(), 250)
+
+    def test_no_legacy_file(self):
+        """이관할 파일이 없으면 아무 작업도 하지 않는지 테스트"""
+        self.assertIsNone(utils.get_legacy_migrator())
+        self.assertIsNone(utils.migrate_legacy_logs())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+import shutil
+
+# src 폴더를 모듈 검색 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from perf import RingBuffer, PerfRecorder, percentile
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+class TestRingBuffer(unittest.TestCase):
+    def test_overwrites_oldest(self):
+        """가득 차면 가장 오래된 값부터 덮어쓰고 오래된 순으로 반환하는지 검증"""
+        buf = RingBuffer(3)
+        for v in range(5):
+            buf.append(v)
+        self.assertEqual(buf.values(), [2, 3, 4])
+        self.assertEqual((len(buf), buf.total), (3, 5))
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([7], 99), 7)
+        self.assertEqual(percentile([], 50), 0.0)
+
+class TestPerfRecorder(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.recorder = PerfRecorder(capacity=4, clock=self.clock)
+
+    def test_timed_decorator(self):
+        """데코레이터가 반환값/예외를 그대로 전달하면서 실행 시간을 기록하는지 검증"""
+        @self.recorder.timed("work")
+        def work(ms, fail=False):
+            self.clock.now += ms / 1000
+            if fail:
+                raise ValueError("boom")
+            return ms
+
+        self.assertEqual(work(5), 5)
+        with self.assertRaises(ValueError):
+            work(15, fail=True)
+        stats = self.recorder.stats("work")
+        self.assertEqual(stats["count"], 2)
+        self.assertAlmostEqual(stats["max_ms"], 15)
+        self.assertAlmostEqual(stats["p50_ms"], 5)
+
+    def test_prefix_stats_and_rate(self):
+        """prefix로 여러 구간을 합친 통계와 최근 호출 빈도(fps)를 검증"""
+        for ms in (1, 2, 3):
+            self.recorder.record("db.read", ms)
+        self.recorder.record("db.write", 10)
+        self.recorder.record("draw_timer", 1)
+        db = self.recorder.stats(prefix="db.")
+        self.assertEqual((db["count"], db["max_ms"]), (4, 10))
+
+        for i in range(10):
+            self.clock.now += 0.5
+            self.recorder.record("draw_timer", 1)
+        # 버퍼 크기(4)만큼의 최근 호출이 최근 5초 안에 있음
+        self.assertAlmostEqual(self.recorder.rate("draw_timer", window=5.0), 4 / 5.0)
+
+    def test_disabled_records_nothing(self):
+        self.recorder.enabled = False
+        with self.recorder.measure("x"):
+            pass
+        self.assertEqual(self.recorder.names(), [])
+
+    def test_dump_json(self):
+        """스냅샷을 JSON 파일로 저장하는지 검증"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            self.recorder.record("draw_timer", 2.5)
+            self.recorder.record("db.get_task_stats", 4.0)
+            path = self.recorder.dump_json(os.path.join(temp_dir, "perf.json"))
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.assertEqual(data["sections"]["draw_timer"]["count"], 1)
+            self.assertEqual(data["db"]["max_ms"], 4.0)
+            self.assertIn("fps", self.recorder.overlay_text())
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+import sys
+import os
+
+# src 폴더를 모듈 검색 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from query_cache import QueryCache, MISS
+
+class TestQueryCache(unittest.TestCase):
+    def test_hit_and_miss(self):
+        """저장한 결과는 적중하고, 없는 키는 MISS(None과 구분)를 반환하는지 테스트"""
+        cache = QueryCache(4)
+        cache.validate(1)
+        self.assertIs(cache.get(("a",)), MISS)
+        cache.put(("a",), None)
+        self.assertIsNone(cache.get(("a",)))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_version_change_clears(self):
+        """데이터 버전이 바뀌면 모든 항목이 무효화되는지 테스트"""
+        cache = QueryCache(4)
+        cache.validate((5, 0))
+        cache.put("k", [1])
+        cache.validate((5, 0))
+        self.assertEqual(cache.get("k"), [1])
+        cache.validate((5, 1))
+        self.assertIs(cache.get("k"), MISS)
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction(self):
+        """가득 차면 가장 오래 사용되지 않은 항목부터 제거하는지 테스트"""
+        cache = QueryCache(2)
+        cache.validate(0)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a") # a를 최근 사용으로
+        cache.put("c", 3)
+        self.assertIs(cache.get("b"), MISS)
+        self.assertEqual((cache.get("a"), cache.get("c")), (1, 3))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+import sys
+import os
+
+# src 폴더를 모듈 검색 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from resize_coalescer import ResizeCoalescer
+
+class FakeRoot:
+    """가상 시계 기준으로 root.after 예약을 실행하는 가짜 Tk 루트"""
+    def __init__(self):
+        self.now = 0.0
+        self.jobs = {} # id -> (실행 시각, 함수)
+        self.next_id = 0
+
+    def clock(self):
+        return self.now
+
+    def after(self, ms, func):
+        self.next_id += 1
+        self.jobs[self.next_id] = (self.now + ms / 1000, func)
+        return self.next_id
+
+    def after_cancel(self, job_id):
+        self.jobs.pop(job_id, None)
+
+    def advance(self, ms):
+        """ms만큼 시간을 진행하며 기한이 된 예약을 순서대로 실행"""
+        end = self.now + ms / 1000
+        while True:
+            due = [(t, job_id) for job_id, (t, _) in self.jobs.items() if t <= end]
+            if not due:
+                break
+            t, job_id = min(due)
+            self.now = max(self.now, t)
+            _, func = self.jobs.pop(job_id)
+            func()
+        self.now = end
+
+class TestResizeCoalescer(unittest.TestCase):
+    def setUp(self):
+        self.root = FakeRoot()
+        self.frames = []
+        self.settled = []
+        self.coalescer = ResizeCoalescer(self.root, self.frames.append, self.settled.append, clock=self.root.clock)
+
+    def drag(self, events, interval_ms=2):
+        for i in range(events):
+            self.coalescer.notify(("configure", i), redraw=(i % 2 == 0))
+            self.root.advance(interval_ms)
+
+    def test_events_batched_per_frame(self):
+        """드래그 중 이벤트가 많아도 프레임당 한 번만 처리하는지 검증"""
+        self.drag(100, interval_ms=2) # 200ms 동안 100개 이벤트
+        self.assertLessEqual(len(self.frames), 200 // ResizeCoalescer.FRAME_MS + 1)
+        self.assertGreater(len(self.frames), 0)
+        self.assertTrue(all(self.frames)) # 각 프레임에 다시 그리기 요청이 합쳐짐
+        self.assertEqual(self.settled, []) # 드래그 중에는 정착 처리 없음
+
+    def test_settle_once_after_drag(self):
+        """마지막 이벤트 이후 일정 시간이 지나면 마지막 이벤트로 한 번만 정착 처리하는지 검증"""
+        self.drag(50, interval_ms=5)
+        self.root.advance(ResizeCoalescer.SETTLE_MS + 50)
+        self.assertEqual(self.settled, [("configure", 49)])
+
+        self.root.advance(1000)
+        self.assertEqual(len(self.settled), 1)
+
+    def test_pending_frame_folded_into_settle(self):
+        """정착 시점에 남은 프레임은 취소되어 중복 렌더링하지 않는지 검증"""
+        self.coalescer.notify(("configure", 0))
+        self.root.advance(ResizeCoalescer.SETTLE_MS + 10)
+        frames = len(self.frames)
+        self.coalescer.notify(("configure", 1), redraw=True)
+        self.root.now += ResizeCoalescer.SETTLE_MS / 1000 # 프레임 예약보다 정착 확인이 먼저 실행되도록 시계만 진행
+        self.coalescer._check_settle()
+        self.assertIsNone(self.coalescer.frame_job)
+        self.root.advance(100)
+        self.assertEqual(len(self.frames), frames)
+        self.assertEqual(self.settled[1], ("configure", 1))
+        self.assertNotIn(("configure", 1), self.settled[2:]) # 이미 전달한 이벤트는 다시 전달하지 않음
+
+    def test_settle_event_not_replayed(self):
+        """이벤트 없이 다시 그리기만 요청된 정착에는 이전 이벤트를 다시 전달하지 않는지 검증"""
+        self.coalescer.notify(("configure", 0))
+        self.root.advance(ResizeCoalescer.SETTLE_MS + 50)
+        self.coalescer.notify(redraw=True)
+        self.root.advance(ResizeCoalescer.SETTLE_MS + 50)
+        self.assertEqual(self.settled, [("configure", 0), None])
+
+    def test_cancel(self):
+        """취소 후에는 예약된 처리가 실행되지 않는지 검증"""
+        self.coalescer.notify(("configure", 0), redraw=True)
+        self.coalescer.cancel()
+        self.root.advance(1000)
+        self.assertEqual((self.frames, self.settled), ([], []))
+
+if __name__ == '__main__':
+    unittest.main()
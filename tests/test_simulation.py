@@ -0,0 +1,71 @@
+import unittest
+import sys
+import os
+from datetime import datetime, timedelta
+
+# src 폴더를 모듈 검색 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from simulation import PomodoroSimulator, benchmark
+
+START = datetime(2026, 1, 5)
+
+class TestPomodoroSimulator(unittest.TestCase):
+    def test_break_sequence(self):
+        """long_break_interval에 따라 짧은/긴 휴식이 번갈아 나오는지 검증"""
+        sim = PomodoroSimulator(long_break_interval=3, cycles_per_day=6, start_date=START)
+        breaks = [e.break_type for e in sim.run(1) if e.kind == "break_complete"]
+        self.assertEqual(breaks, ["short", "short", "long", "short", "short", "long"])
+
+    def test_event_timing_manual_start(self):
+        """자동 시작이 꺼져 있으면 각 단계 사이에 대기 시간이 들어가는지 검증"""
+        sim = PomodoroSimulator(work_min=25, short_break_min=5, idle_sec=60, cycles_per_day=1, start_date=START)
+        events = list(sim.run(1))
+        
+        work, rest = events
+        self.assertEqual(work.kind, "work_complete")
+        self.assertEqual(work.start, START + timedelta(hours=9))
+        self.assertEqual(work.end, START + timedelta(hours=9, minutes=25))
+        self.assertEqual(rest.start, work.end + timedelta(seconds=60))
+        self.assertEqual(rest.end - rest.start, timedelta(minutes=5))
+
+    def test_event_timing_auto_start(self):
+        """자동 시작이 켜져 있으면 다음 단계가 바로 이어지는지 검증"""
+        sim = PomodoroSimulator(auto_start=True, cycles_per_day=2, start_date=START)
+        events = list(sim.run(1))
+        for prev, nxt in zip(events, events[1:]):
+            self.assertEqual(prev.end, nxt.start)
+
+    def test_today_count_resets_daily(self):
+        """날짜가 바뀌면 오늘 집중 횟수가 초기화되는지 검증"""
+        sim = PomodoroSimulator(cycles_per_day=4, start_date=START)
+        works = [e for e in sim.run(3) if e.kind == "work_complete"]
+        self.assertEqual(len(works), 12)
+        self.assertEqual([e.today_count for e in works[4:8]], [1, 2, 3, 4])
+        self.assertEqual(works[4].start.date(), (START + timedelta(days=1)).date())
+
+    def test_events_follow_engine_tick(self):
+        """사이클 완료 이벤트가 TimerEngine.tick()이 완료를 보고한 시점에만 생성되는지 검증"""
+        sim = PomodoroSimulator(cycles_per_day=2, start_date=START)
+        engine = sim.engine
+        completions = []
+        original_tick = engine.tick
+        def tick():
+            done = original_tick()
+            if done:
+                completions.append(sim.to_datetime(sim.clock.now))
+            return done
+        engine.tick = tick
+        events = list(sim.run(1))
+        self.assertEqual(len(events), 4)
+        self.assertEqual([e.end for e in events], completions)
+
+    def test_benchmark(self):
+        """처리량 측정 결과 형식 검증"""
+        result = benchmark(days=10, cycles_per_day=8)
+        self.assertEqual(result["work_cycles"], 80)
+        self.assertEqual(result["events"], 160)
+        self.assertGreater(result["cycles_per_sec"], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+import tkinter as tk
+
+# src 폴더를 모듈 검색 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from stats_chart import StatsChart, blend_color, pie_slice_at
+
+class TestChartHelpers(unittest.TestCase):
+    def test_blend_color(self):
+        self.assertEqual(blend_color("#000000", "#FFFFFF", 0.0), "#000000")
+        self.assertEqual(blend_color("#000000", "#FFFFFF", 1.0), "#ffffff")
+        self.assertEqual(blend_color("#000000", "#FF8000", 0.5), "#804000")
+        self.assertEqual(blend_color("#000000", "#FFFFFF", 2.0), "#ffffff")
+
+    def test_pie_slice_at(self):
+        """12시 방향부터 시계 방향으로 조각을 판별하는지 검증 (75% / 25%)"""
+        bounds = [270, 360]
+        self.assertEqual(pie_slice_at(bounds, 10, 0, 0, 0, 50), 0)    # 3시 방향
+        self.assertEqual(pie_slice_at(bounds, 0, 10, 0, 0, 50), 0)    # 6시 방향 (화면 y는 아래로 증가)
+        self.assertEqual(pie_slice_at(bounds, -10, -1, 0, 0, 50), 1)  # 9시 ~ 12시 사이
+        self.assertIsNone(pie_slice_at(bounds, 100, 0, 0, 0, 50))     # 원 밖
+        self.assertIsNone(pie_slice_at([], 0, 0, 0, 0, 50))
+
+class TestStatsChart(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        try:
+            cls.root = tk.Tk()
+        except tk.TclError:
+            raise unittest.SkipTest("디스플레이가 없는 환경")
+        cls.root.withdraw()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.root.destroy()
+
+    def setUp(self):
+        self.app = MagicMock()
+        self.app.scale_factor = 1.0
+        self.app.colors = {"bg": "#FFFFFF", "fg": "#000000", "fg_sub": "#888888", "timer_center": "#F5F5F5",
+                           "stats_bar_today": "#FF5252", "stats_bar_other": "#FFCDD2", "btn_bg": "#EEEEEE"}
+        self.app.loc.get.side_effect = lambda key, default=None, **kw: (default or key).format(**kw)
+
+        self.canvas = tk.Canvas(self.root, width=400, height=250)
+        self.canvas.pack()
+        self.canvas.winfo_width = MagicMock(return_value=400)
+        self.canvas.winfo_height = MagicMock(return_value=250)
+        self.chart = StatsChart(self.canvas, self.app)
+
+    def tearDown(self):
+        self.canvas.destroy()
+
+    def motion(self, x, y):
+        event = MagicMock()
+        event.x, event.y = x, y
+        self.chart.on_motion(event)
+        return self.canvas.itemcget(self.chart.tooltip_ids[1], "text")
+
+    def test_resize_and_update_reuse_items(self):
+        """크기/데이터가 바뀌어도 캔버스 아이템을 새로 만들지 않고 재사용하는지 검증"""
+        self.chart.show_bars([str(i) for i in range(30)], list(range(30)), 29, [f"t{i}" for i in range(30)])
+        items = self.canvas.find_all()
+        rect_id = self.chart.bar_items[0][0]
+        before = self.canvas.coords(rect_id)
+
+        self.canvas.winfo_width.return_value = 600
+        self.canvas.winfo_height.return_value = 400
+        self.chart.layout()
+        self.chart.show_bars([str(i) for i in range(24)], [1] * 24, 5, ["x"] * 24)
+
+        self.assertEqual(self.canvas.find_all(), items)
+        self.assertNotEqual(self.canvas.coords(rect_id), before)
+        self.assertEqual(self.canvas.itemcget(self.chart.bar_items[29][0], "state"), "hidden")
+
+    def test_single_tooltip_follows_pointer(self):
+        """파이 조각 위에서 움직이면 하나의 툴팁이 내용/위치만 바뀌는지 검증"""
+        self.chart.show_pie([("A", 75, 75.0), ("B", 25, 25.0)])
+        items = self.canvas.find_all()
+        g = self.chart.geometry
+        self.assertEqual(self.motion(g["cx"] + 10, g["cy"] - 30), "A: 75m (75.0%)")
+        first = self.canvas.coords(self.chart.tooltip_ids[0])
+        self.motion(g["cx"] + 20, g["cy"] - 30)
+        self.assertNotEqual(self.canvas.coords(self.chart.tooltip_ids[0]), first)
+        self.assertEqual(self.motion(g["cx"] - 10, g["cy"] - 30), "B: 25m (25.0%)")
+        self.assertEqual(self.canvas.find_all(), items)
+
+        self.motion(0, 0) # 원 밖
+        self.assertEqual(self.canvas.itemcget(self.chart.tooltip_ids[0], "state"), "hidden")
+
+    def test_heatmap_hit(self):
+        matrix = [[0] * 24 for _ in range(7)]
+        matrix[0][9] = 3
+        self.chart.show_heatmap(matrix, ["월", "화", "수", "목", "금", "토", "일"])
+        g = self.chart.geometry
+        self.assertEqual(self.motion(g["label_w"] + 9.5 * g["cell_w"], g["top"] + 0.5 * g["cell_h"]), "월 9:00 - 3")
+        self.assertEqual(self.app.loc.get.call_args.args, ("stats_heatmap_tooltip_fmt",))
+
+if __name__ == '__main__':
+    unittest.main()
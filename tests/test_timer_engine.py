@@ -8,9 +8,21 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from timer_engine import TimerEngine
 
+class FakeClock:
+    """테스트용 가상 시계 (TimerEngine에 주입)"""
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
 class TestTimerEngine(unittest.TestCase):
     def setUp(self):
-        self.engine = TimerEngine()
+        self.clock = FakeClock()
+        self.engine = TimerEngine(clock=self.clock)
 
     def test_initial_state(self):
         """초기 상태 검증"""
@@ -53,48 +65,87 @@ class TestTimerEngine(unittest.TestCase):
         self.engine.stop()
         self.assertFalse(self.engine.is_running)
 
-    @patch('time.time')
-    def test_tick(self, mock_time):
+    def test_tick(self):
         """시간 흐름(Tick) 로직 검증"""
-        # 시작 시간 설정
-        start_time = 1000.0
-        mock_time.return_value = start_time
-        
         self.engine.start()
-        self.assertEqual(self.engine.last_tick_time, start_time)
+        self.assertEqual(self.engine.deadline, 1000.0 + 25 * 60)
         
         # 1초 경과 시뮬레이션
-        mock_time.return_value = start_time + 1.0
+        self.clock.advance(1.0)
         finished = self.engine.tick()
         
         self.assertFalse(finished)
         self.assertAlmostEqual(self.engine.current_time, 25 * 60 - 1.0)
         
         # 타이머 종료 시뮬레이션 (목표 시간 초과)
-        mock_time.return_value = start_time + 25 * 60 + 1.0 
+        self.clock.advance(25 * 60)
         finished = self.engine.tick()
         
         self.assertTrue(finished)
         self.assertEqual(self.engine.current_time, 0)
         self.assertFalse(self.engine.is_running)
 
-    @patch('time.time')
-    def test_tick_overshoot(self, mock_time):
+    def test_tick_overshoot(self):
         """시간 경과가 남은 시간보다 클 때(Overshoot) 처리 검증"""
-        start_time = 1000.0
-        mock_time.return_value = start_time
         self.engine.start()
         
         # 10초 남았는데 15초가 경과한 상황 시뮬레이션
         self.engine.current_time = 10 
-        mock_time.return_value = start_time + 15.0 
+        self.clock.advance(15.0)
+        self.assertEqual(self.engine.current_time, 0) # 음수가 되지 않고 0이어야 함
         
         finished = self.engine.tick()
         
         self.assertTrue(finished)
-        self.assertEqual(self.engine.current_time, 0) # 음수가 되지 않고 0이어야 함
+        self.assertEqual(self.engine.current_time, 0)
         self.assertFalse(self.engine.is_running)
 
+    def test_remaining_query_does_not_mutate(self):
+        """남은 시간 조회는 상태를 바꾸지 않고 몇 번이든 호출할 수 있는지 검증"""
+        self.engine.start()
+        self.clock.advance(30.0)
+        
+        for _ in range(100):
+            self.assertAlmostEqual(self.engine.remaining(), 25 * 60 - 30.0)
+        self.assertEqual(self.engine.deadline, 1000.0 + 25 * 60)
+        
+        # 임의 시점 조회
+        self.assertAlmostEqual(self.engine.remaining(now=1000.0 + 60), 25 * 60 - 60)
+
+    def test_no_drift_over_many_ticks(self):
+        """잦은 tick 호출에도 오차가 누적되지 않는지 검증"""
+        self.engine.start()
+        for _ in range(20000):
+            self.clock.advance(0.05)
+            self.engine.tick()
+        
+        self.assertAlmostEqual(self.engine.current_time, 25 * 60 - (self.clock.now - 1000.0), places=6)
+
+    @patch('time.time')
+    def test_wall_clock_step_ignored(self, mock_time):
+        """벽시계(time.time)가 바뀌어도 남은 시간에 영향이 없는지 검증"""
+        mock_time.return_value = 1000.0
+        self.engine.start()
+        
+        mock_time.return_value = 1000.0 - 3600 # NTP 보정 등으로 시계가 뒤로 감
+        self.clock.advance(5.0)
+        self.assertFalse(self.engine.tick())
+        self.assertAlmostEqual(self.engine.current_time, 25 * 60 - 5.0)
+
+    def test_pause_resume(self):
+        """정지 후 재시작 시 남은 시간이 보존되는지 검증"""
+        self.engine.start()
+        self.clock.advance(100.0)
+        self.engine.stop()
+        
+        # 정지 중에는 시간이 흐르지 않음
+        self.clock.advance(500.0)
+        self.assertAlmostEqual(self.engine.current_time, 25 * 60 - 100.0)
+        
+        self.engine.start()
+        self.clock.advance(50.0)
+        self.assertAlmostEqual(self.engine.current_time, 25 * 60 - 150.0)
+
     def test_switch_to_break(self):
         """휴식 모드 전환 및 긴 휴식/짧은 휴식 판별 검증"""
         # 짧은 휴식 (interval=4, count=1)
@@ -0,0 +1,86 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+# src 폴더를 모듈 검색 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from PIL import ImageFont
+from timer_renderer import TimerRenderer
+
+COLORS = {
+    "bg": "#FFFFFF",
+    "fg": "#555555",
+    "timer_bg": "#FFFFFF",
+    "timer_center": "#F5F5F5",
+    "timer_outline": "#000000",
+}
+
+class TestTimerRenderer(unittest.TestCase):
+    def setUp(self):
+        self.renderer = TimerRenderer(lambda size, bold=False: ImageFont.load_default())
+
+    def render(self, **kwargs):
+        params = dict(w=200, h=200, colors=COLORS, ui_scale=1.0, is_mini_mode=False,
+                      current_time=1500, mode="work", cycle_len=4, today_count=1, level=2, streak=3)
+        params.update(kwargs)
+        return self.renderer.render(**params)
+
+    def test_render_size(self):
+        """요청한 캔버스 크기의 이미지를 반환하는지 검증"""
+        image = self.render(w=180, h=240)
+        self.assertEqual(image.size, (180, 240))
+
+    def test_static_layers_reused_between_ticks(self):
+        """시간만 바뀌는 경우 정적 레이어를 다시 그리지 않는지 검증"""
+        with patch.object(self.renderer, '_build_static_layers', wraps=self.renderer._build_static_layers) as build:
+            self.render(current_time=1500)
+            self.render(current_time=1499)
+            self.render(current_time=1498.5)
+            self.assertEqual(build.call_count, 1)
+
+    def test_static_layers_rebuilt_on_key_change(self):
+        """크기/테마/미니 모드/사이클 상태가 바뀌면 정적 레이어를 다시 그리는지 검증"""
+        with patch.object(self.renderer, '_build_static_layers', wraps=self.renderer._build_static_layers) as build:
+            self.render()
+            self.render(w=220)
+            self.render(w=220, colors=dict(COLORS, bg="#212121"))
+            self.render(w=220, colors=dict(COLORS, bg="#212121"), is_mini_mode=True)
+            self.render(w=220, colors=dict(COLORS, bg="#212121"), is_mini_mode=True, today_count=2)
+            self.render(w=220, colors=dict(COLORS, bg="#212121"), is_mini_mode=True, today_count=2, level_progress=0.5)
+            self.render(w=220, colors=dict(COLORS, bg="#212121"), is_mini_mode=True, today_count=2, level_progress=0.501)
+            self.assertEqual(build.call_count, 6) # 1% 미만의 진행률 변화는 재사용
+
+    def test_time_change_updates_pixels(self):
+        """남은 시간이 바뀌면 결과 이미지가 달라지는지 검증 (캐시된 레이어가 오염되지 않음)"""
+        first = self.render(current_time=1500)
+        second = self.render(current_time=600)
+        again = self.render(current_time=1500)
+        self.assertNotEqual(first.tobytes(), second.tobytes())
+        self.assertEqual(first.tobytes(), again.tobytes())
+
+    def test_patch_matches_full_frame(self):
+        """동적 영역만 축소해 붙인 결과가 전체 프레임을 축소한 결과와 픽셀 단위로 같은지 검증"""
+        from PIL import Image, ImageDraw
+        for w, h, current_time in ((200, 200, 1500), (180, 240, 3600), (101, 77, 59)):
+            image = self.render(w=w, h=h, current_time=current_time)
+
+            img_w, img_h, cx, cy, radius = self.renderer.get_geometry(w, h)
+            base, overlay = self.renderer._build_static_layers(img_w, img_h, cx, cy, radius, COLORS, 1.0,
+                                                               False, 4, 1, 2, 3)
+            arc_radius = radius * 0.65
+            draw = ImageDraw.Draw(base)
+            if current_time >= 3600:
+                draw.ellipse((cx-arc_radius, cy-arc_radius, cx+arc_radius, cy+arc_radius), fill="#FF5252", outline="#FF5252")
+            else:
+                draw.pieslice((cx-arc_radius, cy-arc_radius, cx+arc_radius, cy+arc_radius),
+                              start=270, end=270 + current_time / 10, fill="#FF5252", outline="#FF5252")
+            base.alpha_composite(overlay)
+            mins, secs = divmod(int(current_time), 60)
+            draw.text((cx, cy), "{:02d}:{:02d}".format(mins, secs), font=ImageFont.load_default(), fill=COLORS["fg"], anchor="mm")
+            expected = base.resize((w, h), resample=Image.BILINEAR)
+            self.assertEqual(image.tobytes(), expected.tobytes())
+
+if __name__ == '__main__':
+    unittest.main()
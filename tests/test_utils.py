@@ -6,6 +6,10 @@ import os
 # src 폴더를 모듈 검색 경로에 추가
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
+import tempfile
+import shutil
+
+import utils
 from utils import load_remote_image
 
 class TestUtils(unittest.TestCase):
@@ -87,5 +91,447 @@ class TestUtils(unittest.TestCase):
         result = load_remote_image('image.png', 'http://example.com/image.png', (100, 100))
         self.assertIsNone(result)
 
+class TestLogDatabase(unittest.TestCase):
+    """공유 SQLite 연결(WAL) 기반 로그 함수 테스트"""
+
+    def setUp(self):
+        utils.close_db()
+        self.temp_dir = tempfile.mkdtemp()
+        self.patcher = patch('utils.get_user_data_path', side_effect=lambda name: os.path.join(self.temp_dir, name))
+        self.patcher.start()
+
+    def tearDown(self):
+        utils.close_db()
+        self.patcher.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_connection_is_reused(self):
+        """여러 번 호출해도 같은 연결을 재사용하는지 테스트"""
+        conn1 = utils.get_db_connection()
+        conn2 = utils.get_db_connection()
+        self.assertIs(conn1, conn2)
+
+    def test_wal_mode_enabled(self):
+        """WAL 저널 모드와 PRAGMA 설정이 적용되는지 테스트"""
+        conn = utils.get_db_connection()
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0].lower(), "wal")
+        self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 1) # NORMAL
+
+    def test_log_and_query(self):
+        """기록 저장 후 조회/수정/삭제가 공유 연결로 동작하는지 테스트"""
+        utils.log_godmode("Study", 25, "success")
+        logs, has_more = utils.get_recent_logs(days=1)
+        self.assertEqual(len(logs), 1)
+        self.assertFalse(has_more)
+        ts = logs[0]["timestamp_str"]
+
+        self.assertTrue(utils.update_log(ts, "Reading"))
+        self.assertEqual(utils.get_task_stats(days=1)[0][0], "Reading")
+
+        self.assertTrue(utils.delete_log(ts))
+        self.assertEqual(utils.get_recent_logs(days=1)[0], [])
+
+    def test_session_rollback_on_error(self):
+        """세션 블록에서 예외 발생 시 변경 사항이 롤백되는지 테스트"""
+        with self.assertRaises(RuntimeError):
+            with utils.db_session() as conn:
+                conn.execute("INSERT INTO logs (timestamp, event, duration, task, status) VALUES ('2024-01-01 10:00:00', 'godmode_complete', 25, 'A', 'success')")
+                raise RuntimeError("fail")
+        with utils.db_session() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM logs").fetchone()[0], 0)
+
+    def test_close_db_reopens(self):
+        """연결을 닫은 뒤에도 다시 열어서 데이터가 유지되는지 테스트"""
+        utils.log_godmode("Study", 25, "success")
+        utils.close_db()
+        self.assertEqual(len(utils.get_recent_logs(days=1)[0]), 1)
+
+    def test_failed_migration_not_cached(self):
+        """마이그레이션 도중 실패한 연결은 공유하지 않고 다음 호출에서 다시 시도하는지 테스트"""
+        import sqlite3
+        from database import Database
+        calls = []
+        def migrate(conn):
+            calls.append(conn)
+            conn.execute("CREATE TABLE IF NOT EXISTS t (x)")
+            conn.execute("INSERT INTO t VALUES (?)", (len(calls),))
+            if len(calls) == 1:
+                raise sqlite3.OperationalError("database is locked")
+        db = Database(os.path.join(self.temp_dir, "retry.db"), on_first_connect=migrate)
+        with self.assertRaises(sqlite3.OperationalError):
+            db.get_connection()
+        self.assertIsNone(db.conn)
+
+        conn = db.get_connection() # 실패한 단계는 롤백되었으므로 다시 마이그레이션
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(conn.execute("SELECT x FROM t").fetchall()[0][0], 2)
+        self.assertIs(db.get_connection(), conn)
+        db.close()
+
+    def _insert(self, conn, ts, duration=25, status="success", task="A"):
+        conn.execute("INSERT INTO logs (timestamp, event, duration, task, status) VALUES (?, 'godmode_complete', ?, ?, ?)",
+                     (ts, duration, task, status))
+
+    def _rollup(self):
+        with utils.db_session() as conn:
+            return {row['day']: (row['count'], row['duration']) for row in conn.execute("SELECT * FROM daily_stats")}
+
+    def test_daily_stats_incremental(self):
+        """로그 삽입/수정/삭제 시 날짜별 집계가 증분 갱신되는지 테스트"""
+        with utils.db_session() as conn:
+            self._insert(conn, "2024-01-01 10:00:00", 25)
+            self._insert(conn, "2024-01-01 11:00:00", 50)
+            self._insert(conn, "2024-01-01 12:00:00", 25, status="fail") # 실패 기록은 집계 제외
+            self._insert(conn, "2024-01-02 09:00:00", 30)
+        self.assertEqual(self._rollup(), {"2024-01-01": (2, 75), "2024-01-02": (1, 30)})
+
+        # 작업명 변경은 집계에 영향 없음
+        self.assertTrue(utils.update_log("2024-01-01 10:00:00", "B"))
+        self.assertEqual(self._rollup()["2024-01-01"], (2, 75))
+
+        # 상태/시간 변경은 반영
+        with utils.db_session() as conn:
+            conn.execute("UPDATE logs SET status = 'success' WHERE timestamp = '2024-01-01 12:00:00'")
+            conn.execute("UPDATE logs SET timestamp = '2024-01-03 09:00:00' WHERE timestamp = '2024-01-02 09:00:00'")
+        self.assertEqual(self._rollup(), {"2024-01-01": (3, 100), "2024-01-03": (1, 30)})
+
+        # 마지막 기록이 지워지면 해당 날짜 행도 제거
+        self.assertTrue(utils.delete_log("2024-01-03 09:00:00"))
+        self.assertNotIn("2024-01-03", self._rollup())
+
+    def test_rebuild_daily_stats(self):
+        """집계 테이블이 어긋나도 재생성 시 로그와 일치하는지 테스트"""
+        with utils.db_session() as conn:
+            self._insert(conn, "2024-01-01 10:00:00", 25)
+            self._insert(conn, "2024-01-02 10:00:00", 25)
+            conn.execute("DELETE FROM daily_stats")
+        self.assertEqual(utils.rebuild_daily_stats(), 2)
+        self.assertEqual(self._rollup(), {"2024-01-01": (1, 25), "2024-01-02": (1, 25)})
+
+    def test_rollup_backfilled_for_existing_db(self):
+        """집계 테이블이 없던 기존 DB를 열면 로그로부터 채워지는지 테스트"""
+        import sqlite3
+        conn = sqlite3.connect(os.path.join(self.temp_dir, "godmode_log.db"))
+        conn.execute("CREATE TABLE logs (timestamp TEXT PRIMARY KEY, event TEXT, duration INTEGER, task TEXT, status TEXT)")
+        self._insert(conn, "2024-01-01 10:00:00", 40)
+        conn.commit()
+        conn.close()
+        self.assertEqual(self._rollup(), {"2024-01-01": (1, 40)})
+
+    def test_readers_use_rollup(self):
+        """parse_logs와 게이미피케이션 통계가 집계 테이블 기준으로 계산되는지 테스트"""
+        from datetime import datetime, timedelta
+        today = datetime.now()
+        yesterday = today - timedelta(days=1)
+        with utils.db_session() as conn:
+            self._insert(conn, today.strftime("%Y-%m-%d 08:00:00"), 25)
+            self._insert(conn, today.strftime("%Y-%m-%d 09:00:00"), 50)
+            self._insert(conn, yesterday.strftime("%Y-%m-%d 09:00:00"), 25)
+
+        stats = utils.parse_logs()
+        self.assertEqual(stats[today.strftime("%Y-%m-%d")]['count'], 2)
+        self.assertEqual(stats[today.strftime("%Y-%m-%d")]['duration'], 75)
+
+        game = utils.get_gamification_stats()
+        self.assertEqual(game['total_duration'], 100)
+        self.assertEqual(game['streak'], 2)
+        self.assertEqual(game['level'], 3)
+
+    def test_logs_page_keyset(self):
+        """키셋 페이지네이션이 중복/누락 없이 오래된 순으로 이어지는지 테스트"""
+        from datetime import datetime, timedelta
+        base = datetime(2024, 1, 1, 9, 0, 0)
+        with utils.db_session() as conn:
+            for i in range(25):
+                self._insert(conn, (base + timedelta(hours=i)).strftime("%Y-%m-%d %H:%M:%S"), 25)
+
+        seen = []
+        cursor = "9999-12-31 23:59:59"
+        pages = 0
+        while True:
+            page, has_more = utils.get_logs_page(cursor, limit=10)
+            pages += 1
+            seen.extend(log['timestamp_str'] for log in page)
+            if not has_more:
+                break
+            cursor = page[-1]['timestamp_str']
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(len(seen), 25)
+        self.assertEqual(seen, sorted(seen, reverse=True))
+        self.assertEqual(len(set(seen)), 25)
+
+        # 페이지 항목 형식 (시작 시간 = 종료 시간 - duration)
+        page, _ = utils.get_logs_page("2024-01-01 10:00:01", limit=1)
+        self.assertEqual(page[0]['end'], datetime(2024, 1, 1, 10, 0, 0))
+        self.assertEqual(page[0]['start'], datetime(2024, 1, 1, 9, 35, 0))
+        self.assertEqual(page[0]['task'], "A")
+
+    def test_daily_stats_range_and_task_filter(self):
+        """날짜 범위 집계 조회와 특정 날짜 작업 통계(기간 제한 없음) 테스트"""
+        with utils.db_session() as conn:
+            self._insert(conn, "2020-05-01 10:00:00", 25, task="A")
+            self._insert(conn, "2020-05-01 11:00:00", 50, task="B")
+            self._insert(conn, "2020-05-02 10:00:00", 25, task="A")
+            self._insert(conn, "2020-05-03 10:00:00", 25, task="A")
+
+        stats = utils.get_daily_stats("2020-05-01", "2020-05-02")
+        self.assertEqual(sorted(stats), ["2020-05-01", "2020-05-02"])
+        self.assertEqual(stats["2020-05-01"]['duration'], 75)
+
+        task_stats = utils.get_task_stats(days=30, date_filter="2020-05-01")
+        self.assertEqual([t for t, _, _ in task_stats], ["B", "A"])
+
+    def test_schema_version_and_indexes(self):
+        """새 DB가 최신 스키마 버전과 커버링 인덱스로 생성되는지 테스트"""
+        import schema
+        with utils.db_session() as conn:
+            self.assertEqual(schema.get_schema_version(conn), schema.SCHEMA_VERSION)
+            indexes = {row['name'] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+            # 다시 실행해도 변경 없음
+            self.assertEqual(schema.migrate(conn), (schema.SCHEMA_VERSION, schema.SCHEMA_VERSION))
+        self.assertIn("idx_logs_status_start_day", indexes)
+        self.assertIn("idx_logs_task_id_day", indexes)
+
+    def test_legacy_db_time_columns_backfilled(self):
+        """버전 정보가 없는 기존 DB를 열면 ts/day/hour 컬럼이 추가되고 채워지는지 테스트"""
+        import sqlite3
+        from datetime import datetime
+        conn = sqlite3.connect(os.path.join(self.temp_dir, "godmode_log.db"))
+        conn.execute("CREATE TABLE logs (timestamp TEXT PRIMARY KEY, event TEXT, duration INTEGER, task TEXT, status TEXT)")
+        self._insert(conn, "2024-01-01 10:10:00", 25)
+        conn.commit()
+        conn.close()
+
+        with utils.db_session() as conn:
+            row = conn.execute("SELECT ts, day, hour, start_day FROM logs").fetchone()
+        self.assertEqual(row['ts'], int(datetime(2024, 1, 1, 10, 10).timestamp()))
+        self.assertEqual(row['day'], "2024-01-01")
+        self.assertEqual(row['hour'], 9) # 시작 시각(09:45) 기준
+        self.assertEqual(row['start_day'], "2024-01-01")
+
+    def test_time_columns_filled_by_trigger(self):
+        """ts 없이 삽입/수정해도 트리거가 파생 컬럼을 채우는지 테스트"""
+        from datetime import datetime
+        with utils.db_session() as conn:
+            self._insert(conn, "2024-03-05 23:50:00", 25)
+            conn.execute("UPDATE logs SET timestamp = '2024-03-06 00:20:00' WHERE timestamp = '2024-03-05 23:50:00'")
+            row = conn.execute("SELECT ts, day, hour, start_day FROM logs").fetchone()
+        self.assertEqual(row['ts'], int(datetime(2024, 3, 6, 0, 20).timestamp()))
+        self.assertEqual(row['day'], "2024-03-06")
+        self.assertEqual(row['hour'], 23)
+        self.assertEqual(row['start_day'], "2024-03-05") # 시작 시각(23:55)의 날짜
+
+        utils.log_godmode(25, "B")
+        with utils.db_session() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM logs WHERE ts IS NULL OR day IS NULL OR start_day IS NULL")
+                             .fetchone()[0], 0)
+
+    def _task_rollup(self):
+        with utils.db_session() as conn:
+            totals = {row['name']: (row['count'], row['duration']) for row in conn.execute("SELECT * FROM tasks WHERE count > 0")}
+            daily = {(row['day'], row['name']): (row['count'], row['duration']) for row in conn.execute(
+                "SELECT s.day, t.name, s.count, s.duration FROM task_daily_stats s JOIN tasks t ON t.id = s.task_id")}
+        return totals, daily
+
+    def test_task_names_interned(self):
+        """작업명이 tasks 테이블로 정규화되고 읽을 때 같은 문자열 객체를 공유하는지 테스트"""
+        with utils.db_session() as conn:
+            self._insert(conn, "2024-01-01 10:00:00", task="Study")
+            self._insert(conn, "2024-01-01 11:00:00", task="Study")
+            self._insert(conn, "2024-01-01 12:00:00", task=None)
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM logs WHERE task IS NOT NULL").fetchone()[0], 0)
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0], 2)
+
+        logs, _ = utils.get_logs_page("9999")
+        self.assertEqual([log['task'] for log in logs], ["-", "Study", "Study"])
+        self.assertIs(logs[1]['task'], logs[2]['task'])
+
+    def test_task_counters_incremental(self):
+        """로그 삽입/수정/삭제 시 작업별 누적값과 날짜별 작업 집계가 갱신되는지 테스트"""
+        with utils.db_session() as conn:
+            self._insert(conn, "2024-01-01 10:00:00", 25, task="A")
+            self._insert(conn, "2024-01-01 11:00:00", 50, task="B")
+            self._insert(conn, "2024-01-02 10:00:00", 25, task="A")
+            self._insert(conn, "2024-01-02 11:00:00", 25, task="A", status="fail")
+        totals, daily = self._task_rollup()
+        self.assertEqual(totals, {"A": (2, 50), "B": (1, 50)})
+        self.assertEqual(daily[("2024-01-02", "A")], (1, 25))
+
+        self.assertTrue(utils.update_log("2024-01-01 10:00:00", "B")) # 개별 기록의 작업 변경
+        self.assertTrue(utils.delete_log("2024-01-02 10:00:00"))
+        totals, daily = self._task_rollup()
+        self.assertEqual(totals, {"B": (2, 75)})
+        self.assertEqual(daily, {("2024-01-01", "B"): (2, 75)})
+
+        # 재생성 결과와 증분 결과가 같아야 함
+        utils.rebuild_daily_stats()
+        self.assertEqual(self._task_rollup(), (totals, daily))
+
+    def test_rename_task(self):
+        """작업명 일괄 변경(tasks 한 행 수정)과 기존 작업으로의 병합 테스트"""
+        with utils.db_session() as conn:
+            self._insert(conn, "2024-01-01 10:00:00", 25, task="A")
+            self._insert(conn, "2024-01-02 10:00:00", 25, task="A")
+            self._insert(conn, "2024-01-02 11:00:00", 50, task="B")
+        utils.get_logs_page("9999") # 이름 캐시 채우기
+
+        self.assertTrue(utils.rename_task("A", "C"))
+        logs, _ = utils.get_logs_page("9999")
+        self.assertEqual([log['task'] for log in logs], ["B", "C", "C"])
+
+        self.assertTrue(utils.rename_task("C", "B"))
+        self.assertEqual(self._task_rollup()[0], {"B": (3, 100)})
+        self.assertFalse(utils.rename_task("missing", "X"))
+
+    def test_task_stats_from_rollup(self):
+        """작업 통계가 기간/날짜/전체 기준으로 작업별 집계에서 계산되는지 테스트"""
+        from datetime import datetime
+        today = datetime.now().strftime("%Y-%m-%d")
+        with utils.db_session() as conn:
+            self._insert(conn, f"{today} 00:30:00", 30, task="A")
+            self._insert(conn, "2000-01-01 10:00:00", 90, task="B")
+        self.assertEqual(utils.get_task_stats(days=7), [("A", 30, 100.0)])
+        self.assertEqual(utils.get_task_stats(days=None), [("B", 90, 75.0), ("A", 30, 25.0)])
+        self.assertEqual(utils.get_task_stats(date_filter="2000-01-01"), [("B", 90, 100.0)])
+
+    def test_hour_analytics(self):
+        """시간대/요일x시간대/작업x시간대 분포가 날짜 범위와 성공 기록 기준으로 집계되는지 테스트"""
+        with utils.db_session() as conn:
+            self._insert(conn, "2024-01-01 10:10:00", 25, task="A") # 월요일, 9시 시작
+            self._insert(conn, "2024-01-01 10:40:00", 25, task="B") # 월요일, 10시 시작
+            self._insert(conn, "2024-01-07 09:30:00", 50, task="A") # 일요일, 8시 시작
+            self._insert(conn, "2024-01-07 09:59:00", 25, status="fail") # 실패 기록 제외
+            self._insert(conn, "2023-12-31 21:00:00", 25, task="A") # 범위 밖
+
+        hourly = utils.get_hourly_stats("2024-01-01", "2024-01-07")
+        self.assertEqual(sum(hourly['count']), 3)
+        self.assertEqual((hourly['count'][8], hourly['duration'][8]), (1, 50))
+        self.assertEqual(utils.get_hourly_stats()['count'][20], 1) # 전체 범위
+
+        matrix = utils.get_weekday_hour_stats("2024-01-01", "2024-01-07")
+        self.assertEqual((matrix[0][9], matrix[0][10], matrix[6][8]), (1, 1, 1))
+        self.assertEqual(sum(map(sum, matrix)), 3)
+
+        task_hours = utils.get_task_hour_stats("2024-01-01")
+        self.assertEqual([name for name, _ in task_hours], ["A", "B"])
+        self.assertEqual((task_hours[0][1][9], task_hours[0][1][8]), (1, 1))
+        self.assertEqual(len(utils.get_task_hour_stats("2024-01-01", limit=1)), 1)
+
+    def test_hour_analytics_across_midnight(self):
+        """자정을 넘긴 기록(23:40~00:05)은 시작 시각의 요일/날짜 칸에 집계되는지 테스트"""
+        with utils.db_session() as conn:
+            self._insert(conn, "2024-01-02 00:05:00", 25) # 월요일 23:40 시작, 화요일 종료
+            self._insert(conn, "2024-01-01 00:10:00", 25) # 일요일(12/31) 23:45 시작
+
+        matrix = utils.get_weekday_hour_stats("2024-01-01", "2024-01-01")
+        self.assertEqual(matrix[0][23], 1)
+        self.assertEqual(sum(map(sum, matrix)), 1)
+        self.assertEqual(utils.get_weekday_hour_stats("2024-01-02", "2024-01-07"), [[0] * 24 for _ in range(7)])
+        self.assertEqual(utils.get_weekday_hour_stats("2023-12-31", "2023-12-31")[6][23], 1)
+        self.assertEqual(utils.get_hourly_stats("2024-01-01", "2024-01-01")['count'][23], 1)
+        # 날짜별 집계는 기존대로 종료 날짜 기준
+        self.assertIn("2024-01-02", utils.get_daily_stats("2024-01-01"))
+
+    def test_data_version(self):
+        """앱 자신의 쓰기와 다른 연결의 커밋 모두 데이터 버전을 바꾸는지 테스트"""
+        import sqlite3
+        version = utils.get_data_version()
+        self.assertEqual(utils.get_data_version(), version) # 읽기만 하면 그대로
+
+        utils.log_godmode("Study", 25, "success")
+        after_write = utils.get_data_version()
+        self.assertNotEqual(after_write, version)
+
+        other = sqlite3.connect(os.path.join(self.temp_dir, "godmode_log.db"))
+        self._insert(other, "2024-01-01 10:00:00", 25)
+        other.commit()
+        other.close()
+        self.assertNotEqual(utils.get_data_version(), after_write)
+
+    def test_query_cache_invalidation(self):
+        """반복 조회는 캐시에서 처리하고, 앱/다른 연결의 쓰기 후에는 새로 조회하는지 테스트"""
+        import sqlite3
+        utils.log_godmode("Study", 25, "success")
+        self.assertEqual(utils.get_task_stats(days=1), [("Study", 25, 100.0)])
+        misses = utils._query_cache.misses
+        self.assertEqual(utils.get_task_stats(days=1), [("Study", 25, 100.0)])
+        self.assertEqual(utils._query_cache.misses, misses) # 캐시 적중
+
+        logs, _ = utils.get_recent_logs(days=1)
+        logs.clear() # 반환된 목록을 수정해도 캐시에는 영향 없음
+        self.assertEqual(len(utils.get_recent_logs(days=1)[0]), 1)
+
+        self.assertEqual(utils.get_gamification_stats()['total_duration'], 25)
+        self.assertTrue(utils.rename_task("Study", "Reading"))
+        self.assertEqual(utils.get_task_stats(days=1), [("Reading", 25, 100.0)])
+
+        # 다른 프로세스(연결)의 기록도 PRAGMA data_version으로 감지
+        other = sqlite3.connect(os.path.join(self.temp_dir, "godmode_log.db"))
+        self._insert(other, "2024-01-01 10:00:00", 30)
+        other.commit()
+        other.close()
+        self.assertEqual(utils.get_gamification_stats()['total_duration'], 55)
+        self.assertTrue(utils.get_recent_logs(days=1)[1]) # 더 오래된 기록이 생김
+        self.assertEqual(utils.get_daily_stats("2024-01-01", "2024-01-01")["2024-01-01"]['duration'], 30)
+
+    def test_clear_query_cache_waits_for_session(self):
+        """캐시 비우기가 다른 스레드의 DB 세션(캐시 채우기)이 끝날 때까지 기다리는지 테스트"""
+        import threading
+        entered, release = threading.Event(), threading.Event()
+        def hold_session():
+            with utils.db_session():
+                entered.set()
+                release.wait(5)
+        holder = threading.Thread(target=hold_session)
+        holder.start()
+        entered.wait(5)
+        clearer = threading.Thread(target=utils.clear_query_cache)
+        clearer.start()
+        clearer.join(0.1)
+        self.assertTrue(clearer.is_alive()) # 세션 잠금을 기다리는 중
+        release.set()
+        holder.join(5)
+        clearer.join(5)
+        self.assertFalse(clearer.is_alive())
+
+    def test_logs_since(self):
+        """기준 시각(포함) 이후의 로그와 더 오래된 로그 존재 여부를 반환하는지 테스트"""
+        with utils.write_session() as conn:
+            for ts in ("2024-01-01 10:00:00", "2024-01-02 00:00:00", "2024-01-02 09:00:00"):
+                self._insert(conn, ts)
+        logs, has_more = utils.get_logs_since("2024-01-02 00:00:00")
+        self.assertEqual([log['timestamp_str'] for log in logs], ["2024-01-02 09:00:00", "2024-01-02 00:00:00"])
+        self.assertTrue(has_more)
+        logs.clear() # 반환된 목록을 수정해도 캐시에는 영향 없음
+        self.assertEqual(len(utils.get_logs_since("2024-01-02 00:00:00")[0]), 2)
+        self.assertFalse(utils.get_logs_since("2024-01-01 00:00:00")[1])
+
+    def test_use_database_path(self):
+        """use_database로 전환한 파일이 공유 DB 경로(내보내기 원본)가 되는지 테스트"""
+        other = os.path.join(self.temp_dir, "other.db")
+        utils.use_database(other)
+        try:
+            self.assertEqual(utils.get_db().path, other)
+        finally:
+            utils.use_database(None)
+        self.assertEqual(utils.get_db().path, os.path.join(self.temp_dir, "godmode_log.db"))
+
+    def test_v2_db_tasks_migrated(self):
+        """작업명이 문자열로 저장된 v2 DB를 열면 tasks로 이전되는지 테스트"""
+        import sqlite3
+        import schema
+        conn = sqlite3.connect(os.path.join(self.temp_dir, "godmode_log.db"))
+        for migration in schema.MIGRATIONS[:2]:
+            migration(conn)
+        conn.execute("PRAGMA user_version = 2")
+        self._insert(conn, "2024-01-01 10:00:00", 25, task="Study")
+        self._insert(conn, "2024-01-01 11:00:00", 25, task="Study")
+        conn.commit()
+        conn.close()
+
+        self.assertEqual(self._task_rollup()[0], {"Study": (2, 50)})
+        self.assertEqual(utils.get_task_stats(date_filter="2024-01-01"), [("Study", 50, 100.0)])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,105 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+import tkinter as tk
+from datetime import datetime, timedelta
+
+# src 폴더를 모듈 검색 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from virtual_log_list import VirtualLogList
+
+def make_logs(days, per_day):
+    logs = []
+    base = datetime(2024, 6, 30, 22, 0, 0)
+    for d in range(days):
+        for i in range(per_day):
+            end = base - timedelta(days=d, minutes=30 * i)
+            logs.append({"start": end - timedelta(minutes=25), "end": end, "duration": 25,
+                         "task": f"Task {d}-{i}", "timestamp_str": end.strftime("%Y-%m-%d %H:%M:%S")})
+    return logs
+
+class TestVirtualLogList(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        try:
+            cls.root = tk.Tk()
+        except tk.TclError:
+            raise unittest.SkipTest("디스플레이가 없는 환경")
+        cls.root.withdraw()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.root.destroy()
+
+    def setUp(self):
+        self.app = MagicMock()
+        self.app.scale_factor = 1.0
+        self.app.colors = {"btn_bg": "#EEEEEE", "btn_hover": "#DDDDDD", "fg": "#000000", "fg_sub": "#888888"}
+        self.app.loc.get.side_effect = lambda key, **kw: ["월", "화", "수", "목", "금", "토", "일"] if key == "weekdays" else f"{kw.get('date')} {kw.get('count')}"
+
+        self.canvas = tk.Canvas(self.root, width=400, height=300)
+        self.canvas.pack()
+        self.root.update_idletasks()
+        self.canvas.winfo_width = MagicMock(return_value=400)
+        self.canvas.winfo_height = MagicMock(return_value=300)
+
+        self.on_edit = MagicMock()
+        self.on_delete = MagicMock()
+        self.on_toggle = MagicMock()
+        self.vlist = VirtualLogList(self.canvas, self.app, lambda d: f"{d}m", self.on_toggle, MagicMock(), self.on_edit, self.on_delete)
+
+        self.logs = make_logs(days=100, per_day=20)
+        self.expanded = {log['start'].strftime("%Y-%m-%d") for log in self.logs}
+        self.vlist.set_data(self.logs, {}, self.expanded)
+
+    def tearDown(self):
+        self.canvas.destroy()
+
+    def test_only_visible_rows_are_drawn(self):
+        """수천 개 로그 중 보이는 영역 근처의 행만 캔버스 아이템으로 만드는지 테스트"""
+        self.assertEqual(len(self.vlist.rows), 2100) # 헤더 100 + 항목 2000
+        self.assertLess(len(self.vlist.active), 30)
+        self.assertLess(len(self.canvas.find_all()), 150)
+
+    def test_scroll_recycles_items(self):
+        """스크롤 시 아이템을 새로 만들지 않고 재사용하는지 테스트"""
+        before = len(self.canvas.find_all())
+        self.vlist.yview("moveto", 0.5)
+        self.vlist.yview("moveto", 1.0)
+        # 새 위치에 필요한 만큼만 추가되고 이전 아이템은 풀에서 재사용
+        self.assertLessEqual(len(self.canvas.find_all()), before + 40)
+        self.assertIn(len(self.vlist.rows) - 1, self.vlist.active)
+
+    def test_row_at_prefix_sum_lookup(self):
+        """누적합 배열 기반 y좌표 -> 행 인덱스 조회 테스트"""
+        for index in (0, 1, 57, 2099):
+            y = self.vlist.offsets[index] + 1
+            self.assertEqual(self.vlist.row_at(y), index)
+        # 헤더와 항목 사이 간격은 None
+        gap_y = self.vlist.offsets[0] + self.vlist.heights[0] + 1
+        self.assertIsNone(self.vlist.row_at(gap_y))
+        self.assertIsNone(self.vlist.row_at(-5))
+
+    def test_click_dispatch(self):
+        """클릭 위치에 따라 접기/수정/삭제 콜백이 호출되는지 테스트"""
+        def click(x, index):
+            event = MagicMock(x=x, y=self.vlist.offsets[index] + 5 - self.canvas.canvasy(0))
+            self.vlist.on_click(event)
+
+        click(10, 0)
+        self.on_toggle.assert_called_once_with(self.logs[0]['start'].strftime("%Y-%m-%d"))
+        click(100, 1)
+        self.on_edit.assert_called_once_with(self.logs[0])
+        click(380, 1)
+        self.on_delete.assert_called_once_with(self.logs[0]['timestamp_str'])
+
+    def test_collapsed_dates_hide_items(self):
+        """접힌 날짜는 헤더만 행으로 구성되는지 테스트"""
+        self.vlist.set_data(self.logs, {}, set())
+        self.assertEqual(len(self.vlist.rows), 100)
+        self.assertTrue(all(row[0] == "header" for row in self.vlist.rows))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+import sys
+import os
+
+# src 폴더를 모듈 검색 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from window_manager import WindowManager
+
+class FakeWindow:
+    """withdraw/deiconify 상태만 흉내 내는 가짜 Toplevel"""
+    def __init__(self):
+        self.status = "normal"
+        self.alive = True
+        self.grabbed = True
+        self.reopened = 0
+        self.stale = False
+
+    def winfo_exists(self):
+        return self.alive
+
+    def winfo_viewable(self):
+        return self.status == "normal"
+
+    def state(self):
+        return self.status
+
+    def withdraw(self):
+        self.status = "withdrawn"
+
+    def deiconify(self):
+        self.status = "normal"
+
+    def lift(self):
+        pass
+
+    def focus_set(self):
+        pass
+
+    def grab_release(self):
+        self.grabbed = False
+
+    def destroy(self):
+        self.alive = False
+
+    def on_reopen(self):
+        self.reopened += 1
+
+    def is_stale(self):
+        return self.stale
+
+class TestWindowManager(unittest.TestCase):
+    def setUp(self):
+        self.manager = WindowManager()
+        self.built = []
+
+    def build(self):
+        win = FakeWindow()
+        self.built.append(win)
+        return win
+
+    def test_hide_and_reuse(self):
+        """닫은 창은 숨겨 두었다가 다시 열 때 재사용하고 on_reopen을 호출하는지 테스트"""
+        win = self.manager.show("stats", self.build)
+        self.assertTrue(self.manager.is_visible("stats"))
+
+        self.manager.hide("stats")
+        self.assertEqual(win.state(), "withdrawn")
+        self.assertFalse(win.grabbed)
+        self.assertFalse(self.manager.is_visible("stats"))
+
+        self.assertIs(self.manager.show("stats", self.build), win)
+        self.assertEqual(len(self.built), 1)
+        self.assertEqual(win.reopened, 1)
+        self.assertTrue(self.manager.is_visible("stats"))
+
+        # 이미 보이는 창을 다시 열면 앞으로 가져오기만 함
+        self.manager.show("stats", self.build)
+        self.assertEqual(win.reopened, 1)
+
+    def test_rebuild_when_stale_or_destroyed(self):
+        """오래된(is_stale) 창이나 외부에서 파괴된 창은 새로 만드는지 테스트"""
+        win = self.manager.show("settings", self.build)
+        self.manager.hide("settings")
+        win.stale = True
+        new_win = self.manager.show("settings", self.build)
+        self.assertIsNot(new_win, win)
+        self.assertFalse(win.alive)
+
+        new_win.alive = False
+        self.assertIsNone(self.manager.get("settings"))
+        self.assertIsNot(self.manager.show("settings", self.build), new_win)
+        self.assertEqual(len(self.built), 3)
+
+    def test_destroy_all(self):
+        """앱 종료 시 보관 중인 창을 모두 파괴하는지 테스트"""
+        a = self.manager.show("stats", self.build)
+        b = self.manager.show("settings", self.build)
+        self.manager.hide("settings")
+        self.manager.destroy_all()
+        self.assertFalse(a.alive or b.alive)
+        self.assertIsNone(self.manager.get("stats"))
+
+    def test_build_failure_not_registered(self):
+        """창 생성에 실패(None)하면 보관하지 않는지 테스트"""
+        self.assertIsNone(self.manager.show("stats", lambda: None))
+        self.assertIsNone(self.manager.get("stats"))
+
+if __name__ == '__main__':
+    unittest.main()